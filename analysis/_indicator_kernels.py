@@ -0,0 +1,94 @@
+"""Technical indicator kernels shared by the JIT and AOT builds.
+
+The functions here are plain Python/NumPy so they can be compiled either
+way. ``analysis.technicals`` loads the ahead-of-time compiled extension
+(``analysis.indicator_kernels``) when it has been built, and otherwise
+wraps these functions with ``njit(cache=True)``.
+
+Build the extension once with::
+
+    python -m analysis._indicator_kernels
+
+This avoids paying JIT compilation on the first indicator call of every
+new process. Building requires Numba; all arrays must be C-contiguous
+float64.
+"""
+
+
+def rsi_wilder(closes, period):
+    """Wilder-smoothed RSI of the last bar in ``closes``.
+
+    Seeds the average gain/loss with the simple mean of the first ``period``
+    price changes, then applies Wilder's smoothing
+    ``avg = (avg * (period - 1) + current) / period`` over the rest. Price
+    changes are streamed from the previous close, so no delta, gain or loss
+    arrays are materialized.
+
+    Args:
+        closes: 1-D float64 array of closing prices
+        period: RSI period
+
+    Returns:
+        RSI value (0-100), or 50.0 if there is not enough data
+    """
+    n = closes.shape[0]
+    if n < period + 1:
+        return 50.0
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev = closes[0]
+    for i in range(1, period + 1):
+        price = closes[i]
+        delta = price - prev
+        prev = price
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    weight = period - 1.0
+    for i in range(period + 1, n):
+        price = closes[i]
+        delta = price - prev
+        prev = price
+        if delta > 0:
+            avg_gain = (avg_gain * weight + delta) / period
+            avg_loss = (avg_loss * weight) / period
+        else:
+            avg_gain = (avg_gain * weight) / period
+            avg_loss = (avg_loss * weight - delta) / period
+
+    if avg_loss == 0.0:
+        return 100.0
+
+    rs = avg_gain / avg_loss
+    return 100.0 - (100.0 / (1.0 + rs))
+
+
+# Exported name -> (function, Numba signature) for the AOT build
+AOT_EXPORTS = {
+    'rsi_wilder': (rsi_wilder, 'f8(f8[::1], i8)'),
+}
+
+
+def build(output_dir=None):
+    """Compile the kernels into the ``indicator_kernels`` extension module.
+    
+    Args:
+        output_dir: Directory for the extension (defaults to this package)
+    """
+    from pathlib import Path
+    from numba.pycc import CC
+
+    cc = CC('indicator_kernels')
+    cc.output_dir = str(output_dir or Path(__file__).parent)
+    for name, (func, signature) in AOT_EXPORTS.items():
+        cc.export(name, signature)(func)
+    cc.compile()
+
+
+if __name__ == "__main__":
+    build()
@@ -0,0 +1,20 @@
+"""Optional Numba JIT decorator for indicator kernels.
+
+Numba is an optional dependency. When it is not installed the ``njit``
+decorator below is a no-op, so kernels run as plain Python/NumPy code.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ['njit', 'NUMBA_AVAILABLE']
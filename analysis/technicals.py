@@ -6,31 +6,369 @@ This module provides functionality to:
 3. Calculate custom technical indicators
 """
 
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Any, Sequence, Tuple
 import logging
+import os
+import random
+import re
+
+import numpy as np
 
 try:
     # Try relative imports first (when run as module from parent)
     from ..core.models import StockPosition, OptionPosition, AccountSnapshot
     from ..utils.logging import setup_logging
+    from ..utils.io import safe_write_json, loads_json, response_json
+    from ..utils.assignments import extract_option_details
+    from ..api.sim_client import SimBrokerClient
+    from ._njit import njit
+    from . import _indicator_kernels
 except ImportError:
     # Fall back to direct imports (when run from within directory)
     from core.models import StockPosition, OptionPosition, AccountSnapshot
     from utils.logging import setup_logging
+    from utils.io import safe_write_json, loads_json, response_json
+    from utils.assignments import extract_option_details
+    from api.sim_client import SimBrokerClient
+    from analysis._njit import njit
+    from analysis import _indicator_kernels
+
+
+# Upper bound on concurrent Schwab API requests issued by one analyzer
+# (override with SCHWAB_TECHNICALS_WORKERS)
+MAX_FETCH_WORKERS = max(1, int(os.getenv("SCHWAB_TECHNICALS_WORKERS") or 8))
+
+# Completed daily candles are cached on disk per symbol and calendar day;
+# the last few days are always refetched so the current bar stays live
+PRICE_HISTORY_CACHE_DIR = Path("data/cache/price_history")
+_CANDLE_TAIL_DAYS = 5
+
+
+try:
+    # Ahead-of-time compiled kernels, built with `python -m analysis._indicator_kernels`
+    from analysis.indicator_kernels import rsi_wilder as _rsi_wilder
+except ImportError:
+    # JIT-compile on first use instead; cache=True reuses the compiled code across runs
+    _rsi_wilder = njit(cache=True)(_indicator_kernels.rsi_wilder)
+
+
+@lru_cache(maxsize=256)
+def _ema_weight_matrix(periods: Tuple[int, ...], n: int) -> np.ndarray:
+    """Closed-form weights for SMA-seeded EMAs of several periods over ``n`` prices.
+    
+    Unrolling ``ema = alpha * price + (1 - alpha) * ema`` over the ``m = n - period``
+    prices after the seed window gives ``(1 - alpha)**m * seed + weights @ tail``
+    with ``weights[j] = alpha * (1 - alpha)**(m - 1 - j)``. Folding the SMA seed
+    into the first ``period`` columns makes each EMA a single row of the matrix,
+    so ``matrix @ prices`` evaluates every period in one pass.
+    
+    Args:
+        periods: EMA periods, one row each
+        n: Number of prices
+        
+    Returns:
+        Read-only (len(periods), n) weight matrix
+    """
+    matrix = np.empty((len(periods), n), dtype=np.float64)
+    for row, period in zip(matrix, periods):
+        if n < period:
+            row[:] = 1.0 / n  # Not enough data: mean of all prices
+            continue
+        alpha = 2.0 / (period + 1)
+        decay = 1.0 - alpha
+        m = n - period
+        row[:period] = decay ** m / period
+        row[period:] = alpha * np.power(decay, np.arange(m - 1, -1, -1, dtype=np.float64))
+    matrix.flags.writeable = False
+    return matrix
+
+
+# Shared generators for the demo/mock technicals below
+_mock_rng = random.Random()
+_mock_np_rng = np.random.default_rng()
+
+# (low, high) ranges for the mock stock fields, drawn in one batch:
+# base price, RSI, SMA20/SMA50 multipliers, MACD, MACD signal, MACD histogram,
+# price change %, day high/low multipliers, 52-week high/low multipliers
+_MOCK_STOCK_LOW = np.array([50.0, 20.0, 0.95, 0.90, -2.0, -1.5, -1.0, -5.0, 1.01, 0.95, 1.2, 0.5])
+_MOCK_STOCK_HIGH = np.array([300.0, 80.0, 1.05, 1.10, 2.0, 1.5, 1.0, 5.0, 1.05, 0.99, 2.0, 0.8])
+
+# Shared, immutable results for positions that trigger no signal
+_NEUTRAL_STOCK_SIGNALS = ("NEUTRAL",)
+_NEUTRAL_OPTION_SIGNALS = ("MONITOR",)
+_NEUTRAL_GREEKS_SIGNALS = ("MONITOR - GREEKS NEUTRAL",)
+
+# Stock signal strings, in the order _generate_stock_signals_batch evaluates its rules
+_STOCK_SIGNALS = (
+    "OVERSOLD (RSI < 30)",
+    "OVERBOUGHT (RSI > 70)",
+    "STRONG UPTREND (Price > MA5 > MA10 > MA20)",
+    "STRONG DOWNTREND (Price < MA5 < MA10 < MA20)",
+    "ABOVE 20-DAY MA",
+    "BELOW 20-DAY MA",
+    "EMA BULLISH ALIGNMENT (EMA10 > EMA20 > EMA50)",
+    "EMA BEARISH ALIGNMENT (EMA10 < EMA20 < EMA50)",
+    "ABOVE SHORT-TERM EMAs",
+    "BELOW SHORT-TERM EMAs",
+    "ABOVE LONG-TERM EMA (50)",
+    "BELOW LONG-TERM EMA (50)",
+    "ABOVE UPPER BOLLINGER BAND",
+    "BELOW LOWER BOLLINGER BAND",
+    "NEAR SUPPORT LEVEL",
+    "NEAR RESISTANCE LEVEL",
+    "HIGH VOLUME (2x+ avg)",
+    "ELEVATED VOLUME",
+)
+
+class _GreeksSignalContext(NamedTuple):
+    """Per-position inputs for the Greeks-based option signal rules."""
+    is_call: bool
+    short: bool
+    qty: int
+    delta: float
+    abs_delta: float
+    abs_theta: float
+    iv: float
+    dte: int
+    has_time_value: bool
+    time_value_pct: float
+    pnl_pct: float
+
+
+# Greeks-based option signal rules. Each group is an if/elif chain: the first
+# matching predicate in a group contributes its signal, and groups are
+# evaluated in output order.
+_GREEKS_SIGNAL_RULES = (
+    # Time decay analysis using theta
+    (
+        (lambda c: c.dte <= 7 and c.abs_theta > 0.10, "EXTREME TIME DECAY - EXPIRING SOON (θ > 0.10)"),
+        (lambda c: c.dte <= 7, "EXPIRING SOON (≤7 days)"),
+        (lambda c: c.dte <= 21 and c.abs_theta > 0.05, "HIGH TIME DECAY (θ > 0.05)"),
+        (lambda c: c.dte <= 21, "MODERATE TIME DECAY"),
+        (lambda c: c.dte <= 45, "THETA RISK INCREASING - APPROACHING 45 DTE"),
+    ),
+    # Delta-based moneyness and directional risk
+    (
+        (lambda c: c.is_call and c.delta > 0.8, "DEEP ITM CALL - HIGH DELTA RISK (Δ > 0.8)"),
+        (lambda c: c.is_call and c.delta > 0.6, "ITM CALL - STRONG DIRECTIONAL EXPOSURE (Δ > 0.6)"),
+        (lambda c: c.is_call and c.delta < 0.2, "LOW DELTA CALL - LIMITED UPSIDE SENSITIVITY (Δ < 0.2)"),
+        (lambda c: c.is_call and 0.4 <= c.delta <= 0.6, "ATM CALL - MAXIMUM GAMMA RISK"),
+        (lambda c: not c.is_call and c.delta < -0.8, "DEEP ITM PUT - HIGH DELTA RISK (Δ < -0.8)"),
+        (lambda c: not c.is_call and c.delta < -0.6, "ITM PUT - STRONG DIRECTIONAL EXPOSURE (Δ < -0.6)"),
+        (lambda c: not c.is_call and c.delta > -0.2, "LOW DELTA PUT - LIMITED DOWNSIDE SENSITIVITY (Δ > -0.2)"),
+        (lambda c: not c.is_call and -0.6 <= c.delta <= -0.4, "ATM PUT - MAXIMUM GAMMA RISK"),
+    ),
+    # Implied volatility analysis
+    (
+        (lambda c: c.iv > 0.6, "VERY HIGH IV - VOLATILITY CRUSH RISK (IV > 60%)"),
+        (lambda c: c.iv > 0.4, "HIGH IV - ELEVATED PREMIUM (IV > 40%)"),
+        (lambda c: c.iv < 0.15, "LOW IV - CHEAP PREMIUM (IV < 15%)"),
+        (lambda c: c.iv < 0.25, "MODERATE IV - REASONABLE PREMIUM"),
+    ),
+    # Time value and intrinsic value analysis
+    (
+        (lambda c: c.has_time_value and c.time_value_pct > 50, "HIGH TIME VALUE (>50% of premium)"),
+        (lambda c: c.has_time_value and c.time_value_pct < 10 and c.dte > 30, "LOW TIME VALUE - MOSTLY INTRINSIC"),
+    ),
+    # Short position P&L and Greeks warnings
+    (
+        (lambda c: c.short and c.pnl_pct > 75, "EXCELLENT SHORT PROFIT - CONSIDER CLOSING (>75%)"),
+        (lambda c: c.short and c.pnl_pct > 50, "STRONG SHORT PROFIT - THETA WORKING (>50%)"),
+        (lambda c: c.short and c.pnl_pct > 25, "GOOD SHORT PROFIT - MONITOR DELTA RISK (>25%)"),
+        (lambda c: c.short and c.pnl_pct < -50, "LARGE SHORT LOSS - HIGH DELTA AGAINST US (<-50%)"),
+    ),
+    ((lambda c: c.short and c.abs_delta > 0.6, "HIGH DELTA RISK - SHORT POSITION VULNERABLE"),),
+    ((lambda c: c.short and c.abs_theta < 0.02 and c.dte > 30, "LOW THETA BENEFIT - TIME DECAY SLOW"),),
+    # Long position P&L and Greeks warnings
+    (
+        (lambda c: not c.short and c.pnl_pct > 100, "EXCEPTIONAL LONG PROFIT - SECURE GAINS (>100%)"),
+        (lambda c: not c.short and c.pnl_pct > 50, "STRONG LONG PROFIT - CONSIDER PARTIAL CLOSE (>50%)"),
+        (lambda c: not c.short and c.pnl_pct > 25, "GOOD LONG PROFIT - MONITOR THETA DECAY (>25%)"),
+        (lambda c: not c.short and c.pnl_pct < -75, "SEVERE LONG LOSS - CUT LOSSES? (<-75%)"),
+        (lambda c: not c.short and c.pnl_pct < -50, "LARGE LONG LOSS - THETA & DELTA WORKING AGAINST (<-50%)"),
+    ),
+    ((lambda c: not c.short and c.abs_theta > 0.05 and c.dte < 30, "HIGH THETA DECAY - TIME WORKING AGAINST LONG"),),
+    ((lambda c: not c.short and c.abs_delta < 0.2, "LOW DELTA - NEEDS LARGE UNDERLYING MOVE"),),
+    # Volatility environment signals for both long and short
+    (
+        (lambda c: c.iv > 0.5 and c.qty < 0, "IV CRUSH OPPORTUNITY - SHORT PREMIUM"),
+        (lambda c: c.iv < 0.2 and c.qty > 0, "CHEAP PREMIUM ENTRY - LONG OPPORTUNITY"),
+    ),
+    # Risk management based on time and Greeks
+    ((lambda c: c.dte <= 21 and c.abs_theta > 0.05, "THETA ACCELERATION ZONE - MANAGE ACTIVELY"),),
+    ((lambda c: c.dte <= 7 and c.abs_delta > 0.3, "PIN RISK - NEAR EXPIRY WITH DELTA EXPOSURE"),),
+)
+
+
+_CANDLE_FIELDS = itemgetter('close', 'high', 'low', 'volume')
+
+# Streaming contract symbol: underlying (6, space padded) | YYMMDD | C/P | strike * 1000 (8)
+_CONTRACT_RE = re.compile(r'(.{6})(\d{6})([CP])(\d{8})')
+
+
+def _cache_file_stem(symbol: str) -> str:
+    """Filesystem-safe cache file prefix for a symbol (no separators or underscores)."""
+    return re.sub(r'[^A-Za-z0-9.]', '-', symbol)
+
+
+def _candles_to_arrays(candles: List[Dict]) -> np.ndarray:
+    """Convert price history candles into a (4, n) float64 array.
+    
+    Streams every candle's fields straight into one buffer with
+    ``np.fromiter`` instead of building one Python list per column.
+    
+    Args:
+        candles: Candle dicts from the price history API
+        
+    Returns:
+        C-contiguous array whose rows are closes, highs, lows and volumes
+    """
+    flat = np.fromiter(
+        chain.from_iterable(map(_CANDLE_FIELDS, candles)),
+        dtype=np.float64,
+        count=4 * len(candles)
+    )
+    return np.ascontiguousarray(flat.reshape(-1, 4).T)
+
+
+def _expiry_to_iso(expiry_str: str) -> str:
+    """Convert a YYMMDD contract expiry to a YYYY-MM-DD date string.
+    
+    Slicing the fixed-width digits avoids the format parsing done by strptime.
+    
+    Args:
+        expiry_str: Expiration in YYMMDD format (e.g., '251017')
+        
+    Returns:
+        Expiration as 'YYYY-MM-DD'
+    """
+    return date(2000 + int(expiry_str[:2]), int(expiry_str[2:4]), int(expiry_str[4:6])).isoformat()
+
+
+def _is_call(put_call: str) -> bool:
+    """Return True for 'C', 'c', 'CALL' or 'Call' without allocating an uppercase copy.
+    
+    ORing 0x20 lowercases an ASCII letter, so only the first character is compared.
+    """
+    return (ord(put_call[0]) | 0x20) == 0x63  # 'c'
+
+
+def _options_pnl_pct_batch(avg_costs: np.ndarray, market_prices: np.ndarray, qtys: np.ndarray) -> np.ndarray:
+    """Vectorized P&L percentage for many option positions.
+    
+    Matches ``TechnicalAnalyzer._calculate_options_pnl_pct``: shorts measure
+    against the absolute premium received, longs against the cost basis, and
+    a zero cost basis yields 0.
+    
+    Args:
+        avg_costs: Average cost per position
+        market_prices: Current option price per position
+        qtys: Signed quantities (negative for short)
+        
+    Returns:
+        Unrounded P&L percentages
+    """
+    short = qtys < 0
+    basis = np.where(short, np.abs(avg_costs), avg_costs)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pnl_pct = np.where(short, -100.0, 100.0) * (market_prices - basis) / basis
+    return np.where(basis == 0, 0.0, pnl_pct)
+
+
+@lru_cache(maxsize=4096)
+def _moneyness(underlying_price: float, strike_price: float, is_call: bool) -> str:
+    """Classify an option as in, at or out of the money.
+    
+    Positions on one underlying share its chain's ``underlyingPrice``, so the
+    (price, strike, side) combinations repeat within a pass and are memoized.
+    
+    Args:
+        underlying_price: Current price of underlying
+        strike_price: Strike price of option
+        is_call: True for calls, False for puts
+        
+    Returns:
+        Moneyness description
+    """
+    if underlying_price == strike_price:
+        return "At-The-Money"
+    if underlying_price > strike_price if is_call else underlying_price < strike_price:
+        return "In-The-Money"
+    return "Out-Of-The-Money"
+
+
+@lru_cache(maxsize=1024)
+def _streaming_contract_symbol(symbol: str, expiry: date, option_type: str, strike) -> str:
+    """Build a 21-character Schwab streaming contract symbol.
+    
+    Contract formatting is invariant per position, so results are memoized.
+    
+    Args:
+        symbol: Underlying symbol
+        expiry: Expiration date
+        option_type: 'C' or 'P'
+        strike: Strike price (Decimal, so the scaling below is exact)
+        
+    Returns:
+        Contract symbol such as "AAPL  240517P00190000"
+    """
+    if not isinstance(strike, Decimal):
+        strike = Decimal(str(strike))
+    strike_int = int(strike * 1000)  # 3 implied decimal places, no float rounding
+    return (f"{symbol[:6]:<6}{expiry.year % 100:02d}{expiry.month:02d}{expiry.day:02d}"
+            f"{option_type}{strike_int:08d}")
+
+
+def _find_chain_contract(option_map: Dict, expiry_date: str, strike) -> Optional[Dict]:
+    """Look up a single contract in a call/put expiration map of an option chain.
+    
+    Chain maps are keyed ``{"YYYY-MM-DD:DTE": {"<strike>": [contract, ...]}}``.
+    The expiration key is found by prefix over the (few) expirations, and the
+    strike is then a direct dict lookup instead of a scan over every strike.
+    
+    Args:
+        option_map: ``callExpDateMap`` or ``putExpDateMap`` from the chain JSON
+        expiry_date: Expiration date as ``YYYY-MM-DD``
+        strike: Strike price (float or Decimal)
+        
+    Returns:
+        First contract dict at that strike, or None if not present
+    """
+    exp_key = next((key for key in option_map if key.startswith(expiry_date)), None)
+    if exp_key is None:
+        return None
+    
+    strikes = option_map[exp_key]
+    strike_value = float(strike)
+    option_list = strikes.get(str(strike_value))
+    if option_list is None:
+        # Fall back to a numeric comparison for keys formatted differently (e.g. "95.00")
+        option_list = next(
+            (contracts for key, contracts in strikes.items() if float(key) == strike_value), None
+        )
+    return option_list[0] if option_list else None
 
 
 class TechnicalAnalyzer:
     """Main class for technical analysis of stocks and options."""
     
-    def __init__(self, client):
+    def __init__(self, client, cache_dir: Optional[Path] = None):
         """Initialize the TechnicalAnalyzer with a Schwab client.
         
         Args:
             client: Authenticated Schwab API client
+            cache_dir: Directory for the daily price history cache (disabled if None)
         """
         self.client = client
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self.logger = logging.getLogger(__name__)
     
     def get_stock_technicals(self, snapshot: AccountSnapshot) -> Dict[str, Any]:
@@ -49,15 +387,48 @@ class TechnicalAnalyzer:
         
         self.logger.info(f"Analyzing {len(stock_positions)} stock positions")
         
-        for position in stock_positions:
-            try:
-                self.logger.debug(f"Getting technicals for {position.symbol}")
-                tech_data = self._calculate_stock_technicals(position)
-                technicals[position.symbol] = tech_data
+        if not stock_positions:
+            return technicals
+        
+        # Price history requests are network-bound, so fetch them concurrently.
+        # All positions in the snapshot are analyzed against the same "now".
+        now = datetime.now()
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(stock_positions))) as executor:
+            futures = {}
+            for position in stock_positions:
+                if debug:
+                    self.logger.debug(f"Getting technicals for {position.symbol}")
+                futures[executor.submit(self._fetch_candles, position.symbol, now)] = position
+            
+            # Collect in submission order so output ordering stays stable
+            ready_positions = []
+            ready_candles = []
+            for future, position in futures.items():
+                try:
+                    candles = future.result()
+                except Exception as e:
+                    self.logger.error(f"Error getting technicals for {position.symbol}: {e}")
+                    technicals[position.symbol] = {"error": str(e)}
+                    continue
+                
+                if len(candles) < 20:
+                    technicals[position.symbol] = {"error": "Insufficient price history for technical analysis"}
+                    continue
                 
+                technicals[position.symbol] = None  # Placeholder keeps snapshot order
+                ready_positions.append(position)
+                ready_candles.append(candles)
+        
+        # Compute indicators for every position in one batch
+        if ready_positions:
+            try:
+                results = self._batch_stock_technicals(ready_positions, ready_candles)
             except Exception as e:
-                self.logger.error(f"Error getting technicals for {position.symbol}: {e}")
-                technicals[position.symbol] = {"error": str(e)}
+                self.logger.error(f"Error calculating stock technicals: {e}")
+                results = [{"error": str(e)} for _ in ready_positions]
+            for position, result in zip(ready_positions, results):
+                technicals[position.symbol] = result
         
         return technicals
     
@@ -100,6 +471,16 @@ class TechnicalAnalyzer:
         
         # Get streaming data
         streaming_data = self._get_streaming_options_data(formatted_contracts)
+        now = datetime.now()
+        
+        # P&L percentages for every option position in one vectorized pass
+        count = len(option_positions)
+        pnl_pcts = _options_pnl_pct_batch(
+            np.fromiter((float(p.avg_cost) for p in option_positions), dtype=np.float64, count=count),
+            np.fromiter((float(p.market_price) for p in option_positions), dtype=np.float64, count=count),
+            np.fromiter((p.qty for p in option_positions), dtype=np.int64, count=count),
+        ).tolist()
+        pnl_pct_map = {p.contract_symbol: pnl_pct for p, pnl_pct in zip(option_positions, pnl_pcts)}
         
         # Process streaming data for each position
         technicals = {}
@@ -107,123 +488,212 @@ class TechnicalAnalyzer:
             if contract in position_map:
                 position = position_map[contract]
                 try:
-                    tech_data = self._parse_streaming_options_data(stream_data, position)
+                    tech_data = self._parse_streaming_options_data(stream_data, position, now, pnl_pct_map[contract])
                     technicals[position.contract_symbol] = tech_data
                     
                 except Exception as e:
+                    # Fall back to the options chain below
                     self.logger.error(f"Error processing streaming data for {position.contract_symbol}: {e}")
-                    # Fallback to options chain if streaming fails
-                    fallback_data = self._get_options_chain_fallback(position)
-                    technicals[position.contract_symbol] = fallback_data
         
-        # For positions without streaming data, use fallback
-        for position in option_positions:
-            if position.contract_symbol not in technicals:
-                self.logger.debug(f"Using fallback for {position.contract_symbol}")
-                fallback_data = self._get_options_chain_fallback(position)
-                technicals[position.contract_symbol] = fallback_data
+        # Positions without usable streaming data fall back to the full options chain.
+        # Fetch each underlying's chain once, concurrently, and share it across positions.
+        missing = [position for position in option_positions if position.contract_symbol not in technicals]
+        if missing:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Using fallback for {', '.join(p.contract_symbol for p in missing)}")
+            underlyings = list(dict.fromkeys(position.symbol for position in missing))
+            with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(underlyings))) as executor:
+                chains = dict(zip(underlyings, executor.map(self._fetch_fallback_chain, underlyings)))
+            for position in missing:
+                technicals[position.contract_symbol] = self._get_options_chain_fallback(position, chains[position.symbol], now)
         
         return technicals
     
-    def _calculate_stock_technicals(self, position: StockPosition) -> Dict:
+    def _calculate_stock_technicals(self, position: StockPosition, now: Optional[datetime] = None) -> Dict:
         """Calculate technical indicators for a stock position.
         
         Args:
             position: Stock position to analyze
+            now: Analysis timestamp shared across the snapshot (defaults to the current time)
             
         Returns:
             Dictionary with technical analysis data
         """
         try:
-            # Get historical price data for calculations
-            end_date = datetime.now()
-            start_date = end_date - timedelta(days=60)  # 60 days for good MA calculation
-            
-            price_history = self.client.price_history(
-                symbol=position.symbol,
-                periodType='month',
-                period=2,  # 2 months
-                frequencyType='daily',
-                frequency=1,
-                startDate=start_date,
-                endDate=end_date
-            )
-            
-            if price_history.status_code != 200:
-                return {"error": f"Failed to get price history: {price_history.status_code}"}
-            
-            candles = price_history.json().get('candles', [])
+            candles = self._fetch_candles(position.symbol, now or datetime.now())
             
             if len(candles) < 20:
                 return {"error": "Insufficient price history for technical analysis"}
             
-            # Extract closing prices
-            closes = [candle['close'] for candle in candles]
-            highs = [candle['high'] for candle in candles]
-            lows = [candle['low'] for candle in candles]
-            volumes = [candle['volume'] for candle in candles]
-            
-            # Current price
-            current_price = float(position.market_price)
+            return self._batch_stock_technicals([position], [candles])[0]
             
-            # Calculate technical indicators
-            rsi = self._calculate_rsi(closes)
-            sma_5 = sum(closes[-5:]) / 5
-            sma_10 = sum(closes[-10:]) / 10
-            sma_20 = sum(closes[-20:]) / 20
-            
-            # Calculate EMAs
-            ema_10 = self._calculate_ema(closes, 10)
-            ema_20 = self._calculate_ema(closes, 20)
-            ema_50 = self._calculate_ema(closes, 50)
-            
-            # Bollinger Bands (20-period)
-            bb_upper, bb_lower = self._calculate_bollinger_bands(closes[-20:])
-            
-            # Support and Resistance levels
-            support_level = min(lows[-20:])
-            resistance_level = max(highs[-20:])
+        except Exception as e:
+            self.logger.error(f"Error calculating technicals for {position.symbol}: {e}")
+            return {"error": str(e)}
+    
+    def _fetch_candles(self, symbol: str, end_date: datetime) -> List[Dict]:
+        """Get daily candles for a symbol, reusing cached completed bars.
+        
+        Only completed bars are cached: the newest candle may still be
+        forming during the session, so on a cache hit the last few days are
+        always refetched and spliced onto the cached history.
+        
+        Args:
+            symbol: Stock symbol
+            end_date: Last day of the history window
             
-            # Volume analysis
-            avg_volume = sum(volumes[-20:]) / 20
-            volume_ratio = volumes[-1] / avg_volume if avg_volume > 0 else 1
+        Returns:
+            List of price history candles
             
-            # Generate trading signals
-            signals = self._generate_stock_signals(
-                current_price, rsi, sma_5, sma_10, sma_20, ema_10, ema_20, ema_50,
-                bb_upper, bb_lower, support_level, resistance_level, volume_ratio
-            )
+        Raises:
+            ValueError: If the price history request fails
+        """
+        completed = self._load_cached_candles(symbol, end_date)
+        if completed is None:
+            # 60 days for good MA calculation
+            candles = self._request_candles(symbol, end_date - timedelta(days=60), end_date)
+            self._store_cached_candles(symbol, end_date, candles[:-1])
+            return candles
+        
+        tail = self._request_candles(symbol, end_date - timedelta(days=_CANDLE_TAIL_DAYS), end_date)
+        if not tail:
+            return completed
+        first_tail_bar = tail[0].get('datetime')
+        if first_tail_bar is None:
+            # Cannot tell where the tail starts; use the full window instead
+            return self._request_candles(symbol, end_date - timedelta(days=60), end_date)
+        return [c for c in completed if c['datetime'] < first_tail_bar] + tail
+    
+    def _request_candles(self, symbol: str, start_date: datetime, end_date: datetime) -> List[Dict]:
+        """Request daily candles for a symbol between two dates."""
+        price_history = self.client.price_history(
+            symbol=symbol,
+            periodType='month',
+            period=2,  # 2 months
+            frequencyType='daily',
+            frequency=1,
+            startDate=start_date,
+            endDate=end_date
+        )
+        
+        if price_history.status_code != 200:
+            raise ValueError(f"Failed to get price history: {price_history.status_code}")
+        
+        return response_json(price_history).get('candles', [])
+    
+    def _batch_stock_technicals(self, positions: List[StockPosition], candle_lists: List[List[Dict]]) -> List[Dict]:
+        """Calculate technical indicators for several stock positions at once.
+        
+        The trailing 20-bar windows of every position are stacked into one
+        (positions, 20) matrix per field, so moving averages, bands, levels and
+        volume ratios are computed with a single NumPy reduction each. RSI and
+        EMAs depend on each symbol's full (possibly ragged) history and run
+        through the compiled kernels row by row.
+        
+        Args:
+            positions: Stock positions to analyze
+            candle_lists: Candles for each position (at least 20 each)
             
-            return {
+        Returns:
+            List of technical analysis dicts, in the same order as ``positions``
+        """
+        # Extract OHLCV columns into contiguous float64 arrays in one pass per symbol
+        arrays = [_candles_to_arrays(candles) for candles in candle_lists]
+        
+        # (fields, positions, 20) stack of the trailing windows
+        closes_w, highs_w, lows_w, volumes_w = np.stack([a[:, -20:] for a in arrays], axis=1)
+        
+        # Trailing sums from the newest bar back: column k - 1 holds the sum of the
+        # last k closes, so one cumulative sum yields SMA 5, 10 and 20 together
+        trailing_sums = closes_w[:, ::-1].cumsum(axis=1)
+        sma_20 = trailing_sums[:, 19] / 20
+        # Bollinger Bands: 2 population std devs around the SMA 20 computed above
+        band_width = 2 * np.sqrt(np.square(closes_w - sma_20[:, None]).mean(axis=1))
+        avg_volume = volumes_w.mean(axis=1)
+        
+        # RSI and EMAs depend on each symbol's full history
+        n = len(arrays)
+        rsi = np.fromiter((self._calculate_rsi(closes) for closes, _, _, _ in arrays), dtype=np.float64, count=n)
+        emas = np.array([self._calculate_emas(closes, (10, 20, 50)) for closes, _, _, _ in arrays]).reshape(n, 3)
+        
+        indicators = {
+            "rsi": rsi,
+            "sma_5": trailing_sums[:, 4] / 5,
+            "sma_10": trailing_sums[:, 9] / 10,
+            "sma_20": sma_20,
+            "ema_10": emas[:, 0],
+            "ema_20": emas[:, 1],
+            "ema_50": emas[:, 2],
+            "bollinger_upper": sma_20 + band_width,
+            "bollinger_lower": sma_20 - band_width,
+            "support_level": lows_w.min(axis=1),
+            "resistance_level": highs_w.max(axis=1),
+            "volume_ratio": np.divide(volumes_w[:, -1], avg_volume, out=np.ones(n), where=avg_volume > 0),
+        }
+        
+        # Convert position values from Decimal once
+        current_prices = np.fromiter((float(p.market_price) for p in positions), dtype=np.float64, count=n)
+        
+        # Generate trading signals for every position at once
+        signals = self._generate_stock_signals_batch(current_prices, indicators)
+        
+        columns = {name: values.tolist() for name, values in indicators.items()}
+        results = []
+        for i, (position, current_price) in enumerate(zip(positions, current_prices.tolist())):
+            avg_cost = float(position.avg_cost)
+            results.append({
                 "symbol": position.symbol,
                 "current_price": current_price,
                 "position_data": {
                     "quantity": position.qty,
-                    "avg_cost": float(position.avg_cost),
+                    "avg_cost": avg_cost,
                     "market_value": float(position.market_value),
                     "pnl": float(position.pnl),
-                    "pnl_pct": round((current_price - float(position.avg_cost)) / float(position.avg_cost) * 100, 2) if position.avg_cost != 0 else 0
+                    "pnl_pct": round((current_price - avg_cost) / avg_cost * 100, 2) if avg_cost != 0.0 else 0
                 },
-                "technical_indicators": {
-                    "rsi": round(rsi, 2),
-                    "sma_5": round(sma_5, 2),
-                    "sma_10": round(sma_10, 2),
-                    "sma_20": round(sma_20, 2),
-                    "ema_10": round(ema_10, 2),
-                    "ema_20": round(ema_20, 2),
-                    "ema_50": round(ema_50, 2),
-                    "bollinger_upper": round(bb_upper, 2),
-                    "bollinger_lower": round(bb_lower, 2),
-                    "support_level": round(support_level, 2),
-                    "resistance_level": round(resistance_level, 2),
-                    "volume_ratio": round(volume_ratio, 2)
-                },
-                "signals": signals
-            }
-            
+                "technical_indicators": {name: round(values[i], 2) for name, values in columns.items()},
+                "signals": signals[i]
+            })
+        
+        return results
+    
+    def _candle_cache_path(self, symbol: str, day: datetime) -> Path:
+        """Path of the cached daily candles for a symbol on a given day."""
+        return self.cache_dir / f"{_cache_file_stem(symbol)}_{day.strftime('%Y%m%d')}.json"
+    
+    def _load_cached_candles(self, symbol: str, day: datetime) -> Optional[List[Dict]]:
+        """Load cached completed daily candles for a symbol, or None on a cache miss."""
+        if self.cache_dir is None:
+            return None
+        
+        cache_file = self._candle_cache_path(symbol, day)
+        try:
+            with open(cache_file, 'rb') as f:
+                candles = loads_json(f.read())
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            self.logger.error(f"Error calculating technicals for {position.symbol}: {e}")
-            return {"error": str(e)}
+            self.logger.warning(f"Ignoring unreadable price history cache {cache_file}: {e}")
+            return None
+        # Splicing on the refetched tail needs bar timestamps
+        if not candles or any('datetime' not in c for c in candles):
+            return None
+        return candles
+    
+    def _store_cached_candles(self, symbol: str, day: datetime, candles: List[Dict]) -> None:
+        """Cache completed daily candles for a symbol and drop its entries from earlier days."""
+        if self.cache_dir is None or not candles:
+            return
+        
+        cache_file = self._candle_cache_path(symbol, day)
+        try:
+            # Exactly eight date digits, so e.g. "BRK" never matches "BRK-B" files
+            for stale in self.cache_dir.glob(f"{_cache_file_stem(symbol)}_{'[0-9]' * 8}.json"):
+                if stale != cache_file:
+                    stale.unlink(missing_ok=True)
+            safe_write_json(cache_file, candles, indent=None)
+        except Exception as e:
+            self.logger.warning(f"Could not cache price history for {symbol}: {e}")
     
     def _format_contract_for_streaming(self, position: OptionPosition) -> Optional[str]:
         """Format option contract for Schwab streaming API.
@@ -238,21 +708,12 @@ class TechnicalAnalyzer:
             Formatted contract symbol or None if formatting fails
         """
         try:
-            # Underlying symbol - pad to 6 characters with spaces
-            underlying = position.symbol.ljust(6)[:6]
-            
-            # Expiration date - format as YYMMDD
-            expiry_str = position.expiry.strftime('%y%m%d')
-            
-            # Call/Put - single character (C or P, not CALL/PUT)
-            option_type = 'C' if position.put_call.upper() == 'CALL' else 'P'
-            
-            # Strike price - format as 8 characters (5 before decimal, 3 after)
-            strike_int = int(float(position.strike) * 1000)  # Convert to 3 decimal places
-            strike_str = f"{strike_int:08d}"
-            
-            formatted = f"{underlying}{expiry_str}{option_type}{strike_str}"
-            return formatted
+            # Call/Put - single character (C or P); accepts both 'C' and 'CALL'
+            option_type = 'C' if _is_call(position.put_call) else 'P'
+            expiry = position.expiry
+            return _streaming_contract_symbol(
+                position.symbol, date(expiry.year, expiry.month, expiry.day), option_type, position.strike
+            )
             
         except Exception as e:
             self.logger.error(f"Error formatting contract {position.contract_symbol}: {e}")
@@ -284,8 +745,8 @@ class TechnicalAnalyzer:
             # Use the streaming client
             streamer = self.client.stream
             
-            self.logger.debug(f"Setting up Level One Options streaming for contracts: {formatted_contracts}")
-            self.logger.debug(f"Requesting fields: {fields}")
+            self.logger.debug("Setting up Level One Options streaming for contracts: %s", formatted_contracts)
+            self.logger.debug("Requesting fields: %s", fields)
             
             # Create streaming request for options with Greeks
             stream_request = streamer.level_one_options(formatted_contracts, fields)
@@ -300,51 +761,113 @@ class TechnicalAnalyzer:
             self.logger.info(f"Options streaming request prepared for {len(formatted_contracts)} contracts")
             self.logger.info("Note: Full streaming implementation would collect real-time Greeks here")
             
-            # For now, we'll try to get current Greeks from options chain data
-            for contract in formatted_contracts:
-                try:
-                    # Parse the contract symbol to get underlying and strike info
-                    # Format: AAL   251003C00011500
-                    #         ^^^^^  ^^^^^^ ^^^^^^^^
-                    #         under  expiry type+strike
-                    if len(contract) >= 21:
-                        underlying = contract[:6].strip()
-                        expiry_str = contract[6:12]
-                        option_type = contract[12]
-                        strike_str = contract[13:21]
-                        
-                        # Convert strike from 8-digit format (e.g., "00011500" = $11.50)
-                        self.logger.debug(f"Parsing contract {contract}: underlying='{underlying}', expiry='{expiry_str}', type='{option_type}', strike_str='{strike_str}'")
-                        strike_price = float(strike_str) / 1000
-                        
-                        # Get current options chain data for this contract
-                        greeks_data = self._get_options_greeks_from_chain(underlying, strike_price, expiry_str, option_type)
-                        
-                        streaming_data[contract] = {
-                            "symbol": contract,
-                            "underlying": underlying,
-                            "strike": strike_price,
-                            "option_type": option_type,
-                            "streaming_fields_requested": fields,
-                            "greeks": greeks_data,
-                            "data_source": "options_chain_fallback",
-                            "note": "In production, this would be real-time streaming data with Greeks"
-                        }
-                        
-                except Exception as e:
-                    self.logger.error(f"Error processing contract {contract}: {e}")
-                    streaming_data[contract] = {
-                        "symbol": contract,
-                        "error": str(e),
-                        "streaming_fields_requested": fields
-                    }
+            # For now, we'll try to get current Greeks from options chain data.
+            # Contracts sharing an underlying and expiration share one chain, so
+            # fetch each (underlying, expiry) chain once, concurrently.
+            matches = {contract: _CONTRACT_RE.match(contract) for contract in formatted_contracts}
+            chain_keys = list(dict.fromkeys(
+                (match.group(1).strip(), match.group(2)) for match in matches.values() if match
+            ))
+            chains_cache: Dict[Tuple[str, str], Optional[Dict]] = {}
+            if chain_keys:
+                with ThreadPoolExecutor(max_workers=min(MAX_FETCH_WORKERS, len(chain_keys))) as executor:
+                    chains_cache = dict(zip(chain_keys, executor.map(self._fetch_option_chain_safe, chain_keys)))
+            
+            for contract, match in matches.items():
+                if match is not None:
+                    streaming_data[contract] = self._get_contract_streaming_data(contract, fields, chains_cache, match)
             
         except Exception as e:
             self.logger.error(f"Error setting up options streaming: {e}")
             
         return streaming_data
     
-    def _get_options_greeks_from_chain(self, underlying: str, strike: float, expiry_str: str, option_type: str) -> Dict:
+    def _get_contract_streaming_data(self, contract: str, fields: str,
+                                     chains_cache: Optional[Dict[Tuple[str, str], Optional[Dict]]] = None,
+                                     match: Optional[re.Match] = None) -> Optional[Dict]:
+        """Build the streaming data entry for a single contract.
+        
+        Args:
+            contract: Formatted contract symbol
+            fields: Streaming fields requested for the contract
+            chains_cache: Pre-fetched option chains keyed by (underlying, YYMMDD expiry)
+            match: ``_CONTRACT_RE`` match for the contract; computed if omitted
+            
+        Returns:
+            Streaming data dict, or None if the contract symbol cannot be parsed
+        """
+        try:
+            # Parse the contract symbol to get underlying and strike info
+            # Format: AAL   251003C00011500
+            #         ^^^^^  ^^^^^^ ^^^^^^^^
+            #         under  expiry type+strike
+            if match is None:
+                match = _CONTRACT_RE.match(contract)
+                if match is None:
+                    return None
+            
+            underlying, expiry_str, option_type, strike_str = match.groups()
+            underlying = underlying.strip()
+            
+            # Convert strike from 8-digit format (e.g., "00011500" = $11.50)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Parsing contract {contract}: underlying='{underlying}', expiry='{expiry_str}', type='{option_type}', strike_str='{strike_str}'")
+            strike_price = float(strike_str) / 1000
+            
+            # Look up Greeks in the shared chain when available, else fetch it
+            key = (underlying, expiry_str)
+            if chains_cache is not None and key in chains_cache:
+                greeks_data = self._get_options_greeks_from_chain(
+                    underlying, strike_price, expiry_str, option_type, chain_data=chains_cache[key]
+                )
+            else:
+                greeks_data = self._get_options_greeks_from_chain(underlying, strike_price, expiry_str, option_type)
+            
+            return {
+                "symbol": contract,
+                "underlying": underlying,
+                "strike": strike_price,
+                "option_type": option_type,
+                "streaming_fields_requested": fields,
+                "greeks": greeks_data,
+                "data_source": "options_chain_fallback",
+                "note": "In production, this would be real-time streaming data with Greeks"
+            }
+            
+        except Exception as e:
+            self.logger.error(f"Error processing contract {contract}: {e}")
+            return {
+                "symbol": contract,
+                "error": str(e),
+                "streaming_fields_requested": fields
+            }
+    
+    def _fetch_option_chain(self, underlying: str, expiry_str: str) -> Optional[Dict]:
+        """Fetch the option chain for a single underlying and expiration.
+        
+        Args:
+            underlying: Underlying symbol (e.g., 'AAPL')
+            expiry_str: Expiration in YYMMDD format
+            
+        Returns:
+            Chain JSON, or None if the API returned a non-200 status
+        """
+        expiry_date = _expiry_to_iso(expiry_str)
+        options_chain = self.client.option_chains(underlying, fromDate=expiry_date, toDate=expiry_date)
+        if options_chain.status_code == 200:
+            return options_chain.json()
+        return None
+    
+    def _fetch_option_chain_safe(self, key: Tuple[str, str]) -> Optional[Dict]:
+        """Fetch an option chain for a (underlying, expiry) key, logging failures."""
+        try:
+            return self._fetch_option_chain(*key)
+        except Exception as e:
+            self.logger.error(f"Error fetching option chain for {key[0]} {key[1]}: {e}")
+            return None
+    
+    def _get_options_greeks_from_chain(self, underlying: str, strike: float, expiry_str: str, option_type: str,
+                                       chain_data: Optional[Dict] = None) -> Dict:
         """Get options Greeks from options chain API as fallback.
         
         Args:
@@ -352,62 +875,42 @@ class TechnicalAnalyzer:
             strike: Strike price (e.g., 95.0)
             expiry_str: Expiration in YYMMDD format
             option_type: 'C' for Call, 'P' for Put
+            chain_data: Pre-fetched chain for this underlying/expiry; fetched if omitted
             
         Returns:
             Dict containing Greeks data
         """
         try:
-            # Convert expiry string to datetime for options chain query
-            from datetime import datetime
-            expiry_date = datetime.strptime(f"20{expiry_str}", "%Y%m%d")
-            
-            # Get options chain for this underlying and expiration  
-            options_chain = self.client.option_chains(
-                underlying, 
-                fromDate=expiry_date.strftime("%Y-%m-%d"),
-                toDate=expiry_date.strftime("%Y-%m-%d")
-            )
+            # Chain expiration keys look like "YYYY-MM-DD:X"
+            exp_date_str = _expiry_to_iso(expiry_str)
             
-            chain_data = None
-            if options_chain.status_code == 200:
-                chain_data = options_chain.json()
+            # Get options chain for this underlying and expiration unless already fetched
+            if chain_data is None:
+                chain_data = self._fetch_option_chain(underlying, expiry_str)
             
             if chain_data and 'callExpDateMap' in chain_data:
                 # Look for our specific strike in the chain
-                # The key format appears to be "YYYY-MM-DD:X" where X varies
-                exp_date_str = expiry_date.strftime("%Y-%m-%d")
-                
-                option_map = chain_data.get('callExpDateMap' if option_type == 'C' else 'putExpDateMap', {})
-                
-                # Find the correct expiration key (it may have a suffix like :1, :4, etc.)
-                exp_key = None
-                for key in option_map.keys():
-                    if key.startswith(exp_date_str):
-                        exp_key = key
-                        break
+                option_map = chain_data.get('callExpDateMap' if _is_call(option_type) else 'putExpDateMap', {})
+                option_data = _find_chain_contract(option_map, exp_date_str, strike)
                 
-                if exp_key and exp_key in option_map:
-                    strike_key = f"{strike:.1f}" 
-                    if strike_key in option_map[exp_key]:
-                        option_data = option_map[exp_key][strike_key][0]  # First contract at this strike
-                        
-                        return {
-                            "delta": option_data.get('delta', 0),
-                            "gamma": option_data.get('gamma', 0), 
-                            "theta": option_data.get('theta', 0),
-                            "vega": option_data.get('vega', 0),
-                            "rho": option_data.get('rho', 0),
-                            "implied_volatility": option_data.get('volatility', 0),
-                            "time_value": option_data.get('timeValue', 0),
-                            "theoretical_value": option_data.get('theoreticalValue', 0),
-                            "bid": option_data.get('bid', 0),
-                            "ask": option_data.get('ask', 0),
-                            "last": option_data.get('last', 0),
-                            "mark": option_data.get('mark', 0),
-                            "open_interest": option_data.get('openInterest', 0),
-                            "volume": option_data.get('totalVolume', 0),
-                            "in_the_money": option_data.get('inTheMoney', False)
-                        }
+                if option_data:
+                    return {
+                        "delta": option_data.get('delta', 0),
+                        "gamma": option_data.get('gamma', 0), 
+                        "theta": option_data.get('theta', 0),
+                        "vega": option_data.get('vega', 0),
+                        "rho": option_data.get('rho', 0),
+                        "implied_volatility": option_data.get('volatility', 0),
+                        "time_value": option_data.get('timeValue', 0),
+                        "theoretical_value": option_data.get('theoreticalValue', 0),
+                        "bid": option_data.get('bid', 0),
+                        "ask": option_data.get('ask', 0),
+                        "last": option_data.get('last', 0),
+                        "mark": option_data.get('mark', 0),
+                        "open_interest": option_data.get('openInterest', 0),
+                        "volume": option_data.get('totalVolume', 0),
+                        "in_the_money": option_data.get('inTheMoney', False)
+                    }
             
             # Return empty Greeks if not found
             return {
@@ -426,12 +929,15 @@ class TechnicalAnalyzer:
                 "error": str(e)
             }
     
-    def _parse_streaming_options_data(self, stream_data: Dict, position: OptionPosition) -> Dict:
+    def _parse_streaming_options_data(self, stream_data: Dict, position: OptionPosition,
+                                      now: Optional[datetime] = None, pnl_pct: Optional[float] = None) -> Dict:
         """Parse streaming options data including Greeks into technical analysis format.
         
         Args:
             stream_data: Raw streaming data from Schwab API including Greeks
             position: Option position
+            now: Analysis timestamp shared across the snapshot (defaults to the current time)
+            pnl_pct: Precomputed P&L percentage (computed from the position if omitted)
             
         Returns:
             Parsed technical data with Greeks
@@ -439,9 +945,12 @@ class TechnicalAnalyzer:
         try:
             # Extract Greeks data from streaming response
             greeks = stream_data.get('greeks', {})
+            get = greeks.get
+            delta, theta = get('delta', 0), get('theta', 0)
+            implied_volatility, time_value = get('implied_volatility', 0), get('time_value', 0)
             
             # Calculate additional metrics
-            days_to_expiry = (position.expiry - datetime.now()).days
+            days_to_expiry = (position.expiry - (now or datetime.now())).days
             
             return {
                 "contract_symbol": position.contract_symbol,
@@ -452,7 +961,8 @@ class TechnicalAnalyzer:
                     "current_price": float(position.market_price),
                     "market_value": float(position.market_value),
                     "pnl": float(position.pnl),
-                    "pnl_pct": self._calculate_options_pnl_pct(position)
+                    "pnl_pct": (self._calculate_options_pnl_pct(position) if pnl_pct is None
+                                else round(pnl_pct, 2))
                 },
                 "option_data": {
                     "strike": float(position.strike),
@@ -461,31 +971,26 @@ class TechnicalAnalyzer:
                     "option_type": position.put_call
                 },
                 "greeks": {
-                    "delta": round(greeks.get('delta', 0), 4),
-                    "gamma": round(greeks.get('gamma', 0), 4),
-                    "theta": round(greeks.get('theta', 0), 4),
-                    "vega": round(greeks.get('vega', 0), 4),
-                    "rho": round(greeks.get('rho', 0), 4),
-                    "implied_volatility": round(greeks.get('implied_volatility', 0), 4)
+                    "delta": round(delta, 4),
+                    "gamma": round(get('gamma', 0), 4),
+                    "theta": round(theta, 4),
+                    "vega": round(get('vega', 0), 4),
+                    "rho": round(get('rho', 0), 4),
+                    "implied_volatility": round(implied_volatility, 4)
                 },
                 "market_data": {
-                    "bid": greeks.get('bid', 0),
-                    "ask": greeks.get('ask', 0),
-                    "last": greeks.get('last', 0),
-                    "mark": greeks.get('mark', 0),
-                    "volume": greeks.get('volume', 0),
-                    "open_interest": greeks.get('open_interest', 0),
-                    "time_value": round(greeks.get('time_value', 0), 4),
-                    "theoretical_value": round(greeks.get('theoretical_value', 0), 4),
-                    "in_the_money": greeks.get('in_the_money', False)
+                    "bid": get('bid', 0),
+                    "ask": get('ask', 0),
+                    "last": get('last', 0),
+                    "mark": get('mark', 0),
+                    "volume": get('volume', 0),
+                    "open_interest": get('open_interest', 0),
+                    "time_value": round(time_value, 4),
+                    "theoretical_value": round(get('theoretical_value', 0), 4),
+                    "in_the_money": get('in_the_money', False)
                 },
                 "signals": self._generate_options_signals_with_greeks(
-                    position, 
-                    greeks.get('delta', 0),
-                    greeks.get('theta', 0), 
-                    greeks.get('implied_volatility', 0),
-                    days_to_expiry,
-                    greeks.get('time_value', 0)
+                    position, delta, theta, implied_volatility, days_to_expiry, time_value
                 ),
                 "data_source": stream_data.get('data_source', 'streaming'),
                 "streaming_info": {
@@ -499,62 +1004,63 @@ class TechnicalAnalyzer:
             self.logger.error(f"Error parsing streaming data for {position.contract_symbol}: {e}")
             return {"error": str(e)}
     
-    def _get_options_chain_fallback(self, position: OptionPosition) -> Dict:
-        """Fallback method using options chain API when streaming is not available.
+    def _fetch_fallback_chain(self, symbol: str) -> Dict:
+        """Fetch the full options chain for an underlying for the fallback path.
         
         Args:
-            position: Option position
+            symbol: Underlying symbol
             
         Returns:
-            Options data from chain API
+            Chain JSON, or a dict with an "error" key if the request failed
         """
         try:
-            # Get options chain for the underlying
-            options_chain = self.client.option_chains(symbol=position.symbol)
+            options_chain = self.client.option_chains(symbol=symbol)
             
             if options_chain.status_code == 200:
-                chain_data = options_chain.json()
-                return self._parse_options_data(chain_data, position)
-            else:
-                return {"error": f"Options chain API error: {options_chain.status_code}"}
-                
+                return response_json(options_chain)
+            return {"error": f"Options chain API error: {options_chain.status_code}"}
+            
         except Exception as e:
-            self.logger.error(f"Fallback options chain failed for {position.contract_symbol}: {e}")
+            self.logger.error(f"Fallback options chain failed for {symbol}: {e}")
             return {"error": str(e)}
     
-    def _parse_options_data(self, chain_data: Dict, position: OptionPosition) -> Dict:
+    def _get_options_chain_fallback(self, position: OptionPosition, chain_data: Optional[Dict] = None,
+                                    now: Optional[datetime] = None) -> Dict:
+        """Fallback method using options chain API when streaming is not available.
+        
+        Args:
+            position: Option position
+            chain_data: Pre-fetched chain for the underlying; fetched if omitted
+            now: Analysis timestamp shared across the snapshot (defaults to the current time)
+            
+        Returns:
+            Options data from chain API
+        """
+        if chain_data is None:
+            chain_data = self._fetch_fallback_chain(position.symbol)
+        
+        if "error" in chain_data:
+            return {"error": chain_data["error"]}
+        
+        return self._parse_options_data(chain_data, position, now)
+    
+    def _parse_options_data(self, chain_data: Dict, position: OptionPosition,
+                            now: Optional[datetime] = None) -> Dict:
         """Parse options chain data for technical analysis.
         
         Args:
             chain_data: Raw options chain data from API
             position: Option position to analyze
+            now: Analysis timestamp shared across the snapshot (defaults to the current time)
             
         Returns:
             Dictionary with options technical analysis
         """
         try:
             # Find the specific option contract in the chain
-            option_data = None
-            strike_str = str(float(position.strike))
             expiry_str = position.expiry.strftime('%Y-%m-%d')
-            
-            # Look through the options chain to find our contract
-            if position.put_call.upper() == 'CALL':
-                call_map = chain_data.get('callExpDateMap', {})
-                for exp_date, strikes in call_map.items():
-                    if expiry_str in exp_date:
-                        for strike, option_list in strikes.items():
-                            if strike_str in strike and option_list:
-                                option_data = option_list[0]
-                                break
-            else:  # PUT
-                put_map = chain_data.get('putExpDateMap', {})
-                for exp_date, strikes in put_map.items():
-                    if expiry_str in exp_date:
-                        for strike, option_list in strikes.items():
-                            if strike_str in strike and option_list:
-                                option_data = option_list[0]
-                                break
+            map_key = 'callExpDateMap' if _is_call(position.put_call) else 'putExpDateMap'
+            option_data = _find_chain_contract(chain_data.get(map_key, {}), expiry_str, position.strike)
             
             if not option_data:
                 return {
@@ -565,6 +1071,8 @@ class TechnicalAnalyzer:
             # Extract key metrics
             bid = option_data.get('bid', 0)
             ask = option_data.get('ask', 0)
+            avg_cost = float(position.avg_cost)
+            strike = float(position.strike)
             last = option_data.get('last', float(position.market_price))
             volume = option_data.get('totalVolume', 0)
             open_interest = option_data.get('openInterest', 0)
@@ -577,7 +1085,7 @@ class TechnicalAnalyzer:
             implied_volatility = option_data.get('volatility', 0)
             
             # Time to expiration
-            days_to_expiry = (position.expiry - datetime.now()).days
+            days_to_expiry = (position.expiry - (now or datetime.now())).days
             
             # Generate signals based on options metrics
             signals = self._generate_options_signals(
@@ -589,11 +1097,11 @@ class TechnicalAnalyzer:
                 "underlying_symbol": position.symbol,
                 "position_data": {
                     "quantity": position.qty,
-                    "avg_cost": float(position.avg_cost),
+                    "avg_cost": avg_cost,
                     "current_price": last,
                     "market_value": float(position.market_value),
                     "pnl": float(position.pnl),
-                    "pnl_pct": round((last - float(position.avg_cost)) / float(position.avg_cost) * 100, 2) if position.avg_cost != 0 else 0
+                    "pnl_pct": round((last - avg_cost) / avg_cost * 100, 2) if avg_cost != 0.0 else 0
                 },
                 "option_metrics": {
                     "bid": bid,
@@ -611,11 +1119,11 @@ class TechnicalAnalyzer:
                     "vega": round(vega, 4)
                 },
                 "option_data": {
-                    "strike": float(position.strike),
+                    "strike": strike,
                     "expiry": expiry_str,
                     "days_to_expiry": days_to_expiry,
                     "option_type": position.put_call,
-                    "moneyness": self._calculate_moneyness(chain_data.get('underlyingPrice', 0), float(position.strike), position.put_call)
+                    "moneyness": self._calculate_moneyness(chain_data.get('underlyingPrice', 0), strike, position.put_call)
                 },
                 "signals": signals
             }
@@ -624,82 +1132,65 @@ class TechnicalAnalyzer:
             self.logger.error(f"Error parsing options data for {position.contract_symbol}: {e}")
             return {"error": str(e)}
     
-    def _calculate_rsi(self, prices: List[float], period: int = 14) -> float:
-        """Calculate RSI (Relative Strength Index).
+    def _calculate_rsi(self, prices, period: int = 14) -> float:
+        """Calculate RSI (Relative Strength Index) using Wilder's smoothing.
         
         Args:
-            prices: List of closing prices
+            prices: Closing prices (list or float64 ndarray)
             period: RSI period (default 14)
             
         Returns:
             RSI value (0-100)
         """
-        if len(prices) < period + 1:
-            return 50  # Neutral RSI if insufficient data
-        
-        deltas = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        gains = [d if d > 0 else 0 for d in deltas]
-        losses = [-d if d < 0 else 0 for d in deltas]
-        
-        avg_gain = sum(gains[-period:]) / period
-        avg_loss = sum(losses[-period:]) / period
-        
-        if avg_loss == 0:
-            return 100
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
+        return float(_rsi_wilder(np.ascontiguousarray(prices, dtype=np.float64), period))
     
-    def _calculate_bollinger_bands(self, prices: List[float], period: int = 20, std_dev: float = 2) -> tuple:
+    def _calculate_bollinger_bands(self, prices, period: int = 20, std_dev: float = 2) -> tuple:
         """Calculate Bollinger Bands.
         
         Args:
-            prices: List of closing prices
+            prices: Closing prices (list or float64 ndarray)
             period: Moving average period
             std_dev: Number of standard deviations for bands
             
         Returns:
-            Tuple of (upper_band, lower_band)
+            Tuple of (upper_band, lower_band); both equal the mean of all prices
+            when fewer than ``period`` are available
         """
-        if len(prices) < period:
-            sma = sum(prices) / len(prices)
-            return sma, sma
-        
-        sma = sum(prices[-period:]) / period
-        variance = sum((price - sma) ** 2 for price in prices[-period:]) / period
-        std = variance ** 0.5
-        
-        upper_band = sma + (std_dev * std)
-        lower_band = sma - (std_dev * std)
+        window = np.asarray(prices, dtype=np.float64)[-period:]
+        sma = window.mean()
+        if window.shape[0] < period:
+            return float(sma), float(sma)
         
-        return upper_band, lower_band
+        band_width = std_dev * window.std()  # Population std, as in the batch path
+        return float(sma + band_width), float(sma - band_width)
     
-    def _calculate_ema(self, prices: List[float], period: int) -> float:
+    def _calculate_ema(self, prices, period: int) -> float:
         """Calculate Exponential Moving Average (EMA).
         
         Args:
-            prices: List of closing prices
+            prices: Closing prices (list or float64 ndarray)
             period: EMA period
             
         Returns:
-            EMA value
+            EMA value (mean of all prices if fewer than ``period``, 0 if empty)
         """
-        if len(prices) < period:
-            return sum(prices) / len(prices) if prices else 0
-        
-        # Calculate smoothing factor (alpha)
-        alpha = 2 / (period + 1)
-        
-        # Start with SMA for the first EMA value
-        ema = sum(prices[:period]) / period
-        
-        # Calculate EMA for remaining values
-        for price in prices[period:]:
-            ema = (price * alpha) + (ema * (1 - alpha))
+        return self._calculate_emas(prices, (period,))[0]
+    
+    def _calculate_emas(self, prices, periods: Tuple[int, ...] = (10, 20, 50)) -> List[float]:
+        """Calculate EMAs for several periods over the same series in one pass.
         
-        return ema
+        Args:
+            prices: Closing prices (list or float64 ndarray)
+            periods: EMA periods
+            
+        Returns:
+            EMA values in the same order as ``periods``
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        n = prices.shape[0]
+        if n == 0:
+            return [0.0] * len(periods)
+        return (_ema_weight_matrix(tuple(periods), n) @ prices).tolist()
     
     def _calculate_moneyness(self, underlying_price: float, strike_price: float, option_type: str) -> str:
         """Calculate option moneyness.
@@ -712,24 +1203,11 @@ class TechnicalAnalyzer:
         Returns:
             Moneyness description
         """
-        if option_type.upper() == 'CALL':
-            if underlying_price > strike_price:
-                return "In-The-Money"
-            elif underlying_price == strike_price:
-                return "At-The-Money"
-            else:
-                return "Out-Of-The-Money"
-        else:  # PUT
-            if underlying_price < strike_price:
-                return "In-The-Money"
-            elif underlying_price == strike_price:
-                return "At-The-Money"
-            else:
-                return "Out-Of-The-Money"
+        return _moneyness(underlying_price, strike_price, _is_call(option_type))
     
     def _generate_stock_signals(self, current_price: float, rsi: float, sma_5: float, 
                                sma_10: float, sma_20: float, ema_10: float, ema_20: float, ema_50: float,
-                               bb_upper: float, bb_lower: float, support: float, resistance: float, volume_ratio: float) -> List[str]:
+                               bb_upper: float, bb_lower: float, support: float, resistance: float, volume_ratio: float) -> Sequence[str]:
         """Generate trading signals for stocks based on technical indicators.
         
         Args:
@@ -743,67 +1221,81 @@ class TechnicalAnalyzer:
         Returns:
             List of signal strings
         """
-        signals = []
+        indicators = {
+            "rsi": rsi, "sma_5": sma_5, "sma_10": sma_10, "sma_20": sma_20,
+            "ema_10": ema_10, "ema_20": ema_20, "ema_50": ema_50,
+            "bollinger_upper": bb_upper, "bollinger_lower": bb_lower,
+            "support_level": support, "resistance_level": resistance, "volume_ratio": volume_ratio,
+        }
+        return self._generate_stock_signals_batch(
+            np.array([current_price], dtype=np.float64),
+            {name: np.array([value], dtype=np.float64) for name, value in indicators.items()}
+        )[0]
+    
+    def _generate_stock_signals_batch(self, current_price: np.ndarray, indicators: Dict[str, np.ndarray]) -> List[Sequence[str]]:
+        """Generate trading signals for many stocks with vectorized threshold checks.
+        
+        Each rule is evaluated once as a boolean mask over all positions; ``elif``
+        chains become masks that exclude the earlier branches.
         
-        # RSI signals
-        if rsi < 30:
-            signals.append("OVERSOLD (RSI < 30)")
-        elif rsi > 70:
-            signals.append("OVERBOUGHT (RSI > 70)")
+        Args:
+            current_price: Current stock prices, one per position
+            indicators: Indicator arrays keyed like ``technical_indicators``
+            
+        Returns:
+            List of signal strings per position
+        """
+        rsi = indicators["rsi"]
+        sma_5, sma_10, sma_20 = indicators["sma_5"], indicators["sma_10"], indicators["sma_20"]
+        ema_10, ema_20, ema_50 = indicators["ema_10"], indicators["ema_20"], indicators["ema_50"]
+        support, resistance = indicators["support_level"], indicators["resistance_level"]
+        volume_ratio = indicators["volume_ratio"]
         
         # Moving average signals (SMA)
-        if current_price > sma_5 > sma_10 > sma_20:
-            signals.append("STRONG UPTREND (Price > MA5 > MA10 > MA20)")
-        elif current_price < sma_5 < sma_10 < sma_20:
-            signals.append("STRONG DOWNTREND (Price < MA5 < MA10 < MA20)")
-        elif current_price > sma_20:
-            signals.append("ABOVE 20-DAY MA")
-        elif current_price < sma_20:
-            signals.append("BELOW 20-DAY MA")
-        
-        # EMA-based signals (more responsive to recent price action)
-        if ema_10 > ema_20 > ema_50:
-            signals.append("EMA BULLISH ALIGNMENT (EMA10 > EMA20 > EMA50)")
-        elif ema_10 < ema_20 < ema_50:
-            signals.append("EMA BEARISH ALIGNMENT (EMA10 < EMA20 < EMA50)")
+        sma_up = (current_price > sma_5) & (sma_5 > sma_10) & (sma_10 > sma_20)
+        sma_down = ~sma_up & (current_price < sma_5) & (sma_5 < sma_10) & (sma_10 < sma_20)
+        sma_other = ~(sma_up | sma_down)
         
         # EMA crossover signals
-        if current_price > ema_10 and current_price > ema_20:
-            signals.append("ABOVE SHORT-TERM EMAs")
-        elif current_price < ema_10 and current_price < ema_20:
-            signals.append("BELOW SHORT-TERM EMAs")
-        
-        if current_price > ema_50:
-            signals.append("ABOVE LONG-TERM EMA (50)")
-        elif current_price < ema_50:
-            signals.append("BELOW LONG-TERM EMA (50)")
-        
-        # Bollinger Band signals
-        if current_price > bb_upper:
-            signals.append("ABOVE UPPER BOLLINGER BAND")
-        elif current_price < bb_lower:
-            signals.append("BELOW LOWER BOLLINGER BAND")
-        
-        # Support/Resistance signals
-        price_to_support = abs(current_price - support) / support * 100
-        price_to_resistance = abs(current_price - resistance) / resistance * 100
-        
-        if price_to_support < 2:
-            signals.append("NEAR SUPPORT LEVEL")
-        if price_to_resistance < 2:
-            signals.append("NEAR RESISTANCE LEVEL")
-        
-        # Volume signals
-        if volume_ratio > 2:
-            signals.append("HIGH VOLUME (2x+ avg)")
-        elif volume_ratio > 1.5:
-            signals.append("ELEVATED VOLUME")
-        
-        return signals if signals else ["NEUTRAL"]
+        above_short_emas = (current_price > ema_10) & (current_price > ema_20)
+        above_upper_band = current_price > indicators["bollinger_upper"]
+        
+        # Support/Resistance signals (distance in percent)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            near_support = np.abs(current_price - support) / support * 100 < 2
+            near_resistance = np.abs(current_price - resistance) / resistance * 100 < 2
+        
+        # Rules in output order; each row is one signal across all positions
+        masks = np.stack([
+            rsi < 30,
+            rsi > 70,
+            sma_up,
+            sma_down,
+            sma_other & (current_price > sma_20),
+            sma_other & (current_price < sma_20),
+            (ema_10 > ema_20) & (ema_20 > ema_50),
+            (ema_10 < ema_20) & (ema_20 < ema_50),
+            above_short_emas,
+            ~above_short_emas & (current_price < ema_10) & (current_price < ema_20),
+            current_price > ema_50,
+            current_price < ema_50,
+            above_upper_band,
+            ~above_upper_band & (current_price < indicators["bollinger_lower"]),
+            near_support,
+            near_resistance,
+            volume_ratio > 2,
+            (volume_ratio > 1.5) & ~(volume_ratio > 2),
+        ])
+        
+        signals = []
+        for row in masks.T.tolist():
+            position_signals = [signal for signal, hit in zip(_STOCK_SIGNALS, row) if hit]
+            signals.append(position_signals or _NEUTRAL_STOCK_SIGNALS)
+        return signals
     
     def _generate_options_signals(self, position: OptionPosition, iv: float, delta: Optional[float],
                                  theta: Optional[float], days_to_expiry: int, 
-                                 open_interest: Optional[int]) -> List[str]:
+                                 open_interest: Optional[int]) -> Sequence[str]:
         """Generate trading signals for options based on various metrics.
         
         Args:
@@ -819,6 +1311,10 @@ class TechnicalAnalyzer:
         """
         signals = []
         
+        # Convert position values from Decimal once
+        avg_cost = float(position.avg_cost)
+        market_price = float(position.market_price)
+        
         # Time decay warnings
         if days_to_expiry <= 7:
             signals.append("EXPIRING SOON (≤7 days)")
@@ -834,7 +1330,7 @@ class TechnicalAnalyzer:
         
         # Delta signals (if available)
         if delta is not None:
-            if position.put_call.upper() == 'CALL':
+            if _is_call(position.put_call):
                 if delta > 0.7:
                     signals.append("DEEP ITM CALL (Δ>0.7)")
                 elif delta < 0.3:
@@ -857,9 +1353,7 @@ class TechnicalAnalyzer:
         if position.qty < 0:  # Short position (sold options)
             # For short options: profit when current price < premium received
             # P&L% = (premium_received - current_cost_to_close) / premium_received * 100
-            premium_received = float(position.avg_cost)
-            current_close_cost = float(position.market_price)
-            pnl_pct = (premium_received - current_close_cost) / premium_received * 100
+            pnl_pct = (avg_cost - market_price) / avg_cost * 100
             
             if pnl_pct > 50:  # Made >50% of premium
                 signals.append("STRONG PROFIT - CONSIDER CLOSING (+50%)")
@@ -868,17 +1362,17 @@ class TechnicalAnalyzer:
             elif pnl_pct < -100:  # Current cost > 2x premium received
                 signals.append("LARGE LOSS - CONSIDER CLOSING (-100%)")
         else:  # Long position (bought options)
-            pnl_pct = (float(position.market_price) - float(position.avg_cost)) / float(position.avg_cost) * 100
+            pnl_pct = (market_price - avg_cost) / avg_cost * 100
             if pnl_pct > 20:
                 signals.append("CONSIDER PROFIT TAKING (+20%)")
             elif pnl_pct < -50:
                 signals.append("LARGE LOSS (-50%)")
         
-        return signals if signals else ["MONITOR"]
+        return signals or _NEUTRAL_OPTION_SIGNALS
     
     def _generate_options_signals_with_greeks(self, position: OptionPosition, delta: float, theta: float, 
                                             implied_volatility: float, days_to_expiry: int, 
-                                            time_value: float) -> List[str]:
+                                            time_value: float) -> Sequence[str]:
         """Generate enhanced trading signals for options using Greeks data.
         
         Args:
@@ -892,142 +1386,56 @@ class TechnicalAnalyzer:
         Returns:
             List of enhanced signal strings based on Greeks
         """
-        signals = []
-        
-        # Time decay analysis using theta
-        if days_to_expiry <= 7:
-            if abs(theta) > 0.10:
-                signals.append("EXTREME TIME DECAY - EXPIRING SOON (θ > 0.10)")
-            else:
-                signals.append("EXPIRING SOON (≤7 days)")
-        elif days_to_expiry <= 21:
-            if abs(theta) > 0.05:
-                signals.append("HIGH TIME DECAY (θ > 0.05)")
-            else:
-                signals.append("MODERATE TIME DECAY")
-        elif days_to_expiry <= 45:
-            signals.append("THETA RISK INCREASING - APPROACHING 45 DTE")
-        
-        # Delta-based moneyness and directional risk
-        if position.put_call.upper() == 'CALL':
-            if delta > 0.8:
-                signals.append("DEEP ITM CALL - HIGH DELTA RISK (Δ > 0.8)")
-            elif delta > 0.6:
-                signals.append("ITM CALL - STRONG DIRECTIONAL EXPOSURE (Δ > 0.6)")
-            elif delta < 0.2:
-                signals.append("LOW DELTA CALL - LIMITED UPSIDE SENSITIVITY (Δ < 0.2)")
-            elif 0.4 <= delta <= 0.6:
-                signals.append("ATM CALL - MAXIMUM GAMMA RISK")
-        else:  # PUT
-            if delta < -0.8:
-                signals.append("DEEP ITM PUT - HIGH DELTA RISK (Δ < -0.8)")
-            elif delta < -0.6:
-                signals.append("ITM PUT - STRONG DIRECTIONAL EXPOSURE (Δ < -0.6)")
-            elif delta > -0.2:
-                signals.append("LOW DELTA PUT - LIMITED DOWNSIDE SENSITIVITY (Δ > -0.2)")
-            elif -0.6 <= delta <= -0.4:
-                signals.append("ATM PUT - MAXIMUM GAMMA RISK")
-        
-        # Implied volatility analysis
-        if implied_volatility > 0.6:  # 60%+ IV
-            signals.append("VERY HIGH IV - VOLATILITY CRUSH RISK (IV > 60%)")
-        elif implied_volatility > 0.4:  # 40%+ IV
-            signals.append("HIGH IV - ELEVATED PREMIUM (IV > 40%)")
-        elif implied_volatility < 0.15:  # 15%- IV
-            signals.append("LOW IV - CHEAP PREMIUM (IV < 15%)")
-        elif implied_volatility < 0.25:  # 25%- IV
-            signals.append("MODERATE IV - REASONABLE PREMIUM")
-        
-        # Time value and intrinsic value analysis
+        # Convert position values from Decimal once
+        avg_cost = float(position.avg_cost)
         current_price = float(position.market_price)
-        if time_value > 0:
-            time_value_pct = (time_value / current_price) * 100
-            if time_value_pct > 50:
-                signals.append("HIGH TIME VALUE (>50% of premium)")
-            elif time_value_pct < 10 and days_to_expiry > 30:
-                signals.append("LOW TIME VALUE - MOSTLY INTRINSIC")
-        
-        # Position-specific P&L analysis with Greeks context
-        if position.qty < 0:  # Short position
-            premium_received = float(position.avg_cost)
-            current_close_cost = float(position.market_price)
-            pnl_pct = (premium_received - current_close_cost) / premium_received * 100
-            
-            if pnl_pct > 75:
-                signals.append("EXCELLENT SHORT PROFIT - CONSIDER CLOSING (>75%)")
-            elif pnl_pct > 50:
-                signals.append("STRONG SHORT PROFIT - THETA WORKING (>50%)")
-            elif pnl_pct > 25:
-                signals.append("GOOD SHORT PROFIT - MONITOR DELTA RISK (>25%)")
-            elif pnl_pct < -50:
-                signals.append("LARGE SHORT LOSS - HIGH DELTA AGAINST US (<-50%)")
-            
-            # Short-specific Greeks warnings
-            if abs(delta) > 0.6:
-                signals.append("HIGH DELTA RISK - SHORT POSITION VULNERABLE")
-            if abs(theta) < 0.02 and days_to_expiry > 30:
-                signals.append("LOW THETA BENEFIT - TIME DECAY SLOW")
-                
-        else:  # Long position  
-            pnl_pct = (current_price - float(position.avg_cost)) / float(position.avg_cost) * 100
-            
-            if pnl_pct > 100:
-                signals.append("EXCEPTIONAL LONG PROFIT - SECURE GAINS (>100%)")
-            elif pnl_pct > 50:
-                signals.append("STRONG LONG PROFIT - CONSIDER PARTIAL CLOSE (>50%)")
-            elif pnl_pct > 25:
-                signals.append("GOOD LONG PROFIT - MONITOR THETA DECAY (>25%)")
-            elif pnl_pct < -75:
-                signals.append("SEVERE LONG LOSS - CUT LOSSES? (<-75%)")
-            elif pnl_pct < -50:
-                signals.append("LARGE LONG LOSS - THETA & DELTA WORKING AGAINST (<-50%)")
-            
-            # Long-specific Greeks warnings
-            if abs(theta) > 0.05 and days_to_expiry < 30:
-                signals.append("HIGH THETA DECAY - TIME WORKING AGAINST LONG")
-            if abs(delta) < 0.2:
-                signals.append("LOW DELTA - NEEDS LARGE UNDERLYING MOVE")
+        short = position.qty < 0
+        has_time_value = time_value > 0
+        
+        context = _GreeksSignalContext(
+            is_call=_is_call(position.put_call),
+            short=short,
+            qty=position.qty,
+            delta=delta,
+            abs_delta=abs(delta),
+            abs_theta=abs(theta),
+            iv=implied_volatility,
+            dte=days_to_expiry,
+            has_time_value=has_time_value,
+            time_value_pct=(time_value / current_price) * 100 if has_time_value else 0.0,
+            # Shorts profit when the buy-back cost falls below the premium received
+            pnl_pct=((avg_cost - current_price) if short else (current_price - avg_cost)) / avg_cost * 100,
+        )
         
-        # Volatility environment signals for both long and short
-        if implied_volatility > 0.5 and position.qty < 0:
-            signals.append("IV CRUSH OPPORTUNITY - SHORT PREMIUM")
-        elif implied_volatility < 0.2 and position.qty > 0:
-            signals.append("CHEAP PREMIUM ENTRY - LONG OPPORTUNITY")
-        
-        # Risk management based on time and Greeks
-        if days_to_expiry <= 21 and abs(theta) > 0.05:
-            signals.append("THETA ACCELERATION ZONE - MANAGE ACTIVELY")
-        
-        if days_to_expiry <= 7 and abs(delta) > 0.3:
-            signals.append("PIN RISK - NEAR EXPIRY WITH DELTA EXPOSURE")
+        signals = []
+        for group in _GREEKS_SIGNAL_RULES:
+            for predicate, signal in group:
+                if predicate(context):
+                    signals.append(signal)
+                    break
         
-        return signals if signals else ["MONITOR - GREEKS NEUTRAL"]
+        return signals or _NEUTRAL_GREEKS_SIGNALS
     
     def _calculate_options_pnl_pct(self, position):
-        """Calculate P&L percentage for options positions based on position type"""
+        """Calculate P&L percentage for options positions based on position type.
+        
+        Short positions (negative quantity) collected the premium, so their P&L is
+        ``(premium_received - current_cost) / premium_received``; long positions use
+        ``(current_price - avg_cost) / avg_cost``. Both are the same expression with
+        the sign flipped, so a single division covers either side.
+        """
         try:
             avg_cost = float(position.avg_cost)
             current_price = float(position.market_price)
-            quantity = int(position.qty)
+            short = int(position.qty) < 0
             
-            self.logger.debug(f"P&L Debug - {position.contract_symbol}: qty={quantity}, avg_cost={avg_cost}, current_price={current_price}")
+            # Cost basis is the premium received for shorts
+            basis = abs(avg_cost) if short else avg_cost
+            pnl_pct = (-100.0 if short else 100.0) * (current_price - basis) / basis
             
-            if avg_cost == 0:
-                return 0
-            
-            # For short positions (negative quantity), we sold options and collected premium
-            if quantity < 0:
-                # P&L = (premium_received - current_cost) / premium_received * 100
-                premium_received = abs(avg_cost)  # Cost basis is the premium we received
-                current_cost = current_price      # Current cost to buy back
-                pnl_pct = ((premium_received - current_cost) / premium_received) * 100
-                self.logger.debug(f"Short position calc: premium_received={premium_received}, current_cost={current_cost}, pnl_pct={pnl_pct}")
-                return round(pnl_pct, 2)
-            else:
-                # For long positions, use traditional P&L calculation
-                pnl_pct = ((current_price - avg_cost) / avg_cost) * 100
-                self.logger.debug(f"Long position calc: pnl_pct={pnl_pct}")
-                return round(pnl_pct, 2)
+            self.logger.debug("P&L Debug - %s: qty=%s, avg_cost=%s, current_price=%s, pnl_pct=%s",
+                              position.contract_symbol, position.qty, avg_cost, current_price, pnl_pct)
+            return round(pnl_pct, 2)
                 
         except (ValueError, ZeroDivisionError):
             return 0
@@ -1043,7 +1451,7 @@ def analyze_account_technicals(client, snapshot: AccountSnapshot) -> Dict[str, A
     Returns:
         Dictionary with complete technical analysis
     """
-    analyzer = TechnicalAnalyzer(client)
+    analyzer = TechnicalAnalyzer(client, cache_dir=PRICE_HISTORY_CACHE_DIR)
     
     # Get stock technicals
     stock_technicals = analyzer.get_stock_technicals(snapshot)
@@ -1072,14 +1480,9 @@ def _summarize_stock_signals(stock_technicals: Dict[str, Any]) -> Dict[str, int]
     Returns:
         Summary of signal counts
     """
-    signal_counts = {}
-    
-    for symbol, data in stock_technicals.items():
-        if "signals" in data and isinstance(data["signals"], list):
-            for signal in data["signals"]:
-                signal_counts[signal] = signal_counts.get(signal, 0) + 1
-    
-    return signal_counts
+    return dict(Counter(chain.from_iterable(
+        data["signals"] for data in stock_technicals.values() if isinstance(data.get("signals"), (list, tuple))
+    )))
 
 
 def _summarize_options_signals(options_technicals: Dict[str, Any]) -> Dict[str, int]:
@@ -1091,14 +1494,9 @@ def _summarize_options_signals(options_technicals: Dict[str, Any]) -> Dict[str,
     Returns:
         Summary of signal counts
     """
-    signal_counts = {}
-    
-    for contract, data in options_technicals.items():
-        if "signals" in data and isinstance(data["signals"], list):
-            for signal in data["signals"]:
-                signal_counts[signal] = signal_counts.get(signal, 0) + 1
-    
-    return signal_counts
+    return dict(Counter(chain.from_iterable(
+        data["signals"] for data in options_technicals.values() if isinstance(data.get("signals"), (list, tuple))
+    )))
 
 
 def get_technicals_for_symbol(symbol: str, client=None) -> Dict[str, Any]:
@@ -1122,19 +1520,53 @@ def get_technicals_for_symbol(symbol: str, client=None) -> Dict[str, Any]:
         print(f"Delta: {technicals.get('delta', 'N/A')}")
     """
     if client is None:
-        from api.sim_client import SimBrokerClient
         client = SimBrokerClient()
     
-    # Initialize analyzer
+    return _get_technicals_with_analyzer(symbol, TechnicalAnalyzer(client), client)
+
+
+def get_technicals_for_symbols(symbols: Sequence[str], client=None) -> Dict[str, Dict[str, Any]]:
+    """
+    Get technical analysis for many stock or option symbols in one call.
+    
+    One client and analyzer are shared across all symbols. Both the stock and
+    option paths generate their records in-process without broker requests,
+    so symbols are analyzed inline rather than through a thread pool. A
+    failure on one symbol is reported as ``{"error": ...}`` for that symbol
+    instead of aborting the batch.
+    
+    Args:
+        symbols: Stock tickers and/or option symbols
+        client: Optional broker client. If None, uses SimBrokerClient for demo data.
+        
+    Returns:
+        Dictionary mapping each symbol (in input order) to its technicals
+    """
+    if client is None:
+        client = SimBrokerClient()
+    
+    symbols = list(symbols)
+    if not symbols:
+        return {}
+    
     analyzer = TechnicalAnalyzer(client)
     
-    # Determine if it's a stock or option symbol
+    def safe_technicals(symbol: str) -> Dict[str, Any]:
+        try:
+            return _get_technicals_with_analyzer(symbol, analyzer, client)
+        except Exception as e:
+            return {"error": str(e)}
+    
+    return {symbol: safe_technicals(symbol) for symbol in symbols}
+
+
+def _get_technicals_with_analyzer(symbol: str, analyzer: TechnicalAnalyzer, client) -> Dict[str, Any]:
+    """Dispatch a symbol to the stock or option technicals path."""
     if len(symbol) > 10 and ' ' in symbol:
         # Looks like an option symbol
         return _get_option_technicals_for_symbol(symbol, analyzer, client)
-    else:
-        # Treat as stock symbol
-        return _get_stock_technicals_for_symbol(symbol, analyzer, client)
+    # Treat as stock symbol
+    return _get_stock_technicals_for_symbol(symbol, analyzer, client)
 
 
 def _get_stock_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer, client) -> Dict[str, Any]:
@@ -1142,12 +1574,10 @@ def _get_stock_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer, c
     # For now, return mock technical data
     # In a production system, this would fetch real market data and calculate actual technicals
     
-    import random
-    import math
-    
-    # Generate some realistic-looking mock data
-    base_price = random.uniform(50, 300)  # Random base price
-    rsi = random.uniform(20, 80)  # RSI between 20-80
+    # Generate some realistic-looking mock data with one draw for every field
+    draws = _MOCK_STOCK_LOW + (_MOCK_STOCK_HIGH - _MOCK_STOCK_LOW) * _mock_np_rng.random(_MOCK_STOCK_LOW.shape[0])
+    (base_price, rsi, sma_20_mult, sma_50_mult, macd, macd_signal, macd_histogram,
+     price_change_pct, day_high_mult, day_low_mult, year_high_mult, year_low_mult) = draws.tolist()
     
     # Create mock technical indicators
     technicals = {
@@ -1158,11 +1588,11 @@ def _get_stock_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer, c
         
         # Technical indicators
         'rsi': round(rsi, 2),
-        'sma_20': round(base_price * random.uniform(0.95, 1.05), 2),
-        'sma_50': round(base_price * random.uniform(0.90, 1.10), 2),
-        'macd': round(random.uniform(-2.0, 2.0), 3),
-        'macd_signal': round(random.uniform(-1.5, 1.5), 3),
-        'macd_histogram': round(random.uniform(-1.0, 1.0), 3),
+        'sma_20': round(base_price * sma_20_mult, 2),
+        'sma_50': round(base_price * sma_50_mult, 2),
+        'macd': round(macd, 3),
+        'macd_signal': round(macd_signal, 3),
+        'macd_histogram': round(macd_histogram, 3),
         
         # Bollinger Bands
         'bollinger_bands': {
@@ -1172,8 +1602,8 @@ def _get_stock_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer, c
         },
         
         # Volume and momentum
-        'volume_avg_10': random.randint(1000000, 50000000),
-        'price_change_pct': round(random.uniform(-5.0, 5.0), 2),
+        'volume_avg_10': int(_mock_np_rng.integers(1000000, 50000000, endpoint=True)),
+        'price_change_pct': round(price_change_pct, 2),
         
         # Generate signals based on indicators
         'signals': _generate_mock_signals(rsi, base_price),
@@ -1181,10 +1611,10 @@ def _get_stock_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer, c
         # Market info
         'market_price': round(base_price, 2),
         'price_range': {
-            'day_high': round(base_price * random.uniform(1.01, 1.05), 2),
-            'day_low': round(base_price * random.uniform(0.95, 0.99), 2),
-            '52_week_high': round(base_price * random.uniform(1.2, 2.0), 2),
-            '52_week_low': round(base_price * random.uniform(0.5, 0.8), 2)
+            'day_high': round(base_price * day_high_mult, 2),
+            'day_low': round(base_price * day_low_mult, 2),
+            '52_week_high': round(base_price * year_high_mult, 2),
+            '52_week_low': round(base_price * year_low_mult, 2)
         }
     }
     
@@ -1207,9 +1637,8 @@ def _generate_mock_signals(rsi: float, price: float) -> List[str]:
                      'VOLUME_SPIKE', 'BREAKOUT_POTENTIAL', 'SUPPORT_LEVEL', 'RESISTANCE_LEVEL']
     
     # Add 1-2 random signals
-    import random
-    num_signals = random.randint(1, 2)
-    additional_signals = random.sample(signal_options, num_signals)
+    num_signals = _mock_rng.randint(1, 2)
+    additional_signals = _mock_rng.sample(signal_options, num_signals)
     signals.extend(additional_signals)
     
     return signals
@@ -1219,7 +1648,6 @@ def _get_option_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer,
     """Get technical analysis for an option symbol."""
     try:
         # Parse option symbol
-        from utils.assignments import extract_option_details
         option_details = extract_option_details(symbol)
         
         if not option_details:
@@ -1230,15 +1658,11 @@ def _get_option_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer,
                 'timestamp': datetime.now().isoformat()
             }
         
-        # Generate mock option data
-        import random
-        from datetime import date
-        
         # Calculate days to expiration
         days_to_expiry = (option_details['expiry'] - date.today()).days
         
         # Mock underlying price (would normally fetch real data)
-        underlying_price = random.uniform(100, 300)
+        underlying_price = _mock_rng.uniform(100, 300)
         strike = option_details['strike']
         is_call = option_details['option_type'] == 'CALL'
         
@@ -1249,15 +1673,15 @@ def _get_option_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer,
             intrinsic_value = max(0, strike - underlying_price)
         
         # Mock time value and premium
-        time_value = random.uniform(0.1, 5.0) * (days_to_expiry / 30.0)  # Decays with time
+        time_value = _mock_rng.uniform(0.1, 5.0) * (days_to_expiry / 30.0)  # Decays with time
         premium = intrinsic_value + time_value
         
         # Mock Greeks (would normally come from Black-Scholes or market data)
-        delta = random.uniform(0.1, 0.9) if is_call else random.uniform(-0.9, -0.1)
-        gamma = random.uniform(0.01, 0.1)
-        theta = random.uniform(-0.1, -0.01)  # Always negative (time decay)
-        vega = random.uniform(0.05, 0.3)
-        rho = random.uniform(0.01, 0.05) if is_call else random.uniform(-0.05, -0.01)
+        delta = _mock_rng.uniform(0.1, 0.9) if is_call else _mock_rng.uniform(-0.9, -0.1)
+        gamma = _mock_rng.uniform(0.01, 0.1)
+        theta = _mock_rng.uniform(-0.1, -0.01)  # Always negative (time decay)
+        vega = _mock_rng.uniform(0.05, 0.3)
+        rho = _mock_rng.uniform(0.01, 0.05) if is_call else _mock_rng.uniform(-0.05, -0.01)
         
         technicals = {
             'symbol': symbol,
@@ -1288,13 +1712,13 @@ def _get_option_technicals_for_symbol(symbol: str, analyzer: TechnicalAnalyzer,
             'rho': round(rho, 4),
             
             # Risk metrics
-            'implied_volatility': round(random.uniform(0.15, 0.60), 4),  # 15-60% IV
-            'open_interest': random.randint(100, 10000),
-            'volume': random.randint(10, 1000),
+            'implied_volatility': round(_mock_rng.uniform(0.15, 0.60), 4),  # 15-60% IV
+            'open_interest': _mock_rng.randint(100, 10000),
+            'volume': _mock_rng.randint(10, 1000),
             
             # Analysis
             'moneyness': 'ITM' if intrinsic_value > 0 else 'OTM',
-            'liquidity': 'HIGH' if random.random() > 0.5 else 'MEDIUM',
+            'liquidity': 'HIGH' if _mock_rng.random() > 0.5 else 'MEDIUM',
             'signals': _generate_mock_option_signals(delta, theta, days_to_expiry, intrinsic_value > 0)
         }
         
@@ -1333,11 +1757,10 @@ def _generate_mock_option_signals(delta: float, theta: float, days_to_expiry: in
         signals.append('OUT_OF_THE_MONEY')
     
     # Random additional signals
-    import random
     additional_signals = ['HIGH_IMPLIED_VOL', 'LOW_IMPLIED_VOL', 'EARNINGS_PLAY', 
                          'TECHNICAL_BREAKOUT', 'VOLUME_SPIKE', 'UNUSUAL_ACTIVITY']
     
-    if random.random() > 0.6:  # 40% chance of additional signal
-        signals.append(random.choice(additional_signals))
+    if _mock_rng.random() > 0.6:  # 40% chance of additional signal
+        signals.append(_mock_rng.choice(additional_signals))
     
     return signals
\ No newline at end of file
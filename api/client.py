@@ -3,17 +3,174 @@
 This module provides the production interface to retrieve live account
 information and positions from Schwab's API.
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+import json
+import logging
+import re
+import threading
 
 try:
     # Try relative imports first (when run as module from parent)
     from ..core.models import AccountSnapshot, StockPosition, OptionPosition, MutualFundPosition
     from ..utils.logging import get_logger
+    from ..utils.io import response_json, response_json_decimal
 except ImportError:
     # Fall back to direct imports (when run from within directory)
     from core.models import AccountSnapshot, StockPosition, OptionPosition, MutualFundPosition
     from utils.logging import get_logger
+    from utils.io import response_json, response_json_decimal
+
+
+# schwabdev clients shared per (app_key, token_path), so every RealBrokerClient
+# in the process reuses one OAuth session and HTTP connection pool
+_SCHWAB_CLIENTS: Dict[Tuple[str, str], Any] = {}
+_SCHWAB_CLIENTS_LOCK = threading.Lock()
+
+# Schwab access tokens expire 30 minutes after they are issued. Shared clients
+# whose built-in schwabdev updater is off get a background thread that
+# refreshes a minute before expiry so polls never hit a 401
+ACCESS_TOKEN_LIFETIME_SECONDS = 30 * 60
+ACCESS_TOKEN_REFRESH_MARGIN_SECONDS = 60
+# Minimum wait between refresh attempts (e.g. after a failed refresh)
+ACCESS_TOKEN_RETRY_SECONDS = 30
+_TOKEN_REFRESH_STOPS: Dict[Tuple[str, str], threading.Event] = {}
+
+# Per-share prices derived from market value are rounded to this precision
+_PRICE_QUANTUM = Decimal("0.0001")
+
+# OCC contract symbol, root padded to 6 chars: "ACHR  251003P00009500" -> strike 9.5
+_OCC_RE = re.compile(r'(?P<root>.{1,6}?) *(?P<yy>\d{2})(?P<mm>\d{2})(?P<dd>\d{2})(?P<pc>[CP])(?P<strike>\d{8})$')
+
+
+def _to_decimal(value) -> Decimal:
+    """Convert a JSON number to Decimal, skipping the str() hop when already exact."""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=512)
+def _parse_expiry(expiry_date: str) -> datetime:
+    """Parse an API expiration date ("2024-01-19" or a full ISO timestamp).
+    
+    Cached since expiries repeat across positions on the same chain.
+    """
+    return datetime.fromisoformat(expiry_date.replace('Z', '+00:00'))
+
+
+def _refresh_access_token(client) -> bool:
+    """Force an access token refresh on a schwabdev client, keeping its session.
+    
+    Returns:
+        False if the client has no token manager to refresh
+    """
+    update_tokens = getattr(getattr(client, 'tokens', None), 'update_tokens', None)
+    if update_tokens is None:
+        return False
+    update_tokens(force_access_token=True)
+    return True
+
+
+def _has_builtin_token_updater(client) -> bool:
+    """Whether schwabdev keeps this client's tokens fresh on its own.
+    
+    schwabdev.Client starts its own token checker thread unless it was built
+    with ``update_tokens_auto=False``.
+    """
+    return getattr(client, 'update_tokens_auto', True) is not False
+
+
+def _seconds_until_token_refresh(client) -> float:
+    """Seconds until the client's access token is due for a refresh.
+    
+    Counted from the token's issue time, so a token loaded from an older
+    tokens file is refreshed before it expires rather than a full lifetime
+    after the client was built.
+    """
+    issued = getattr(getattr(client, 'tokens', None), 'access_token_issued', None)
+    if not isinstance(issued, datetime):
+        return ACCESS_TOKEN_LIFETIME_SECONDS - ACCESS_TOKEN_REFRESH_MARGIN_SECONDS
+    now = datetime.now(timezone.utc) if issued.tzinfo is not None else datetime.now()
+    expires_at = issued + timedelta(seconds=ACCESS_TOKEN_LIFETIME_SECONDS)
+    return max(0.0, (expires_at - now).total_seconds() - ACCESS_TOKEN_REFRESH_MARGIN_SECONDS)
+
+
+def _token_refresh_loop(client, stop: threading.Event) -> None:
+    """Refresh the client's access token shortly before it expires until stopped."""
+    logger = get_logger()
+    wait = _seconds_until_token_refresh(client)
+    while not stop.wait(wait):
+        try:
+            if not _refresh_access_token(client):
+                return
+            logger.debug("Access token refreshed proactively")
+        except Exception as e:
+            # The 401 handler in RealBrokerClient remains the fallback
+            logger.warning(f"Background token refresh failed: {e}")
+        wait = max(_seconds_until_token_refresh(client), ACCESS_TOKEN_RETRY_SECONDS)
+
+
+def _start_token_refresh(key: Tuple[str, str], client) -> None:
+    """Start the background refresher for a shared client, replacing any previous one.
+    
+    Must be called with _SCHWAB_CLIENTS_LOCK held.
+    """
+    previous = _TOKEN_REFRESH_STOPS.pop(key, None)
+    if previous is not None:
+        previous.set()
+    stop = threading.Event()
+    _TOKEN_REFRESH_STOPS[key] = stop
+    threading.Thread(target=_token_refresh_loop, args=(client, stop), daemon=True,
+                     name="schwab-token-refresh").start()
+
+
+def stop_token_refresh(app_key: str, token_path: str) -> None:
+    """Stop the background token refresher for these credentials, if running."""
+    with _SCHWAB_CLIENTS_LOCK:
+        stop = _TOKEN_REFRESH_STOPS.pop((app_key, token_path), None)
+    if stop is not None:
+        stop.set()
+
+
+def _get_or_build_client(app_key: str, app_secret: str, callback_url: str, token_path: str,
+                         rebuild: bool = False):
+    """Return the shared schwabdev client for these credentials, building it once.
+    
+    Args:
+        app_key: Schwab API app key
+        app_secret: Schwab API app secret
+        callback_url: OAuth redirect URI
+        token_path: Path to the OAuth tokens file
+        rebuild: Discard any cached client and construct a new one
+        
+    Returns:
+        schwabdev.Client instance
+    """
+    import schwabdev
+    
+    key = (app_key, token_path)
+    with _SCHWAB_CLIENTS_LOCK:
+        client = None if rebuild else _SCHWAB_CLIENTS.get(key)
+        if client is None:
+            client = schwabdev.Client(
+                app_key=app_key,
+                app_secret=app_secret,
+                callback_url=callback_url,
+                tokens_file=token_path
+            )
+            _SCHWAB_CLIENTS[key] = client
+            if _has_builtin_token_updater(client):
+                # Don't race schwabdev's own checker on the same tokens file
+                previous = _TOKEN_REFRESH_STOPS.pop(key, None)
+                if previous is not None:
+                    previous.set()
+            else:
+                _start_token_refresh(key, client)
+        return client
 
 
 class RealBrokerClient:
@@ -41,17 +198,13 @@ class RealBrokerClient:
         self.token_path = token_path or "tokens.json"
         self.client = None
         self.logger = get_logger()
+        # Account hash never changes for a login, so it is looked up once
+        self._cached_account_hash: Optional[str] = None
         
         # Initialize Schwab client
         if app_key and app_secret:
             try:
-                import schwabdev
-                self.client = schwabdev.Client(
-                    app_key=self.app_key,
-                    app_secret=self.app_secret,
-                    callback_url=self.redirect_uri,
-                    tokens_file=self.token_path
-                )
+                self.client = self._build_client()
                 self.logger.info("✓ Schwab client initialized successfully")
             except ImportError:
                 raise ImportError("schwabdev package is required. Install with: pip install schwabdev")
@@ -59,19 +212,42 @@ class RealBrokerClient:
                 self.logger.warning(f"Could not initialize Schwab client: {e}")
                 self.logger.info("This is normal on first run - authentication will be required.")
 
+    def _build_client(self, rebuild: bool = False):
+        """Get the shared schwabdev client for this account's credentials.
+        
+        Args:
+            rebuild: Construct a new client instead of reusing the cached one
+        """
+        return _get_or_build_client(self.app_key, self.app_secret, self.redirect_uri, self.token_path,
+                                    rebuild=rebuild)
+
+    def close(self) -> None:
+        """Stop the background token refresh for this client's credentials."""
+        stop_token_refresh(self.app_key, self.token_path)
+
+    def _refresh_tokens_in_place(self) -> bool:
+        """Refresh the access token on the existing client, keeping its session.
+        
+        Returns:
+            True if the tokens were refreshed without rebuilding the client
+        """
+        try:
+            return _refresh_access_token(self.client)
+        except Exception as e:
+            self.logger.warning(f"In-place token refresh failed: {e}")
+            return False
+
     def _handle_token_refresh(self):
         """Handle automatic token refresh when authentication fails."""
+        if self.client is not None and self._refresh_tokens_in_place():
+            self.logger.info("✓ Access token refreshed")
+            return
+        
         try:
             self.logger.info("🔄 Re-initializing Schwab client with fresh authentication...")
-            import schwabdev
             
             # Re-create the client - this will trigger the OAuth flow if needed
-            self.client = schwabdev.Client(
-                app_key=self.app_key,
-                app_secret=self.app_secret,
-                callback_url=self.redirect_uri,
-                tokens_file=self.token_path
-            )
+            self.client = self._build_client(rebuild=True)
             self.logger.info("✓ Token refresh completed successfully")
             
         except Exception as e:
@@ -85,13 +261,7 @@ class RealBrokerClient:
                     os.remove(self.token_path)
                     
                     self.logger.info("🔐 Starting fresh authentication...")
-                    import schwabdev
-                    self.client = schwabdev.Client(
-                        app_key=self.app_key,
-                        app_secret=self.app_secret,
-                        callback_url=self.redirect_uri,
-                        tokens_file=self.token_path
-                    )
+                    self.client = self._build_client(rebuild=True)
                     self.logger.info("✓ Fresh authentication completed successfully")
                 else:
                     raise RuntimeError("Token file not found")
@@ -104,221 +274,288 @@ class RealBrokerClient:
                 self.logger.info("3. Ensure your callback_url matches your Schwab app configuration")
                 raise RuntimeError("Automatic token refresh failed - manual setup required")
 
+    @staticmethod
+    def _is_unauthorized(data) -> bool:
+        """Check whether a Schwab response body reports an authentication error."""
+        if not isinstance(data, dict) or 'errors' not in data:
+            return False
+        return any(error.get('status') == 401 or 'Unauthorized' in error.get('title', '')
+                   for error in data['errors'])
+
+    def _get_account_hash(self) -> str:
+        """Return the hash of the first linked account, discovering it on first use.
+        
+        Returns:
+            Account hash value used by the account_details endpoint
+        """
+        if self._cached_account_hash is not None:
+            return self._cached_account_hash
+        
+        self.logger.debug("Fetching account numbers...")
+        accounts_response = self.client.account_linked()
+        accounts_data = response_json(accounts_response)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            self.logger.debug(f"Raw accounts data: {accounts_data}")
+        
+        # Check for authentication errors and handle automatically
+        if self._is_unauthorized(accounts_data):
+            self.logger.warning("Authentication failed - tokens may be expired")
+            self.logger.info("Attempting to re-authenticate...")
+            self._handle_token_refresh()
+            # Retry the request after re-authentication
+            accounts_response = self.client.account_linked()
+            accounts_data = response_json(accounts_response)
+        
+        if debug:
+            self.logger.debug(f"Found {len(accounts_data)} accounts")
+        
+        if not accounts_data:
+            raise RuntimeError("No accounts found")
+        
+        # Use the first account - handle both list and dict formats
+        if isinstance(accounts_data, list):
+            first_account = accounts_data[0]
+        else:
+            # If it's a dict, get the first value
+            first_account = list(accounts_data.values())[0] if accounts_data else {}
+        
+        account_hash = first_account['hashValue']
+        if debug:
+            account_number = first_account.get('accountNumber', 'Unknown')
+            self.logger.debug(f"Using account: {account_number} (hash: {account_hash[:8]}...)")
+        
+        self._cached_account_hash = account_hash
+        return account_hash
+
     def get_account_snapshot(self) -> AccountSnapshot:
         """Fetch real account data from Schwab API using schwabdev."""
         if self.client is None:
             raise RuntimeError("Schwab client not initialized. Please set up API credentials.")
         
         try:
-            self.logger.debug("Fetching account numbers...")
-            accounts_response = self.client.account_linked()
-            accounts_data = accounts_response.json()
-            self.logger.debug(f"Raw accounts data: {accounts_data}")
-            
-            # Check for authentication errors and handle automatically
-            if isinstance(accounts_data, dict) and 'errors' in accounts_data:
-                errors = accounts_data['errors']
-                for error in errors:
-                    if error.get('status') == 401 or 'Unauthorized' in error.get('title', ''):
-                        self.logger.warning("Authentication failed - tokens may be expired")
-                        self.logger.info("Attempting to re-authenticate...")
-                        self._handle_token_refresh()
-                        # Retry the request after re-authentication
-                        accounts_response = self.client.account_linked()
-                        accounts_data = accounts_response.json()
-                        break
-            
-            self.logger.debug(f"Found {len(accounts_data)} accounts")
-            
-            if not accounts_data:
-                raise RuntimeError("No accounts found")
-            
-            # Use the first account - handle both list and dict formats
-            if isinstance(accounts_data, list):
-                first_account = accounts_data[0]
-            else:
-                # If it's a dict, get the first value
-                first_account = list(accounts_data.values())[0] if accounts_data else {}
-            
-            account_hash = first_account['hashValue']
-            account_number = first_account.get('accountNumber', 'Unknown')
-            self.logger.debug(f"Using account: {account_number} (hash: {account_hash[:8]}...)")
+            account_hash = self._get_account_hash()
             
             # Get detailed account info with positions
             self.logger.debug("Fetching account details and positions...")
             account_response = self.client.account_details(account_hash, fields="positions")
-            account_data = account_response.json()
+            account_data = response_json_decimal(account_response)
+            
+            # Expired tokens or a stale hash: re-authenticate, rediscover the account once
+            if self._is_unauthorized(account_data):
+                self.logger.warning("Authentication failed fetching account details - retrying")
+                self._cached_account_hash = None
+                self._handle_token_refresh()
+                account_hash = self._get_account_hash()
+                account_response = self.client.account_details(account_hash, fields="positions")
+                account_data = response_json_decimal(account_response)
             
             # Debug: Log the structure to understand the data
-            self.logger.debug("Account data structure:")
-            if self.logger.isEnabledFor(10):  # DEBUG level
-                self._print_json_structure(account_data)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Account data:\n{json.dumps(account_data, indent=2, default=str)}")
             
-            securities_account = account_data.get('securitiesAccount', {})
+            return self._parse_account_snapshot(account_data)
             
-            # Parse balances
-            balances = securities_account.get('currentBalances', {})
-            cash = Decimal(str(balances.get('cashBalance', 0)))
-            buying_power = Decimal(str(balances.get('buyingPower', 0)))
-            liquidation_value = Decimal(str(balances.get('liquidationValue', 0)))
+        except Exception as e:
+            self.logger.error(f"Error fetching account data: {e}")
+            self.logger.debug(f"Error type: {type(e)}")
+            import traceback
+            self.logger.debug(traceback.format_exc())
+            raise
+    
+    def get_account_snapshots_bulk(self, account_hashes: List[str]) -> Dict[str, AccountSnapshot]:
+        """Fetch snapshots for several accounts with concurrent account_details calls.
+        
+        Args:
+            account_hashes: Account hash values to fetch
             
+        Returns:
+            Dict mapping account hash to its AccountSnapshot
+        """
+        if self.client is None:
+            raise RuntimeError("Schwab client not initialized. Please set up API credentials.")
+        if not account_hashes:
+            return {}
+        
+        def fetch(account_hash: str) -> dict:
+            return response_json_decimal(self.client.account_details(account_hash, fields="positions"))
+        
+        # Requests are network bound, so they overlap on threads like the technicals fetches
+        with ThreadPoolExecutor(max_workers=min(8, len(account_hashes))) as executor:
+            responses = list(executor.map(fetch, account_hashes))
+        
+        if any(self._is_unauthorized(data) for data in responses):
+            self.logger.warning("Authentication failed fetching account details - retrying")
+            self._handle_token_refresh()
+            responses = [fetch(account_hash) if self._is_unauthorized(data) else data
+                         for account_hash, data in zip(account_hashes, responses)]
+        
+        return {account_hash: self._parse_account_snapshot(data)
+                for account_hash, data in zip(account_hashes, responses)}
+    
+    def _parse_account_snapshot(self, account_data: dict) -> AccountSnapshot:
+        """Build an AccountSnapshot from an account_details response body.
+        
+        Args:
+            account_data: Parsed JSON from the account_details endpoint
+            
+        Returns:
+            AccountSnapshot with balances and stock/option/mutual fund positions
+        """
+        securities_account = account_data.get('securitiesAccount', {})
+        
+        # Parse balances
+        balances = securities_account.get('currentBalances', {})
+        cash = _to_decimal(balances.get('cashBalance', 0))
+        buying_power = _to_decimal(balances.get('buyingPower', 0))
+        liquidation_value = _to_decimal(balances.get('liquidationValue', 0))
+        
+        # Snapshots are parsed every poll, so skip debug formatting unless DEBUG is on
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        if debug:
             self.logger.debug(f"Cash: ${cash}")
             self.logger.debug(f"Buying Power: ${buying_power}")
             self.logger.debug(f"Schwab Liquidation Value: ${liquidation_value}")
-            
-            # Parse positions
-            stocks = []
-            options = []
-            mutual_funds = []
-            positions = securities_account.get('positions', [])
-            
+        
+        # Parse positions
+        stocks = []
+        options = []
+        mutual_funds = []
+        positions = securities_account.get('positions', [])
+        # Asset type -> (position parser, append to the list it is collected into).
+        # Bound methods and helpers are hoisted into locals for the per-position loop.
+        get_parser = {
+            'EQUITY': (self._parse_equity_position, stocks.append),
+            'OPTION': (self._parse_option_position, options.append),
+            'MUTUAL_FUND': (self._parse_mutual_fund_position, mutual_funds.append),
+        }.get
+        to_decimal = _to_decimal
+        
+        if debug:
             self.logger.debug(f"Found {len(positions)} positions")
-            
-            for i, position in enumerate(positions):
+        
+        for i, position in enumerate(positions):
+            if debug:
                 self.logger.debug(f"\nPosition {i+1}:")
                 self.logger.debug(f"  Raw position data: {position}")
-                
-                instrument = position.get('instrument', {})
-                long_qty = float(position.get('longQuantity', 0))
-                short_qty = float(position.get('shortQuantity', 0))
-                qty = long_qty - short_qty
-                
-                if qty == 0:
-                    continue
-                
-                asset_type = instrument.get('assetType', '')
-                symbol = instrument.get('symbol', '')
-                
-                avg_cost = Decimal(str(position.get('averagePrice', 0)))
-                market_value = Decimal(str(position.get('marketValue', 0)))
-                # For options, market_value is the total value for all contracts
-                # Options are quoted per share, but contracts represent 100 shares
-                # So we need to divide market_value by (quantity * 100) to get per-share price
-                if asset_type == 'OPTION':
-                    market_price = Decimal(str(abs(float(market_value)) / (abs(float(qty)) * 100) if qty != 0 else 0))
-                else:
-                    market_price = Decimal(str(abs(float(market_value)) / abs(float(qty)) if qty != 0 else 0))
-                
+            
+            get = position.get
+            instrument = get('instrument', {})
+            long_qty = to_decimal(get('longQuantity', 0))
+            short_qty = to_decimal(get('shortQuantity', 0))
+            qty = long_qty - short_qty
+            
+            if qty == 0:
+                continue
+            
+            asset_type = instrument.get('assetType', '')
+            symbol = instrument.get('symbol', '')
+            
+            avg_cost = to_decimal(get('averagePrice', 0))
+            market_value = to_decimal(get('marketValue', 0))
+            # For options, market_value is the total value for all contracts
+            # Options are quoted per share, but contracts represent 100 shares
+            # So we need to divide market_value by (quantity * 100) to get per-share price
+            shares = abs(qty) * 100 if asset_type == 'OPTION' else abs(qty)
+            market_price = abs(market_value) / shares
+            if market_price.as_tuple().exponent < -4:
+                # Non-terminating quotients would otherwise carry 28 digits
+                market_price = market_price.quantize(_PRICE_QUANTUM)
+            
+            if debug:
                 self.logger.debug(f"  Symbol: {symbol}")
                 self.logger.debug(f"  Asset Type: {asset_type}")
                 self.logger.debug(f"  Quantity: {qty}")
                 self.logger.debug(f"  Avg Cost: ${avg_cost}")
                 self.logger.debug(f"  Market Price: ${market_price}")
                 self.logger.debug(f"  Market Value: ${market_value}")
-                
-                if asset_type == 'EQUITY':
-                    stocks.append(StockPosition(
-                        symbol=symbol,
-                        qty=int(qty),
-                        avg_cost=avg_cost,
-                        market_price=market_price
-                    ))
-                elif asset_type == 'OPTION':
-                    # Parse option details
-                    underlying_symbol = instrument.get('underlyingSymbol', symbol.split('_')[0] if '_' in symbol else symbol)
-                    strike_price = Decimal(str(instrument.get('strikePrice', 0)))
-                    
-                    # If strike price is 0, try to parse from contract symbol
-                    if strike_price == 0 and len(symbol) >= 15:
-                        try:
-                            # Contract format: SYMBOL YYMMDDCPPPPPPPPP where P is strike * 1000
-                            # Example: "ACHR  251003P00009500" -> strike = 9.5
-                            strike_part = symbol[-8:]  # Last 8 characters
-                            strike_price = Decimal(str(int(strike_part) / 1000.0))
-                            self.logger.debug(f"  Parsed strike from contract symbol: {strike_price}")
-                        except (ValueError, IndexError):
-                            self.logger.warning(f"  Could not parse strike price from symbol: {symbol}")
-                            strike_price = Decimal('0')
-                    
-                    expiry_date = instrument.get('expirationDate', '')
-                    put_call = instrument.get('putCall', 'C')
-                    
-                    # If put_call is empty, try to parse from contract symbol
-                    if not put_call and len(symbol) >= 15:
-                        try:
-                            # Put/Call is the character before the strike price (position -9)
-                            put_call = symbol[-9].upper()
-                            self.logger.debug(f"  Parsed put/call from contract symbol: {put_call}")
-                        except IndexError:
-                            put_call = 'C'  # Default to Call
-                    
-                    try:
-                        if expiry_date:
-                            # Handle different date formats from API
-                            if 'T' in expiry_date:
-                                expiry = datetime.fromisoformat(expiry_date.replace('Z', '+00:00'))
-                            else:
-                                # Assume it's a date string like "2024-01-19"
-                                expiry = datetime.strptime(expiry_date, "%Y-%m-%d")
-                        else:
-                            # No expiry date from API, parse from contract symbol
-                            # Contract format: SYMBOL  YYMMDDCXXXXXXXX or SYMBOL  YYMMDDPXXXXXXXX
-                            # Date is in positions 6-11 (YYMMDD)
-                            if len(symbol) >= 12:
-                                date_part = symbol[6:12]
-                                expiry = datetime.strptime(date_part, '%y%m%d')
-                                self.logger.debug(f"  Parsed expiry from contract symbol: {expiry.strftime('%Y-%m-%d')}")
-                            else:
-                                raise ValueError("Contract symbol too short to parse expiry")
-                    except (ValueError, TypeError) as e:
-                        self.logger.warning(f"  Could not parse expiry date: {e}")
-                        expiry = datetime.utcnow() + timedelta(days=30)  # Default fallback
-                    
-                    options.append(OptionPosition(
-                        symbol=underlying_symbol,
-                        contract_symbol=symbol,
-                        qty=int(qty),
-                        avg_cost=avg_cost,
-                        market_price=market_price,
-                        strike=strike_price,
-                        expiry=expiry,
-                        put_call=put_call
-                    ))
-                elif asset_type == 'MUTUAL_FUND':
-                    # Handle mutual funds (like money market funds)
-                    description = instrument.get('description', '')
-                    mutual_funds.append(MutualFundPosition(
-                        symbol=symbol,
-                        qty=int(qty),
-                        avg_cost=avg_cost,
-                        market_price=market_price,
-                        description=description
-                    ))
-            
-            self.logger.info(f"Processed {len(stocks)} stock positions, {len(options)} option positions, and {len(mutual_funds)} mutual fund positions")
-            
-            return AccountSnapshot(
-                generated_at=datetime.utcnow(),
-                cash=cash,
-                buying_power=buying_power,
-                stocks=stocks,
-                options=options,
-                mutual_funds=mutual_funds,
-                official_liquidation_value=liquidation_value
-            )
-            
-        except Exception as e:
-            self.logger.error(f"Error fetching account data: {e}")
-            self.logger.debug(f"Error type: {type(e)}")
-            import traceback
-            self.logger.debug(traceback.format_exc())
-            raise
-    
-    def _print_json_structure(self, obj, indent=0, max_depth=3):
-        """Helper to log JSON structure for debugging."""
-        if indent > max_depth:
-            self.logger.debug("  " * indent + "...")
-            return
             
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                if isinstance(value, (dict, list)):
-                    self.logger.debug("  " * indent + f"{key}: {type(value).__name__}")
-                    self._print_json_structure(value, indent + 1, max_depth)
+            parser = get_parser(asset_type)
+            if parser is not None:
+                handler, append = parser
+                append(handler(instrument, symbol, int(qty), avg_cost, market_price, debug))
+        
+        self.logger.info(f"Processed {len(stocks)} stock positions, {len(options)} option positions, and {len(mutual_funds)} mutual fund positions")
+        
+        return AccountSnapshot(
+            generated_at=datetime.utcnow(),
+            cash=cash,
+            buying_power=buying_power,
+            stocks=stocks,
+            options=options,
+            mutual_funds=mutual_funds,
+            official_liquidation_value=liquidation_value
+        )
+
+    def _parse_equity_position(self, instrument: dict, symbol: str, qty: int, avg_cost: Decimal,
+                               market_price: Decimal, debug: bool = False) -> StockPosition:
+        """Build a StockPosition from an EQUITY position entry."""
+        return StockPosition(
+            symbol=symbol,
+            qty=qty,
+            avg_cost=avg_cost,
+            market_price=market_price
+        )
+
+    def _parse_option_position(self, instrument: dict, symbol: str, qty: int, avg_cost: Decimal,
+                               market_price: Decimal, debug: bool = False) -> OptionPosition:
+        """Build an OptionPosition, filling missing fields from the contract symbol."""
+        # Parse option details
+        underlying_symbol = instrument.get('underlyingSymbol', symbol.split('_')[0] if '_' in symbol else symbol)
+        strike_price = _to_decimal(instrument.get('strikePrice', 0))
+        expiry_date = instrument.get('expirationDate', '')
+        put_call = instrument.get('putCall', 'C')
+        
+        # Fill in any missing fields from the contract symbol, matched once
+        occ = _OCC_RE.match(symbol) if strike_price == 0 or not put_call or not expiry_date else None
+        
+        if strike_price == 0:
+            if occ:
+                # Strike is stored as price * 1000
+                strike_price = Decimal(occ['strike']) / 1000
+                if debug:
+                    self.logger.debug(f"  Parsed strike from contract symbol: {strike_price}")
+            elif len(symbol) >= 15:
+                self.logger.warning(f"  Could not parse strike price from symbol: {symbol}")
+        
+        if not put_call:
+            put_call = occ['pc'] if occ else 'C'  # Default to Call
+            if debug:
+                self.logger.debug(f"  Parsed put/call from contract symbol: {put_call}")
+        
+        try:
+            if expiry_date:
+                expiry = _parse_expiry(expiry_date)
+            else:
+                # No expiry date from API, parse YYMMDD from contract symbol
+                if occ:
+                    expiry = datetime(2000 + int(occ['yy']), int(occ['mm']), int(occ['dd']))
+                    if debug:
+                        self.logger.debug(f"  Parsed expiry from contract symbol: {expiry.strftime('%Y-%m-%d')}")
                 else:
-                    self.logger.debug("  " * indent + f"{key}: {value}")
-        elif isinstance(obj, list):
-            self.logger.debug("  " * indent + f"List with {len(obj)} items")
-            if obj and indent < max_depth:
-                self.logger.debug("  " * indent + "First item:")
-                self._print_json_structure(obj[0], indent + 1, max_depth)
+                    raise ValueError(f"Could not parse expiry from contract symbol: {symbol}")
+        except (ValueError, TypeError) as e:
+            self.logger.warning(f"  Could not parse expiry date: {e}")
+            expiry = datetime.utcnow() + timedelta(days=30)  # Default fallback
+        
+        return OptionPosition(
+            symbol=underlying_symbol,
+            contract_symbol=symbol,
+            qty=qty,
+            avg_cost=avg_cost,
+            market_price=market_price,
+            strike=strike_price,
+            expiry=expiry,
+            put_call=put_call
+        )
+
+    def _parse_mutual_fund_position(self, instrument: dict, symbol: str, qty: int, avg_cost: Decimal,
+                                    market_price: Decimal, debug: bool = False) -> MutualFundPosition:
+        """Build a MutualFundPosition (e.g. money market funds) from a MUTUAL_FUND entry."""
+        return MutualFundPosition(
+            symbol=symbol,
+            qty=qty,
+            avg_cost=avg_cost,
+            market_price=market_price,
+            description=instrument.get('description', '')
+        )
@@ -1,5 +1,5 @@
 """Simulated broker client for development and testing."""
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from decimal import Decimal
 
@@ -11,45 +11,52 @@ except ImportError:
     from core.models import AccountSnapshot, StockPosition, OptionPosition, MutualFundPosition
 
 
-@dataclass
+# Positions are immutable, so they are built once at import; only the option
+# expiries (relative to "now") are refreshed per snapshot.
+_SIM_STOCKS = (
+    StockPosition(symbol="AAPL", qty=100, avg_cost=Decimal("150.00"), market_price=Decimal("180.50")),
+    StockPosition(symbol="INTC", qty=200, avg_cost=Decimal("30.00"), market_price=Decimal("35.10")),
+)
+_SIM_OPTIONS = (
+    OptionPosition(
+        symbol="AAPL",
+        contract_symbol="250930C00180000",
+        qty=-2,
+        avg_cost=Decimal("2.50"),
+        market_price=Decimal("1.75"),
+        strike=Decimal("180.00"),
+        expiry=datetime.min,
+        put_call="C",
+    ),
+    OptionPosition(
+        symbol="INTC",
+        contract_symbol="250930P00035000",
+        qty=-1,
+        avg_cost=Decimal("3.00"),
+        market_price=Decimal("2.25"),
+        strike=Decimal("35.00"),
+        expiry=datetime.min,
+        put_call="P",
+    ),
+)
+_SIM_CASH = Decimal("100000.00")
+_SIM_BUYING_POWER = Decimal("250000.00")
+
+
+@dataclass(frozen=True, slots=True)
 class SimBrokerClient:
     """A deterministic simulator used for development and tests."""
 
     def get_account_snapshot(self) -> AccountSnapshot:
         """Return simulated account data for testing purposes."""
         now = datetime.utcnow()
-        stocks = [
-            StockPosition(symbol="AAPL", qty=100, avg_cost=Decimal("150.00"), market_price=Decimal("180.50")),
-            StockPosition(symbol="INTC", qty=200, avg_cost=Decimal("30.00"), market_price=Decimal("35.10")),
-        ]
-        options = [
-            OptionPosition(
-                symbol="AAPL",
-                contract_symbol="250930C00180000",
-                qty=-2,
-                avg_cost=Decimal("2.50"),
-                market_price=Decimal("1.75"),
-                strike=Decimal("180.00"),
-                expiry=now + timedelta(days=10),
-                put_call="C",
-            ),
-            OptionPosition(
-                symbol="INTC",
-                contract_symbol="250930P00035000",
-                qty=-1,
-                avg_cost=Decimal("3.00"),
-                market_price=Decimal("2.25"),
-                strike=Decimal("35.00"),
-                expiry=now + timedelta(days=10),
-                put_call="P",
-            ),
-        ]
+        expiry = now + timedelta(days=10)
         return AccountSnapshot(
             generated_at=now,
-            cash=Decimal("100000.00"),
-            buying_power=Decimal("250000.00"),
-            stocks=stocks,
-            options=options,
+            cash=_SIM_CASH,
+            buying_power=_SIM_BUYING_POWER,
+            stocks=list(_SIM_STOCKS),
+            options=[replace(option, expiry=expiry) for option in _SIM_OPTIONS],
             mutual_funds=[],
             official_liquidation_value=None,
-        )
\ No newline at end of file
+        )
@@ -1,4 +1,7 @@
 """Live trading monitor configuration."""
+from dataclasses import dataclass, field, fields
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 
 # ========================================
 # WATCHLIST CONFIGURATION
@@ -163,4 +166,53 @@ ENABLE_TECHNICAL_BREAKOUT_ALERTS = True
 
 
 # You can switch which watchlist to use by changing this
-ACTIVE_WATCHLIST = WATCHLIST_STOCKS  # Change to GROWTH_STOCKS, VALUE_STOCKS, etc.
\ No newline at end of file
+ACTIVE_WATCHLIST = WATCHLIST_STOCKS  # Change to GROWTH_STOCKS, VALUE_STOCKS, etc.
+
+
+# ========================================
+# READ-ONLY RANKING VIEW
+# ========================================
+
+@dataclass(frozen=True, slots=True)
+class RankingSettings:
+    """Immutable view of the ranking constants above.
+    
+    Scoring loops bind one instance to a local and read slots instead of
+    probing the settings module with getattr for every symbol. Each field
+    mirrors the upper-cased module constant; the defaults match the ones
+    the ranker used when a constant is missing.
+    """
+    put_ranking_weights: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+    call_ranking_weights: Mapping[str, float] = field(default_factory=lambda: MappingProxyType({}))
+    put_rsi_excellent: Tuple[float, float] = (30, 45)
+    put_rsi_good: Tuple[float, float] = (25, 55)
+    put_rsi_fair: Tuple[float, float] = (20, 60)
+    call_rsi_excellent: Tuple[float, float] = (65, 75)
+    call_rsi_good: Tuple[float, float] = (60, 80)
+    call_rsi_fair: Tuple[float, float] = (55, 85)
+    stability_excellent: float = 1.0
+    stability_good: float = 2.0
+    stability_fair: float = 3.5
+    stability_poor: float = 5.0
+    volume_excellent: Tuple[float, float] = (0.8, 2.0)
+    volume_good: Tuple[float, float] = (0.5, 3.0)
+    rank_excellent: float = 80
+    rank_good: float = 65
+    rank_fair: float = 50
+    rank_poor: float = 35
+    min_ranking_score: float = 35
+    max_put_rankings: int = 5
+    max_call_rankings: int = 5
+    show_ranking_breakdown: bool = True
+
+    @classmethod
+    def from_namespace(cls, namespace: Mapping[str, Any]) -> "RankingSettings":
+        """Build from a settings namespace such as ``vars(settings_module)``."""
+        values = {f.name: namespace[f.name.upper()] for f in fields(cls) if f.name.upper() in namespace}
+        for name in ('put_ranking_weights', 'call_ranking_weights'):
+            if name in values:
+                values[name] = MappingProxyType(dict(values[name]))
+        return cls(**values)
+
+
+RANKING_SETTINGS = RankingSettings.from_namespace(globals())
@@ -1,27 +1,36 @@
-"""Data models for account snapshot and positions."""
-from dataclasses import dataclass, asdict
+"""Data models for account snapshot and positions.
+
+Positions are immutable snapshots of broker data, so their derived values
+(market value, P&L) are computed once at construction instead of on every
+access.
+"""
+from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from typing import List, Optional
 
 
-@dataclass
+def _derived():
+    """Field computed in ``__post_init__``; excluded from init, repr and equality."""
+    return field(init=False, repr=False, compare=False)
+
+
+@dataclass(frozen=True, slots=True)
 class StockPosition:
     symbol: str
     qty: int
     avg_cost: Decimal
     market_price: Decimal
+    market_value: Decimal = _derived()
+    pnl: Decimal = _derived()
 
-    @property
-    def market_value(self) -> Decimal:
-        return Decimal(self.qty) * self.market_price
-
-    @property
-    def pnl(self) -> Decimal:
-        return Decimal(self.qty) * (self.market_price - self.avg_cost)
+    def __post_init__(self):
+        qty = Decimal(self.qty)
+        object.__setattr__(self, 'market_value', qty * self.market_price)
+        object.__setattr__(self, 'pnl', qty * (self.market_price - self.avg_cost))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OptionPosition:
     symbol: str  # underlying
     contract_symbol: str
@@ -31,39 +40,36 @@ class OptionPosition:
     strike: Decimal
     expiry: datetime
     put_call: str  # 'P' or 'C'
+    market_value: Decimal = _derived()
+    pnl: Decimal = _derived()
+    # Total P&L for the entire option position (qty * 100 * per-share P&L)
+    total_pnl: Decimal = _derived()
 
-    @property
-    def market_value(self) -> Decimal:
-        return Decimal(self.qty) * self.market_price
+    def __post_init__(self):
+        qty = Decimal(self.qty)
+        pnl = qty * (self.market_price - self.avg_cost)
+        object.__setattr__(self, 'market_value', qty * self.market_price)
+        object.__setattr__(self, 'pnl', pnl)
+        object.__setattr__(self, 'total_pnl', pnl * 100)
 
-    @property
-    def pnl(self) -> Decimal:
-        return Decimal(self.qty) * (self.market_price - self.avg_cost)
-    
-    @property
-    def total_pnl(self) -> Decimal:
-        """Total P&L for the entire option position (qty * 100 * per-share P&L)"""
-        return Decimal(self.qty) * (self.market_price - self.avg_cost) * 100
 
-
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MutualFundPosition:
     symbol: str
     qty: int
     avg_cost: Decimal
     market_price: Decimal
     description: Optional[str] = None
+    market_value: Decimal = _derived()
+    pnl: Decimal = _derived()
 
-    @property
-    def market_value(self) -> Decimal:
-        return Decimal(self.qty) * self.market_price
-
-    @property
-    def pnl(self) -> Decimal:
-        return Decimal(self.qty) * (self.market_price - self.avg_cost)
+    def __post_init__(self):
+        qty = Decimal(self.qty)
+        object.__setattr__(self, 'market_value', qty * self.market_price)
+        object.__setattr__(self, 'pnl', qty * (self.market_price - self.avg_cost))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AccountSnapshot:
     generated_at: datetime
     cash: Decimal
@@ -74,4 +80,29 @@ class AccountSnapshot:
     official_liquidation_value: Optional[Decimal] = None
 
     def to_dict(self):
-        return asdict(self)
+        """Plain-dict view of the snapshot, keeping Decimal and datetime values as-is.
+
+        Built directly rather than with ``dataclasses.asdict``, which recurses and
+        deep-copies every field of every position.
+        """
+        return {
+            'generated_at': self.generated_at,
+            'cash': self.cash,
+            'buying_power': self.buying_power,
+            'stocks': [
+                {'symbol': p.symbol, 'qty': p.qty, 'avg_cost': p.avg_cost, 'market_price': p.market_price}
+                for p in self.stocks
+            ],
+            'options': [
+                {'symbol': p.symbol, 'contract_symbol': p.contract_symbol, 'qty': p.qty,
+                 'avg_cost': p.avg_cost, 'market_price': p.market_price, 'strike': p.strike,
+                 'expiry': p.expiry, 'put_call': p.put_call}
+                for p in self.options
+            ],
+            'mutual_funds': [
+                {'symbol': p.symbol, 'qty': p.qty, 'avg_cost': p.avg_cost, 'market_price': p.market_price,
+                 'description': p.description}
+                for p in self.mutual_funds
+            ],
+            'official_liquidation_value': self.official_liquidation_value,
+        }
@@ -1,4 +1,7 @@
 """Simple orchestrator for v2 to capture a consistent account snapshot."""
+import csv
+import heapq
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from decimal import Decimal
@@ -19,16 +22,39 @@ except ImportError:
     from utils.db_utils import AssignmentDB
 
 
-def run_once(client, out_dir: Path | None = None, include_technicals: bool = False, check_assignments: bool = True):
+# P&L marker indexed by ``pnl >= 0``
+_PNL_COLOR = ("🔴", "🟢")
+
+# Bytes read from the end of the history CSV; comfortably more than five rows
+_HISTORY_TAIL_BYTES = 4096
+
+# Assignment database shared across run_once calls so the schema setup runs once per process
+_ASSIGNMENT_DB: AssignmentDB | None = None
+
+
+def _get_assignment_db() -> AssignmentDB:
+    """Return the process-wide assignment database, creating it on first use."""
+    global _ASSIGNMENT_DB
+    if _ASSIGNMENT_DB is None:
+        _ASSIGNMENT_DB = AssignmentDB()
+    return _ASSIGNMENT_DB
+
+
+def run_once(client, out_dir: Path | None = None, include_technicals: bool = False, check_assignments: bool = True,
+             emit_json: bool = True, db: AssignmentDB | None = None, show_positions: bool = True):
     logger = get_logger()
     out_dir = out_dir or Path("./data/account")
     out_dir = Path(out_dir)
     snapshot = client.get_account_snapshot()
+    # Format the snapshot time once for the summary, history CSV and JSON payload
+    generated_iso = snapshot.generated_at.isoformat()
+    generated_date, generated_time = snapshot.generated_at.strftime('%Y-%m-%d %H:%M:%S').split(' ')
     
     # Check for new option assignments
     if check_assignments:
         try:
-            db = AssignmentDB()
+            if db is None:
+                db = _get_assignment_db()
             new_assignments = fetch_and_record_assignments(client, db, lookback_days=3)
             if new_assignments:
                 logger.warning(f"🚨 {len(new_assignments)} NEW OPTION ASSIGNMENTS DETECTED:")
@@ -39,10 +65,23 @@ def run_once(client, out_dir: Path | None = None, include_technicals: bool = Fal
             logger.error(f"Assignment check failed: {e}")
             # Don't fail the main process for assignment check errors
     
-    # Calculate total account value
-    total_stock_value = sum(s.market_value for s in snapshot.stocks)
-    total_option_value = sum(o.market_value for o in snapshot.options)
-    total_mutual_fund_value = sum(m.market_value for m in snapshot.mutual_funds)
+    # Calculate position totals and short-put collateral in one pass per list
+    total_stock_value = Decimal("0")
+    for stock in snapshot.stocks:
+        total_stock_value += stock.market_value
+
+    total_option_value = Decimal("0")
+    cash_secured_put_collateral = Decimal("0.00")
+    for option in snapshot.options:
+        total_option_value += option.market_value
+        if option.qty < 0 and option.put_call.upper() == 'PUT':  # Short puts
+            # Collateral = abs(qty) * strike * 100 (contract multiplier)
+            cash_secured_put_collateral += abs(option.qty) * option.strike * 100
+
+    total_mutual_fund_value = Decimal("0")
+    for fund in snapshot.mutual_funds:
+        total_mutual_fund_value += fund.market_value
+
     calculated_value = snapshot.cash + total_stock_value + total_option_value + total_mutual_fund_value
     
     # Use official liquidation value if available (more accurate for margin accounts)
@@ -52,25 +91,18 @@ def run_once(client, out_dir: Path | None = None, include_technicals: bool = Fal
     # Cash balance = mutual fund value
     adjusted_cash_balance = total_mutual_fund_value
     
-    # Calculate cash secured put options collateral (short puts)
-    cash_secured_put_collateral = Decimal("0.00")
-    for option in snapshot.options:
-        if option.put_call.upper() == 'PUT' and option.qty < 0:  # Short puts
-            # Collateral = abs(qty) * strike * 100 (contract multiplier)
-            collateral = abs(option.qty) * option.strike * 100
-            cash_secured_put_collateral += collateral
-    
     # Buying power = API buying power + cash balance - cash secured put collateral
     adjusted_buying_power = snapshot.buying_power + adjusted_cash_balance - cash_secured_put_collateral
     
     # Debug output for calculations
-    logger.warning("🔍 CASH/BUYING POWER DEBUG:")
-    logger.warning(f"   Raw API Cash: ${snapshot.cash:,.2f}")
-    logger.warning(f"   Raw API Buying Power: ${snapshot.buying_power:,.2f}")
-    logger.warning(f"   Mutual Fund Value: ${total_mutual_fund_value:,.2f}")
-    logger.warning(f"   Cash Secured Put Collateral: ${cash_secured_put_collateral:,.2f}")
-    logger.warning(f"   → Adjusted Cash Balance: ${adjusted_cash_balance:,.2f}")
-    logger.warning(f"   → Adjusted Buying Power: ${adjusted_buying_power:,.2f}")
+    if logger.isEnabledFor(30):  # WARNING level
+        logger.warning("🔍 CASH/BUYING POWER DEBUG:")
+        logger.warning(f"   Raw API Cash: ${snapshot.cash:,.2f}")
+        logger.warning(f"   Raw API Buying Power: ${snapshot.buying_power:,.2f}")
+        logger.warning(f"   Mutual Fund Value: ${total_mutual_fund_value:,.2f}")
+        logger.warning(f"   Cash Secured Put Collateral: ${cash_secured_put_collateral:,.2f}")
+        logger.warning(f"   → Adjusted Cash Balance: ${adjusted_cash_balance:,.2f}")
+        logger.warning(f"   → Adjusted Buying Power: ${adjusted_buying_power:,.2f}")
     
     # Show essential info for quiet mode
     if logger.getEffectiveLevel() >= 40:  # ERROR level (quiet mode)
@@ -78,12 +110,12 @@ def run_once(client, out_dir: Path | None = None, include_technicals: bool = Fal
         logger.error(f"💰 Total Account Value: ${total_account_value:,.2f}")
         logger.error(f"💵 Cash Balance: ${adjusted_cash_balance:,.2f}")
         logger.error(f"💳 Buying Power: ${adjusted_buying_power:,.2f}")
-    else:
+    elif logger.isEnabledFor(20):  # INFO level; skip all formatting when nothing would be shown
         # Full display for normal and verbose modes
         logger.info("\n" + "="*60)
         logger.info("📊 ACCOUNT SNAPSHOT SUMMARY")
         logger.info("="*60)
-        logger.info(f"Generated: {snapshot.generated_at.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info(f"Generated: {generated_date} {generated_time}")
         logger.info(f"💰 Cash Balance: ${adjusted_cash_balance:,.2f}")
         logger.info(f"💳 Buying Power: ${adjusted_buying_power:,.2f}")
         logger.info(f"📈 Total Stock Value: ${total_stock_value:,.2f}")
@@ -93,7 +125,7 @@ def run_once(client, out_dir: Path | None = None, include_technicals: bool = Fal
         # Show account value calculation details
         if snapshot.official_liquidation_value is not None:
             logger.info(f"🏦 TOTAL ACCOUNT VALUE: ${total_account_value:,.2f} (Schwab Official)")
-            if abs(calculated_value - total_account_value) > 0.01:
+            if logger.isEnabledFor(10) and abs(calculated_value - total_account_value) > 0.01:
                 logger.debug(f"📊 Calculated Value: ${calculated_value:,.2f} (positions sum)")
                 diff = calculated_value - total_account_value
                 logger.debug(f"⚖️  Difference: ${diff:,.2f} (likely margin borrowing)")
@@ -106,31 +138,37 @@ def run_once(client, out_dir: Path | None = None, include_technicals: bool = Fal
         logger.info(f"   Options: {len(snapshot.options)} positions")
         logger.info(f"   Mutual Funds: {len(snapshot.mutual_funds)} positions")
     
-        # Show detailed positions only in normal/verbose mode
-        if snapshot.stocks:
-            logger.info(f"\n🔝 TOP STOCK POSITIONS:")
-            sorted_stocks = sorted(snapshot.stocks, key=lambda x: abs(x.market_value), reverse=True)[:5]
+        # Show detailed positions only in normal/verbose mode; each section is
+        # emitted as one log record rather than one per position. The live
+        # monitor passes show_positions=False to keep stock holdings out of
+        # its cycle output.
+        if show_positions and snapshot.stocks:
+            lines = [f"\n🔝 TOP STOCK POSITIONS:"]
+            sorted_stocks = heapq.nlargest(5, snapshot.stocks, key=lambda x: abs(x.market_value))
             for i, stock in enumerate(sorted_stocks, 1):
-                pnl_color = "🟢" if stock.pnl >= 0 else "🔴"
-                logger.info(f"   {i}. {stock.symbol}: {stock.qty} shares @ ${stock.market_price:.2f} = ${stock.market_value:,.2f} {pnl_color} P&L: ${stock.pnl:,.2f}")
+                pnl_color = _PNL_COLOR[stock.pnl >= 0]
+                lines.append(f"   {i}. {stock.symbol}: {stock.qty} shares @ ${stock.market_price:.2f} = ${stock.market_value:,.2f} {pnl_color} P&L: ${stock.pnl:,.2f}")
+            logger.info("\n".join(lines))
         
         if snapshot.options:
-            logger.info(f"\n📊 OPTION POSITIONS:")
+            lines = [f"\n📊 OPTION POSITIONS:"]
             for option in snapshot.options:
-                pnl_color = "🟢" if option.pnl >= 0 else "🔴"
-                logger.info(f"   {option.contract_symbol}: {option.qty} contracts @ ${option.market_price:.2f} = ${option.market_value:,.2f} {pnl_color} Total P&L: ${option.total_pnl:,.2f}")
+                pnl_color = _PNL_COLOR[option.pnl >= 0]
+                lines.append(f"   {option.contract_symbol}: {option.qty} contracts @ ${option.market_price:.2f} = ${option.market_value:,.2f} {pnl_color} Total P&L: ${option.total_pnl:,.2f}")
+            logger.info("\n".join(lines))
         
         if snapshot.mutual_funds:
-            logger.info(f"\n💵 MUTUAL FUND POSITIONS:")
+            lines = [f"\n💵 MUTUAL FUND POSITIONS:"]
             for fund in snapshot.mutual_funds:
-                pnl_color = "🟢" if fund.pnl >= 0 else "🔴"
+                pnl_color = _PNL_COLOR[fund.pnl >= 0]
                 description = f" ({fund.description})" if fund.description else ""
-                logger.info(f"   {fund.symbol}{description}: {fund.qty:,.0f} shares @ ${fund.market_price:.2f} = ${fund.market_value:,.2f} {pnl_color} P&L: ${fund.pnl:,.2f}")
+                lines.append(f"   {fund.symbol}{description}: {fund.qty:,.0f} shares @ ${fund.market_price:.2f} = ${fund.market_value:,.2f} {pnl_color} P&L: ${fund.pnl:,.2f}")
+            logger.info("\n".join(lines))
         
         logger.info("="*60)
     
     # Store tracking data
-    _store_account_value_tracking(snapshot.generated_at, total_account_value, out_dir)
+    _store_account_value_tracking(generated_iso, generated_date, generated_time, total_account_value, out_dir)
     
     # Run technical analysis if requested and we have a real client
     technicals_data = None
@@ -147,59 +185,63 @@ def run_once(client, out_dir: Path | None = None, include_technicals: bool = Fal
             logger.warning(f"Technical analysis failed: {e}")
             logger.debug(f"Technical analysis error details: {e}", exc_info=True)
     
-    payload = {
-        "generated_at": snapshot.generated_at.isoformat(),
-        "cash": str(snapshot.cash),
-        "buying_power": str(snapshot.buying_power),
-        "total_account_value": str(total_account_value),
-        "stocks": [
-            {
-                "symbol": s.symbol,
-                "qty": s.qty,
-                "avg_cost": str(s.avg_cost),
-                "market_price": str(s.market_price),
-                "market_value": str(s.market_value),
-                "pnl": str(s.pnl),
-            }
-            for s in snapshot.stocks
-        ],
-        "options": [
-            {
-                "symbol": o.symbol,
-                "contract_symbol": o.contract_symbol,
-                "qty": o.qty,
-                "avg_cost": str(o.avg_cost),
-                "market_price": str(o.market_price),
-                "market_value": str(o.market_value),
-                "pnl": str(o.pnl),
-                "total_pnl": str(o.total_pnl),
-                "strike": str(o.strike),
-                "expiry": o.expiry.isoformat(),
-                "put_call": o.put_call,
-            }
-            for o in snapshot.options
-        ],
-        "mutual_funds": [
-            {
-                "symbol": m.symbol,
-                "qty": m.qty,
-                "avg_cost": str(m.avg_cost),
-                "market_price": str(m.market_price),
-                "market_value": str(m.market_value),
-                "pnl": str(m.pnl),
-                "description": m.description,
-            }
-            for m in snapshot.mutual_funds
-        ],
-    }
-    
-    # Add technical analysis data if available
-    if technicals_data:
-        payload["technicals"] = technicals_data
-    
-    out_dir.mkdir(parents=True, exist_ok=True)
-    output_file = out_dir / "account_snapshot.json"
-    safe_write_json(output_file, payload)
+    # Build and write the JSON snapshot unless the caller only needs the returned values
+    payload = None
+    output_file = None
+    if emit_json:
+        payload = {
+            "generated_at": generated_iso,
+            "cash": str(snapshot.cash),
+            "buying_power": str(snapshot.buying_power),
+            "total_account_value": str(total_account_value),
+            "stocks": [
+                {
+                    "symbol": s.symbol,
+                    "qty": s.qty,
+                    "avg_cost": str(s.avg_cost),
+                    "market_price": str(s.market_price),
+                    "market_value": str(s.market_value),
+                    "pnl": str(s.pnl),
+                }
+                for s in snapshot.stocks
+            ],
+            "options": [
+                {
+                    "symbol": o.symbol,
+                    "contract_symbol": o.contract_symbol,
+                    "qty": o.qty,
+                    "avg_cost": str(o.avg_cost),
+                    "market_price": str(o.market_price),
+                    "market_value": str(o.market_value),
+                    "pnl": str(o.pnl),
+                    "total_pnl": str(o.total_pnl),
+                    "strike": str(o.strike),
+                    "expiry": o.expiry.isoformat(),
+                    "put_call": o.put_call,
+                }
+                for o in snapshot.options
+            ],
+            "mutual_funds": [
+                {
+                    "symbol": m.symbol,
+                    "qty": m.qty,
+                    "avg_cost": str(m.avg_cost),
+                    "market_price": str(m.market_price),
+                    "market_value": str(m.market_value),
+                    "pnl": str(m.pnl),
+                    "description": m.description,
+                }
+                for m in snapshot.mutual_funds
+            ],
+        }
+        
+        # Add technical analysis data if available
+        if technicals_data:
+            payload["technicals"] = technicals_data
+        
+        out_dir.mkdir(parents=True, exist_ok=True)
+        output_file = out_dir / "account_snapshot.json"
+        safe_write_json(output_file, payload)
     
     # Return both the data and the file path for programmatic access
     return {
@@ -276,11 +318,8 @@ def _display_technical_summary(technicals_data: dict):
     logger.info("="*60)
 
 
-def _store_account_value_tracking(timestamp, total_value, out_dir: Path):
+def _store_account_value_tracking(timestamp: str, date_str: str, time_str: str, total_value, out_dir: Path):
     """Store account value tracking data in a CSV file."""
-    import csv
-    from decimal import Decimal
-    
     tracking_file = out_dir / "account_value_history.csv"
     
     # Check if file exists, if not create with headers
@@ -294,10 +333,10 @@ def _store_account_value_tracking(timestamp, total_value, out_dir: Path):
         
         # Write the current data
         writer.writerow([
-            timestamp.isoformat(),
+            timestamp,
             f"{total_value:.2f}",
-            timestamp.strftime('%Y-%m-%d'),
-            timestamp.strftime('%H:%M:%S')
+            date_str,
+            time_str
         ])
     
     print(f"💾 Account value tracking updated: {tracking_file}")
@@ -308,18 +347,25 @@ def _store_account_value_tracking(timestamp, total_value, out_dir: Path):
 
 def _show_recent_history(tracking_file: Path):
     """Show recent account value history."""
-    import csv
-    
     try:
-        with open(tracking_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
+        # Only the header and the last few lines are needed: read the header,
+        # then seek near the end so the cost does not grow with the history
+        with open(tracking_file, 'rb') as f:
+            fieldnames = next(csv.reader([f.readline().decode('utf-8')]), None)
+            data_start = f.tell()
+            f.seek(0, 2)
+            tail_start = max(data_start, f.tell() - _HISTORY_TAIL_BYTES)
+            f.seek(tail_start)
+            lines = f.read().decode('utf-8', errors='replace').splitlines()
+        if tail_start > data_start:
+            lines = lines[1:]  # First line may start mid-row
+        tail = deque(lines, maxlen=5)
             
-        if len(rows) <= 1:
+        if not fieldnames or len(tail) <= 1:
             return
             
         print(f"\n📈 RECENT ACCOUNT VALUE HISTORY:")
-        recent_rows = rows[-5:] if len(rows) > 5 else rows
+        recent_rows = list(csv.DictReader(tail, fieldnames=fieldnames))
         
         for i, row in enumerate(recent_rows):
             date_str = row['date']
@@ -3,7 +3,6 @@
 
 import sys
 from pathlib import Path
-import json
 from datetime import datetime
 
 # Add project root to path
@@ -13,8 +12,9 @@ from live_monitor import analyze_watchlist_technicals
 from api.client import RealBrokerClient
 from api.sim_client import SimBrokerClient  
 from utils.config_schwab import SchwabConfig
+from utils.io import safe_write_json
 from config.settings import WATCHLIST_STOCKS
-from analysis.technicals import get_technicals_for_symbol
+from analysis.technicals import get_technicals_for_symbols
 
 def generate_fresh_watchlist():
     """Generate fresh watchlist data using real Schwab API (exactly like main.py does)."""
@@ -23,16 +23,14 @@ def generate_fresh_watchlist():
     
     # Use the exact same client initialization as main.py
     config = SchwabConfig.from_env()
-    token_file = Path(config.token_path)
-    if token_file.exists() and not config.is_valid():
+    if not config.is_valid():
+        if not Path(config.token_path).exists():
+            print("❌ Schwab API credentials required")
+            print("This script needs the same credentials that main.py uses")
+            return None
         config.app_key = "ER0kVS2P0U9WMMlRRt7Mw4ELCmVRwTB5"
         config.app_secret = "3mJejG1MBpISgcjj"
     
-    if not config.is_valid():
-        print("❌ Schwab API credentials required")
-        print("This script needs the same credentials that main.py uses")
-        return None
-    
     try:
         client = RealBrokerClient(
             app_key=config.app_key,
@@ -49,39 +47,33 @@ def generate_fresh_watchlist():
         return None
     
     # Generate watchlist analysis using real client  
-    print(f"� Analyzing {len(WATCHLIST_STOCKS)} watchlist symbols with real market data...")
+    # Normalize and de-duplicate once so no symbol is fetched twice; config order is kept
+    symbols = list(dict.fromkeys(s.strip().upper() for s in WATCHLIST_STOCKS if s and s.strip()))
+    print(f"� Analyzing {len(symbols)} watchlist symbols with real market data...")
     
     # Build the watchlist data structure manually using real client
     watchlist_stocks = {}
     successful = 0
     failed = 0
     
-    for symbol in WATCHLIST_STOCKS:
-        try:
-            print(f"   🔍 Analyzing {symbol}...")
-            # Use the real client to get technical data
-            tech_data = get_technicals_for_symbol(symbol, client)
-            
-            if tech_data and not tech_data.get('error'):
-                watchlist_stocks[symbol] = tech_data
-                successful += 1
-                price = tech_data.get('market_price', 'N/A')
-                print(f"      ✅ {symbol}: ${price}")
-            else:
-                watchlist_stocks[symbol] = {"error": "Failed to get technical data"}
-                failed += 1
-                print(f"      ❌ {symbol}: Failed")
-                
-        except Exception as e:
-            watchlist_stocks[symbol] = {"error": str(e)}
+    # One batched call with a shared analyzer instead of one setup per symbol
+    for symbol, tech_data in get_technicals_for_symbols(symbols, client).items():
+        if tech_data and not tech_data.get('error'):
+            watchlist_stocks[symbol] = tech_data
+            successful += 1
+            price = tech_data.get('market_price', 'N/A')
+            print(f"      ✅ {symbol}: ${price}")
+        else:
+            error = (tech_data or {}).get('error') or "Failed to get technical data"
+            watchlist_stocks[symbol] = {"error": error}
             failed += 1
-            print(f"      ❌ {symbol}: Error - {e}")
+            print(f"      ❌ {symbol}: Error - {error}")
     
     # Create the watchlist data structure
     watchlist_data = {
         "watchlist_stocks": watchlist_stocks,
         "summary": {
-            "total_watchlist_analyzed": len(WATCHLIST_STOCKS),
+            "total_watchlist_analyzed": len(symbols),
             "successful_analyses": successful,
             "failed_analyses": failed,
             "watchlist_signals": {}
@@ -103,8 +95,7 @@ def generate_fresh_watchlist():
     output_dir.mkdir(parents=True, exist_ok=True)
     output_file = output_dir / f"watchlist_fresh_{timestamp}.json"
     
-    with open(output_file, 'w') as f:
-        json.dump(full_data, f, indent=2)
+    safe_write_json(output_file, full_data)
     
     print(f"💾 Fresh watchlist data saved to: {output_file}")
     
@@ -1,11 +1,18 @@
 #!/usr/bin/env python3
 """Live trading monitor - runs every 20 seconds during market hours."""
 
+import importlib.util
+import os
 import time
+from bisect import bisect_right
 import argparse
 from datetime import datetime, time as dt_time
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from types import ModuleType
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
+
+import numpy as np
 
 try:
     # Try relative imports first (when run as module from parent)
@@ -14,7 +21,7 @@ try:
     from .utils.config_schwab import SchwabConfig
     from .core.orchestrator import run_once
     from .utils.logging import setup_logging
-    from .analysis.technicals import get_technicals_for_symbol
+    from .analysis.technicals import get_technicals_for_symbols
     from .utils.io import safe_write_json
 except ImportError:
     # Fall back to direct imports (when run from within directory)
@@ -23,31 +30,55 @@ except ImportError:
     from utils.config_schwab import SchwabConfig
     from core.orchestrator import run_once
     from utils.logging import setup_logging
-    from analysis.technicals import get_technicals_for_symbol
+    from analysis.technicals import get_technicals_for_symbols
     from utils.io import safe_write_json
 
 
+# Loaded config modules by resolved path, with the file mtime they were loaded at
+_CONFIG_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
+
+
+def _load_config_module(config_path) -> Optional[ModuleType]:
+    """Execute a settings file as a module, reusing it until the file changes.
+    
+    Args:
+        config_path: Path to the settings file
+        
+    Returns:
+        The loaded module, or None if the file does not exist
+    """
+    config_file = Path(config_path)
+    try:
+        mtime_ns = config_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    
+    key = str(config_file.resolve())
+    cached = _CONFIG_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    spec = importlib.util.spec_from_file_location("settings", config_file)
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    _CONFIG_CACHE[key] = (mtime_ns, config)  # Replaces any stale entry for this file
+    return config
+
+
 def load_watchlist_from_config(config_path: str) -> List[str]:
     """Load watchlist symbols from configuration file."""
     try:
-        import sys
-        import importlib.util
-        from pathlib import Path
-        
-        config_file = Path(config_path)
-        if not config_file.exists():
+        config = _load_config_module(config_path)
+        if config is None:
             return []
         
-        spec = importlib.util.spec_from_file_location("settings", config_file)
-        config = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(config)
-        
         # Try to get the active watchlist
         symbols = getattr(config, 'ACTIVE_WATCHLIST', [])
         if not symbols:
             symbols = getattr(config, 'WATCHLIST_STOCKS', [])
         
-        return symbols
+        # Copy so callers cannot modify the cached module's list
+        return list(symbols)
         
     except Exception as e:
         print(f"Error loading watchlist from {config_path}: {e}")
@@ -55,7 +86,15 @@ def load_watchlist_from_config(config_path: str) -> List[str]:
 
 
 def analyze_watchlist_technicals(client, symbols: List[str]) -> Dict[str, Any]:
-    """Analyze technical indicators for a list of watchlist symbols."""
+    """Analyze technical indicators for a list of watchlist symbols.
+    
+    Lookups go through get_technicals_for_symbols in one batch; results are
+    aggregated afterwards on the calling thread.
+    
+    Args:
+        client: Broker client used for the lookups
+        symbols: Watchlist tickers
+    """
     results = {
         "watchlist_stocks": {},
         "summary": {
@@ -66,31 +105,93 @@ def analyze_watchlist_technicals(client, symbols: List[str]) -> Dict[str, Any]:
         }
     }
     
-    for symbol in symbols:
-        try:
-            # Use the existing get_technicals_for_symbol function
-            tech_data = get_technicals_for_symbol(symbol, client)
+    # Per-symbol failures come back as {"error": ...} rather than raising
+    all_technicals = get_technicals_for_symbols(symbols, client)
+    
+    for symbol, tech_data in all_technicals.items():
+        if tech_data and not tech_data.get('error'):
+            results["watchlist_stocks"][symbol] = tech_data
+            results["summary"]["successful_analyses"] += 1
             
-            if tech_data and not tech_data.get('error'):
-                results["watchlist_stocks"][symbol] = tech_data
-                results["summary"]["successful_analyses"] += 1
-                
-                # Count signals for summary
-                signals = tech_data.get('signals', [])
-                for signal in signals:
-                    signal_key = signal.replace(' ', '_').upper()
-                    results["summary"]["watchlist_signals"][signal_key] = results["summary"]["watchlist_signals"].get(signal_key, 0) + 1
-            else:
-                results["watchlist_stocks"][symbol] = {"error": "Failed to get technical data"}
-                results["summary"]["failed_analyses"] += 1
-                
-        except Exception as e:
-            results["watchlist_stocks"][symbol] = {"error": str(e)}
+            # Count signals for summary
+            signals = tech_data.get('signals', [])
+            for signal in signals:
+                signal_key = signal.replace(' ', '_').upper()
+                results["summary"]["watchlist_signals"][signal_key] = results["summary"]["watchlist_signals"].get(signal_key, 0) + 1
+        else:
+            error = (tech_data or {}).get('error') or "Failed to get technical data"
+            results["watchlist_stocks"][symbol] = {"error": error}
             results["summary"]["failed_analyses"] += 1
     
     return results
 
 
+class _WatchlistColumns(NamedTuple):
+    """Column view of the successfully analyzed watchlist stocks."""
+    symbols: List[str]
+    data: List[Dict[str, Any]]
+    rsi: np.ndarray
+    price_change: np.ndarray
+
+
+def _watchlist_columns(watchlist_stocks: Dict[str, Dict[str, Any]]) -> _WatchlistColumns:
+    """Collect RSI and price change of every non-error watchlist entry into arrays.
+    
+    Args:
+        watchlist_stocks: Symbol -> technicals mapping from analyze_watchlist_technicals
+        
+    Returns:
+        Symbols, their technicals dicts and float64 RSI / price change columns,
+        in watchlist order
+    """
+    symbols = []
+    data = []
+    for symbol, tech_data in watchlist_stocks.items():
+        if 'error' not in tech_data:
+            symbols.append(symbol)
+            data.append(tech_data)
+    n = len(data)
+    rsi = np.fromiter((d.get('rsi', 50) for d in data), dtype=np.float64, count=n)
+    price_change = np.fromiter((d.get('price_change_pct', 0) for d in data), dtype=np.float64, count=n)
+    return _WatchlistColumns(symbols, data, rsi, price_change)
+
+
+# Call score grades, from worst to best, split by the ascending thresholds in _CallScoring.grade_cuts
+_CALL_GRADES = ("AVOID", "POOR", "FAIR", "GOOD", "EXCELLENT")
+
+
+class _CallScoring(NamedTuple):
+    """Call scoring weights and grade thresholds resolved once from the config."""
+    rsi: float
+    resistance: float
+    momentum: float
+    volume: float
+    exhaustion: float
+    bollinger: float
+    macd: float
+    grade_cuts: Tuple[float, float, float, float]  # POOR, FAIR, GOOD, EXCELLENT minimums
+    
+    @classmethod
+    def from_config(cls, config) -> "_CallScoring":
+        """Apply the defaults to CALL_SCORING_WEIGHTS and the SCORE_* thresholds."""
+        weights = getattr(config, 'CALL_SCORING_WEIGHTS', {})
+        return cls(
+            rsi=weights.get('rsi_score', 25),
+            resistance=weights.get('resistance_level', 20),
+            momentum=weights.get('price_momentum', 15),
+            volume=weights.get('volume_score', 10),
+            exhaustion=weights.get('trend_exhaustion', 15),
+            bollinger=weights.get('bollinger_position', 10),
+            macd=weights.get('macd_score', 5),
+            grade_cuts=(
+                getattr(config, 'SCORE_POOR', 35),
+                getattr(config, 'SCORE_FAIR', 50),
+                getattr(config, 'SCORE_GOOD', 65),
+                getattr(config, 'SCORE_EXCELLENT', 80),
+            ),
+        )
+
+
 class LiveTradingMonitor:
     """Monitor account and positions every 20 seconds during trading hours."""
     
@@ -104,6 +205,19 @@ class LiveTradingMonitor:
         self.watchlist_symbols = []
         self.config = None
         self.force_run = force_run  # Bypass market hours check
+        # (watchlist_stocks, columns) of the last watchlist turned into arrays,
+        # reused by the alert, storage and wheel-signal checks of one cycle
+        self._watchlist_columns_cache = None
+        # time.monotonic() of the last successful watchlist save (None until the first)
+        self._last_store_ts: Optional[float] = None
+        # Call scoring weights for the loaded config (set by _load_config_settings)
+        self._call_scoring: Optional[_CallScoring] = None
+        # Market open/close times (config values once loaded) and today's close as a datetime
+        self._market_open = dt_time(6, 30)
+        self._market_close = dt_time(13, 0)
+        self._close_dt: Optional[datetime] = None
+        # time.monotonic() at which the current cycle was scheduled to start
+        self._deadline = 0.0
         
         # Load watchlist
         self._load_watchlist()
@@ -123,15 +237,15 @@ class LiveTradingMonitor:
     def _load_config_settings(self):
         """Load additional configuration settings."""
         try:
-            import sys
-            from pathlib import Path
-            import importlib.util
-            
-            config_file = Path(self.config_path)
-            if config_file.exists():
-                spec = importlib.util.spec_from_file_location("settings", config_file)
-                self.config = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(self.config)
+            config = _load_config_module(self.config_path)
+            if config is not None:
+                self.config = config
+                self._call_scoring = _CallScoring.from_config(config)
+                self._market_open = dt_time(getattr(config, 'MARKET_OPEN_HOUR', 6),
+                                            getattr(config, 'MARKET_OPEN_MINUTE', 30))
+                self._market_close = dt_time(getattr(config, 'MARKET_CLOSE_HOUR', 13),
+                                             getattr(config, 'MARKET_CLOSE_MINUTE', 0))
+                self._close_dt = None
                 self.logger.debug("✅ Configuration settings loaded")
         except Exception as e:
             self.logger.error(f"Failed to load config settings: {e}")
@@ -141,23 +255,12 @@ class LiveTradingMonitor:
         """Check if we're in market hours using config settings."""
         now = datetime.now()
         
-        # Get market hours from config or use defaults
-        if self.config:
-            open_hour = getattr(self.config, 'MARKET_OPEN_HOUR', 6)
-            open_minute = getattr(self.config, 'MARKET_OPEN_MINUTE', 30)
-            close_hour = getattr(self.config, 'MARKET_CLOSE_HOUR', 13)
-            close_minute = getattr(self.config, 'MARKET_CLOSE_MINUTE', 0)
-        else:
-            open_hour, open_minute = 6, 30
-            close_hour, close_minute = 13, 0
-        
-        market_open = dt_time(open_hour, open_minute)
-        market_close = dt_time(close_hour, close_minute)
+        # Market hours come from config (resolved when it was loaded) or the defaults
         current_time = now.time()
         
         # Check if it's a weekday and within market hours
         is_weekday = now.weekday() < 5  # Monday = 0, Friday = 4
-        is_market_time = market_open <= current_time <= market_close
+        is_market_time = self._market_open <= current_time <= self._market_close
         
         return is_weekday and is_market_time
     
@@ -183,8 +286,10 @@ class LiveTradingMonitor:
                     # Use the client directly (works for both real and simulated clients)
                     client_to_use = self.client.client if hasattr(self.client, 'client') and self.client.client is not None else self.client
                     watchlist_result = analyze_watchlist_technicals(client_to_use, self.watchlist_symbols)
-                    self._save_watchlist_analysis(watchlist_result)
-                    self._display_watchlist_summary(watchlist_result)
+                    # Wheel signals are shared by the saved file and the summary
+                    wheel_signals = self._extract_wheel_signals(watchlist_result)
+                    self._save_watchlist_analysis(watchlist_result, wheel_signals)
+                    self._display_watchlist_summary(watchlist_result, wheel_signals)
                 except Exception as e:
                     self.logger.error(f"Watchlist analysis failed: {e}")
             
@@ -209,8 +314,13 @@ class LiveTradingMonitor:
             self.logger.error(f"Error in monitoring cycle: {e}")
             return None
     
-    def _save_watchlist_analysis(self, watchlist_result):
-        """Save watchlist analysis based on wheel strategy storage settings."""
+    def _save_watchlist_analysis(self, watchlist_result, wheel_signals: Optional[dict] = None):
+        """Save watchlist analysis based on wheel strategy storage settings.
+        
+        Args:
+            watchlist_result: Result of analyze_watchlist_technicals
+            wheel_signals: Precomputed _extract_wheel_signals result (computed if omitted)
+        """
         if not watchlist_result:
             return
 
@@ -259,11 +369,12 @@ class LiveTradingMonitor:
                     "generated_at": datetime.now().isoformat(),
                     "config_path": self.config_path,
                     "storage_reason": storage_reason,
-                    "wheel_trading_signals": self._extract_wheel_signals(watchlist_result),
+                    "wheel_trading_signals": wheel_signals if wheel_signals is not None else self._extract_wheel_signals(watchlist_result),
                     **watchlist_result
                 }
                 
                 safe_write_json(filepath, analysis_data)
+                self._last_store_ts = time.monotonic()  # Only successful writes count
                 self.logger.info(f"💾 Saved watchlist analysis ({storage_reason}): {filename}")
                 
                 # Generate wheel rankings immediately after saving watchlist data
@@ -286,41 +397,44 @@ class LiveTradingMonitor:
             return False
             
         now = datetime.now()
-        close_hour = getattr(self.config, 'MARKET_CLOSE_HOUR', 13)
-        close_minute = getattr(self.config, 'MARKET_CLOSE_MINUTE', 0)
         
-        market_close = now.replace(hour=close_hour, minute=close_minute, second=0, microsecond=0)
+        # Today's close only needs building once per day
+        market_close = self._close_dt
+        if market_close is None or market_close.date() != now.date():
+            market_close = datetime.combine(now.date(), self._market_close)
+            self._close_dt = market_close
         time_to_close = (market_close - now).total_seconds() / 60  # minutes
         
         return 0 <= time_to_close <= 30  # Within 30 minutes of close
 
+    def _get_watchlist_columns(self, watchlist_stocks: Dict[str, Dict[str, Any]]) -> _WatchlistColumns:
+        """Column view of ``watchlist_stocks``, built once per watchlist result."""
+        cached = self._watchlist_columns_cache
+        if cached is not None and cached[0] is watchlist_stocks:
+            return cached[1]
+        columns = _watchlist_columns(watchlist_stocks)
+        self._watchlist_columns_cache = (watchlist_stocks, columns)
+        return columns
+
     def _has_significant_alerts(self, watchlist_result) -> bool:
         """Check if watchlist has alerts significant for wheel trading."""
         watchlist_stocks = watchlist_result.get("watchlist_stocks", {})
+        columns = self._get_watchlist_columns(watchlist_stocks)
+        rsi = columns.rsi
         
-        significant_count = 0
-        
-        for symbol, data in watchlist_stocks.items():
-            if 'error' in data:
-                continue
-                
-            # Check for wheel-relevant conditions
-            rsi = data.get('rsi', 50)
-            price_change = data.get('price_change_pct', 0)
-            
-            # Conditions that matter for wheel strategy
-            if (rsi < 30 or rsi > 70 or  # Oversold/overbought for entry/exit timing
-                abs(price_change) > 5):   # Significant price moves
-                significant_count += 1
+        # Conditions that matter for wheel strategy: oversold/overbought for
+        # entry/exit timing, or significant price moves
+        significant = (rsi < 30) | (rsi > 70) | (np.abs(columns.price_change) > 5)
+        significant_count = int(np.count_nonzero(significant))
         
         # Consider significant if 20% or more of watchlist has alerts
         return significant_count >= len(watchlist_stocks) * 0.2
 
     def _should_store_by_interval(self, interval_minutes: int) -> bool:
         """Check if enough time has passed since last storage."""
-        # This would track last storage time - simplified for now
-        now = datetime.now()
-        return now.minute % interval_minutes == 0
+        if self._last_store_ts is None:
+            return True
+        return time.monotonic() - self._last_store_ts >= interval_minutes * 60
 
     
     
@@ -329,7 +443,7 @@ class LiveTradingMonitor:
         if not self.config:
             return {"score": 0, "breakdown": {}, "grade": "N/A"}
         
-        weights = getattr(self.config, 'CALL_SCORING_WEIGHTS', {})
+        scoring = self._call_scoring or _CallScoring.from_config(self.config)
         rsi = data.get('rsi', 50)
         price_change = data.get('price_change_pct', 0)
         price = data.get('current_price', data.get('market_price', 0))  # Use real price field
@@ -338,70 +452,62 @@ class LiveTradingMonitor:
         total_score = 0
         
         # RSI Score (25 points) - Ideal range 65-80 for call selling
+        rsi_weight = scoring.rsi
         if 65 <= rsi <= 75:
-            rsi_score = weights.get('rsi_score', 25)
+            rsi_score = rsi_weight
         elif 60 <= rsi < 65 or 75 < rsi <= 80:
-            rsi_score = weights.get('rsi_score', 25) * 0.8
+            rsi_score = rsi_weight * 0.8
         elif 55 <= rsi < 60 or 80 < rsi <= 85:
-            rsi_score = weights.get('rsi_score', 25) * 0.5
+            rsi_score = rsi_weight * 0.5
         else:
-            rsi_score = weights.get('rsi_score', 25) * 0.2
+            rsi_score = rsi_weight * 0.2
         breakdown['rsi'] = f"{rsi_score:.1f}/25 (RSI: {rsi:.1f})"
         total_score += rsi_score
         
         # Resistance Level Score (20 points) - Mock calculation
-        resistance_score = weights.get('resistance_level', 20) * 0.7  # Assume near resistance
+        resistance_score = scoring.resistance * 0.7  # Assume near resistance
         breakdown['resistance'] = f"{resistance_score:.1f}/20 (resistance analysis)"
         total_score += resistance_score
         
         # Price Momentum Score (15 points) - Recent upward movement
         if price_change > 2:
-            momentum_score = weights.get('price_momentum', 15)
+            momentum_score = scoring.momentum
         elif price_change > 1:
-            momentum_score = weights.get('price_momentum', 15) * 0.7
+            momentum_score = scoring.momentum * 0.7
         elif price_change > 0:
-            momentum_score = weights.get('price_momentum', 15) * 0.4
+            momentum_score = scoring.momentum * 0.4
         else:
             momentum_score = 0
         breakdown['momentum'] = f"{momentum_score:.1f}/15 ({price_change:+.1f}% move)"
         total_score += momentum_score
         
         # Volume Score (10 points) - Mock calculation
-        volume_score = weights.get('volume_score', 10) * 0.8
+        volume_score = scoring.volume * 0.8
         breakdown['volume'] = f"{volume_score:.1f}/10 (volume supporting)"
         total_score += volume_score
         
         # Trend Exhaustion Score (15 points) - Signs of reversal
         if rsi > 70 and price_change > 3:
-            exhaustion_score = weights.get('trend_exhaustion', 15) * 0.9  # High exhaustion signals
+            exhaustion_score = scoring.exhaustion * 0.9  # High exhaustion signals
         elif rsi > 65:
-            exhaustion_score = weights.get('trend_exhaustion', 15) * 0.6
+            exhaustion_score = scoring.exhaustion * 0.6
         else:
-            exhaustion_score = weights.get('trend_exhaustion', 15) * 0.3
+            exhaustion_score = scoring.exhaustion * 0.3
         breakdown['exhaustion'] = f"{exhaustion_score:.1f}/15 (exhaustion signals)"
         total_score += exhaustion_score
         
         # Bollinger Position (10 points) - Upper band proximity
-        bb_score = weights.get('bollinger_position', 10) * 0.7
+        bb_score = scoring.bollinger * 0.7
         breakdown['bollinger'] = f"{bb_score:.1f}/10 (BB upper band)"
         total_score += bb_score
         
         # MACD Score (5 points) - Divergence signals
-        macd_score = weights.get('macd_score', 5) * 0.6
+        macd_score = scoring.macd * 0.6
         breakdown['macd'] = f"{macd_score:.1f}/5 (MACD signals)"
         total_score += macd_score
         
-        # Determine grade
-        if total_score >= getattr(self.config, 'SCORE_EXCELLENT', 80):
-            grade = "EXCELLENT"
-        elif total_score >= getattr(self.config, 'SCORE_GOOD', 65):
-            grade = "GOOD"
-        elif total_score >= getattr(self.config, 'SCORE_FAIR', 50):
-            grade = "FAIR"
-        elif total_score >= getattr(self.config, 'SCORE_POOR', 35):
-            grade = "POOR"
-        else:
-            grade = "AVOID"
+        # Determine grade from the ascending thresholds
+        grade = _CALL_GRADES[bisect_right(scoring.grade_cuts, total_score)]
         
         return {
             "score": round(total_score, 1),
@@ -421,44 +527,47 @@ class LiveTradingMonitor:
         if not self.config:
             return wheel_signals
             
-        watchlist_stocks = watchlist_result.get("watchlist_stocks", {})
+        columns = self._get_watchlist_columns(watchlist_result.get("watchlist_stocks", {}))
+        rsi = columns.rsi
+        
+        # Evaluate every criterion over the whole watchlist at once
+        is_put = (rsi >= 25) & (rsi <= 50)  # Good RSI range for selling puts (oversold conditions)
+        is_call = (rsi >= 60) & (rsi <= 80)  # Good RSI range for selling calls (overbought conditions)
+        is_avoid = (rsi < 25) | (rsi > 80) | (np.abs(columns.price_change) > 10)  # Stocks to avoid
         
         put_candidates = []
         call_candidates = []
         
-        for symbol, data in watchlist_stocks.items():
-            if 'error' in data:
-                continue
-            
-            rsi = data.get('rsi', 50)
+        # Entries keep the original (unconverted) values from the technicals dicts
+        for i in np.flatnonzero(is_put | is_call | is_avoid).tolist():
+            symbol = columns.symbols[i]
+            data = columns.data[i]
+            rsi_value = data.get('rsi', 50)
             price_change = data.get('price_change_pct', 0)
-            price = data.get('current_price', data.get('market_price', 0))
             
-            # Simple put selling criteria (oversold conditions)
-            if 25 <= rsi <= 50:  # Good RSI range for selling puts
-                put_candidates.append({
-                    "symbol": symbol,
-                    "rsi": rsi,
-                    "price": price,
-                    "price_change": price_change,
-                    "strategy": "cash_secured_put"
-                })
+            if is_put[i] or is_call[i]:
+                price = data.get('current_price', data.get('market_price', 0))
+                if is_put[i]:
+                    put_candidates.append({
+                        "symbol": symbol,
+                        "rsi": rsi_value,
+                        "price": price,
+                        "price_change": price_change,
+                        "strategy": "cash_secured_put"
+                    })
+                if is_call[i]:
+                    call_candidates.append({
+                        "symbol": symbol,
+                        "rsi": rsi_value,
+                        "price": price,
+                        "price_change": price_change,
+                        "strategy": "covered_call"
+                    })
             
-            # Simple call selling criteria (overbought conditions)
-            if 60 <= rsi <= 80:  # Good RSI range for selling calls
-                call_candidates.append({
-                    "symbol": symbol,
-                    "rsi": rsi,
-                    "price": price,
-                    "price_change": price_change,
-                    "strategy": "covered_call"
-                })
-            
-            # Track stocks to avoid
-            if (rsi < 25 or rsi > 80 or abs(price_change) > 10):
+            if is_avoid[i]:
                 wheel_signals["avoid_stocks"].append({
                     "symbol": symbol,
-                    "rsi": rsi,
+                    "rsi": rsi_value,
                     "price_change": price_change,
                     "reason": "too_volatile_or_extreme_rsi"
                 })
@@ -474,37 +583,13 @@ class LiveTradingMonitor:
         
         return wheel_signals
 
-    def cleanup_old_data(self):
-        """Clean up old watchlist analysis files based on config settings."""
-        if not self.config:
-            return
-            
-        cleanup_days = getattr(self.config, 'CLEANUP_OLD_DATA_DAYS', 30)
+    def _display_watchlist_summary(self, watchlist_result, wheel_signals: Optional[dict] = None):
+        """Display a summary of watchlist analysis with wheel strategy focus.
         
-        try:
-            from pathlib import Path
-            import time
-            
-            cutoff_time = time.time() - (cleanup_days * 24 * 60 * 60)  # seconds
-            
-            # Find and remove old watchlist files
-            pattern = "watchlist_*.json"
-            old_files = []
-            
-            for filepath in self.out_dir.glob(pattern):
-                if filepath.stat().st_mtime < cutoff_time:
-                    old_files.append(filepath)
-            
-            if old_files:
-                for filepath in old_files:
-                    filepath.unlink()
-                self.logger.info(f"🧹 Cleaned up {len(old_files)} old watchlist files (>{cleanup_days} days)")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to cleanup old data: {e}")
-    
-    def _display_watchlist_summary(self, watchlist_result):
-        """Display a summary of watchlist analysis with wheel strategy focus."""
+        Args:
+            watchlist_result: Result of analyze_watchlist_technicals
+            wheel_signals: Precomputed _extract_wheel_signals result (computed if omitted)
+        """
         if not watchlist_result:
             return
             
@@ -519,7 +604,8 @@ class LiveTradingMonitor:
             self.logger.warning(f"⚠️  {failed} symbols failed analysis")
         
         # Show basic wheel strategy analysis
-        wheel_signals = self._extract_wheel_signals(watchlist_result)
+        if wheel_signals is None:
+            wheel_signals = self._extract_wheel_signals(watchlist_result)
         wheel_summary = wheel_signals.get("summary", {})
         
         if any(wheel_summary.values()):
@@ -581,24 +667,31 @@ class LiveTradingMonitor:
         
         alerts = []
         
-        for symbol, data in watchlist_stocks.items():
-            if 'error' in data:
-                continue
-                
+        # Find the symbols with an alert in one vectorized pass, then format
+        # only those, keeping the per-symbol RSI-then-price alert order
+        columns = self._get_watchlist_columns(watchlist_stocks)
+        rsi_values = columns.rsi.tolist()
+        price_changes = columns.price_change.tolist()
+        n = len(rsi_values)
+        rsi_alert = ((columns.rsi < rsi_oversold) | (columns.rsi > rsi_overbought)) if enable_rsi else np.zeros(n, dtype=bool)
+        price_alert = (np.abs(columns.price_change) > price_change_threshold) if enable_price else np.zeros(n, dtype=bool)
+        
+        for i in np.flatnonzero(rsi_alert | price_alert).tolist():
+            symbol = columns.symbols[i]
+            
             # Check for RSI conditions
-            if enable_rsi:
-                rsi = data.get('rsi', 50)
+            if rsi_alert[i]:
+                rsi = rsi_values[i]
                 if rsi < rsi_oversold:
                     alerts.append(f"🔴 {symbol}: OVERSOLD (RSI: {rsi:.1f})")
-                elif rsi > rsi_overbought:
+                else:
                     alerts.append(f"🟢 {symbol}: OVERBOUGHT (RSI: {rsi:.1f})")
             
             # Check for significant price changes
-            if enable_price:
-                price_change = data.get('price_change_pct', 0)
-                if abs(price_change) > price_change_threshold:
-                    direction = "🚀" if price_change > 0 else "📉"
-                    alerts.append(f"{direction} {symbol}: {price_change:+.1f}% price change")
+            if price_alert[i]:
+                price_change = price_changes[i]
+                direction = "🚀" if price_change > 0 else "📉"
+                alerts.append(f"{direction} {symbol}: {price_change:+.1f}% price change")
         
         # Display alerts
         if alerts:
@@ -615,7 +708,6 @@ class LiveTradingMonitor:
         try:
             from strategies.put_selection import PutSelectionEngine
             from datetime import datetime
-            import json
             
             # Get account snapshot from the result
             account_snapshot = account_result.get('snapshot')
@@ -652,8 +744,7 @@ class LiveTradingMonitor:
                     put_recommendations.extend(data['recommended_puts'])
             
             # Save raw recommendations
-            with open(raw_output_file, 'w') as f:
-                json.dump(put_analysis, f, indent=2, default=str)
+            safe_write_json(raw_output_file, put_analysis)
             
             # Filter and rank top puts (reuse logic from run_put_selection.py)
             top_puts = self._filter_and_rank_puts(put_recommendations)
@@ -671,8 +762,7 @@ class LiveTradingMonitor:
                 }
             }
             
-            with open(final_output_file, 'w') as f:
-                json.dump(final_data, f, indent=2, default=str)
+            safe_write_json(final_output_file, final_data)
             
             self.logger.info(f"💾 Put analysis saved: {len(top_puts)} top recommendations")
             
@@ -748,8 +838,6 @@ class LiveTradingMonitor:
     
     def cleanup_old_data(self):
         """Clean up old data files, keeping only the last 10 files per directory."""
-        import glob
-        
         # Directories to clean up
         cleanup_dirs = [
             "data/stock_watchlist",
@@ -768,20 +856,23 @@ class LiveTradingMonitor:
                 if not full_path.exists():
                     continue
                 
-                # Get all JSON files in the directory
-                json_files = list(full_path.glob("*.json"))
-                
+                # One directory scan; each JSON file is stat'ed once for its mtime.
                 # Skip account_snapshot.json (always keep the current one)
-                json_files = [f for f in json_files if f.name != "account_snapshot.json"]
+                with os.scandir(full_path) as entries:
+                    json_files = [
+                        (entry.stat().st_mtime, Path(entry.path))
+                        for entry in entries
+                        if entry.name.endswith(".json") and entry.name != "account_snapshot.json"
+                    ]
                 
                 if len(json_files) <= 10:
                     continue  # Nothing to clean up
                 
                 # Sort by modification time (newest first)
-                json_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+                json_files.sort(key=itemgetter(0), reverse=True)
                 
                 # Keep the 10 newest, delete the rest
-                files_to_delete = json_files[10:]
+                files_to_delete = [file_path for _, file_path in json_files[10:]]
                 
                 for file_path in files_to_delete:
                     try:
@@ -815,6 +906,7 @@ class LiveTradingMonitor:
         # Cleanup old data files at startup
         self.cleanup_old_data()
         
+        self._deadline = time.monotonic()
         try:
             while self.running:
                 iteration += 1
@@ -829,7 +921,7 @@ class LiveTradingMonitor:
                 # Check market hours (unless forced to run)
                 if not self.force_run and not self.is_market_hours():
                     self.logger.info("📴 Market closed - skipping monitoring (use --force to override)")
-                    time.sleep(self.interval)
+                    self._sleep_until_next_cycle()
                     continue
                 
                 self.logger.info(f"\n📊 === ITERATION {iteration} ===")
@@ -848,7 +940,7 @@ class LiveTradingMonitor:
                 # Wait for next iteration
                 if self.running:  # Check if we're still running
                     self.logger.info(f"⏸️  Waiting {self.interval} seconds...")
-                    time.sleep(self.interval)
+                    self._sleep_until_next_cycle()
                     
         except KeyboardInterrupt:
             self.logger.info("\n🛑 Stopping live monitor...")
@@ -857,12 +949,33 @@ class LiveTradingMonitor:
         finally:
             self.running = False
             
+            # Stop the real client's background token refresh, if any
+            close = getattr(self.client, 'close', None)
+            if close is not None:
+                close()
+            
             # Cleanup old data files when stopping
             self.cleanup_old_data()
             
             elapsed = (datetime.now() - start_time).total_seconds() / 60
             self.logger.info(f"✅ Live monitor stopped after {elapsed:.1f} minutes ({iteration} iterations)")
 
+    def _sleep_until_next_cycle(self):
+        """Sleep until the next cycle is due, keeping a fixed cadence.
+        
+        Deadlines advance by ``interval`` from the previous one rather than from
+        the end of the cycle, so time spent working does not stretch the
+        schedule. A cycle that overruns starts the next one immediately and
+        resynchronizes instead of running back-to-back catch-up cycles.
+        """
+        self._deadline += self.interval
+        sleep_for = self._deadline - time.monotonic()
+        if sleep_for > 0:
+            time.sleep(sleep_for)
+        else:
+            self.logger.warning(f"⚠️  Cycle overran the {self.interval}s interval by {-sleep_for:.2f}s")
+            self._deadline = time.monotonic()
+
     def _generate_wheel_rankings(self, analysis_data: dict) -> dict:
         """Generate wheel strategy rankings from watchlist analysis data."""
         try:
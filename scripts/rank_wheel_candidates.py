@@ -34,6 +34,7 @@ class WheelRanker:
     def __init__(self):
         self.logger = get_logger()
         self.config = settings
+        self.settings = settings.RANKING_SETTINGS
         
     def find_latest_watchlist_file(self, data_dir: str = None) -> Path:
         """Find the most recent watchlist analysis file."""
@@ -75,7 +76,8 @@ class WheelRanker:
     
     def calculate_put_score(self, symbol: str, tech_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate put selling score for a stock."""
-        weights = getattr(self.config, 'PUT_RANKING_WEIGHTS', {})
+        cfg = self.settings
+        weights = cfg.put_ranking_weights
         
         rsi = tech_data.get('rsi', 50)
         price_change_pct = abs(tech_data.get('price_change_pct', 0))
@@ -86,9 +88,9 @@ class WheelRanker:
         total_score = 0
         
         # RSI Score (25 points) - Ideal range for put selling
-        rsi_excellent = getattr(self.config, 'PUT_RSI_EXCELLENT', (30, 45))
-        rsi_good = getattr(self.config, 'PUT_RSI_GOOD', (25, 55))
-        rsi_fair = getattr(self.config, 'PUT_RSI_FAIR', (20, 60))
+        rsi_excellent = cfg.put_rsi_excellent
+        rsi_good = cfg.put_rsi_good
+        rsi_fair = cfg.put_rsi_fair
         
         if rsi_excellent[0] <= rsi <= rsi_excellent[1]:
             rsi_score = weights.get('rsi_score', 25)
@@ -108,10 +110,10 @@ class WheelRanker:
         
         # Price Stability Score (20 points)
         stability_thresholds = [
-            (getattr(self.config, 'STABILITY_EXCELLENT', 1.0), 1.0, "EXCELLENT"),
-            (getattr(self.config, 'STABILITY_GOOD', 2.0), 0.8, "GOOD"),
-            (getattr(self.config, 'STABILITY_FAIR', 3.5), 0.5, "FAIR"),
-            (getattr(self.config, 'STABILITY_POOR', 5.0), 0.2, "POOR")
+            (cfg.stability_excellent, 1.0, "EXCELLENT"),
+            (cfg.stability_good, 0.8, "GOOD"),
+            (cfg.stability_fair, 0.5, "FAIR"),
+            (cfg.stability_poor, 0.2, "POOR")
         ]
         
         stability_score = 0
@@ -143,8 +145,8 @@ class WheelRanker:
         total_score += support_score
         
         # Volume Score (10 points)
-        volume_excellent = getattr(self.config, 'VOLUME_EXCELLENT', (0.8, 2.0))
-        volume_good = getattr(self.config, 'VOLUME_GOOD', (0.5, 3.0))
+        volume_excellent = cfg.volume_excellent
+        volume_good = cfg.volume_good
         
         if volume_excellent[0] <= volume_ratio <= volume_excellent[1]:
             volume_score = weights.get('volume_score', 10)
@@ -205,13 +207,13 @@ class WheelRanker:
         total_score += macd_score
         
         # Determine grade
-        if total_score >= getattr(self.config, 'RANK_EXCELLENT', 80):
+        if total_score >= cfg.rank_excellent:
             grade = "EXCELLENT"
-        elif total_score >= getattr(self.config, 'RANK_GOOD', 65):
+        elif total_score >= cfg.rank_good:
             grade = "GOOD"
-        elif total_score >= getattr(self.config, 'RANK_FAIR', 50):
+        elif total_score >= cfg.rank_fair:
             grade = "FAIR"
-        elif total_score >= getattr(self.config, 'RANK_POOR', 35):
+        elif total_score >= cfg.rank_poor:
             grade = "POOR"
         else:
             grade = "AVOID"
@@ -229,7 +231,8 @@ class WheelRanker:
     
     def calculate_call_score(self, symbol: str, tech_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate call selling score for a stock."""
-        weights = getattr(self.config, 'CALL_RANKING_WEIGHTS', {})
+        cfg = self.settings
+        weights = cfg.call_ranking_weights
         
         rsi = tech_data.get('rsi', 50)
         price_change_pct = tech_data.get('price_change_pct', 0)
@@ -240,9 +243,9 @@ class WheelRanker:
         total_score = 0
         
         # RSI Score (25 points) - Ideal range for call selling
-        rsi_excellent = getattr(self.config, 'CALL_RSI_EXCELLENT', (65, 75))
-        rsi_good = getattr(self.config, 'CALL_RSI_GOOD', (60, 80))
-        rsi_fair = getattr(self.config, 'CALL_RSI_FAIR', (55, 85))
+        rsi_excellent = cfg.call_rsi_excellent
+        rsi_good = cfg.call_rsi_good
+        rsi_fair = cfg.call_rsi_fair
         
         if rsi_excellent[0] <= rsi <= rsi_excellent[1]:
             rsi_score = weights.get('rsi_score', 25)
@@ -295,8 +298,8 @@ class WheelRanker:
         total_score += momentum_score
         
         # Volume Score (10 points) - Same as puts
-        volume_excellent = getattr(self.config, 'VOLUME_EXCELLENT', (0.8, 2.0))
-        volume_good = getattr(self.config, 'VOLUME_GOOD', (0.5, 3.0))
+        volume_excellent = cfg.volume_excellent
+        volume_good = cfg.volume_good
         
         if volume_excellent[0] <= volume_ratio <= volume_excellent[1]:
             volume_score = weights.get('volume_score', 10)
@@ -351,13 +354,13 @@ class WheelRanker:
         total_score += macd_score
         
         # Determine grade
-        if total_score >= getattr(self.config, 'RANK_EXCELLENT', 80):
+        if total_score >= cfg.rank_excellent:
             grade = "EXCELLENT"
-        elif total_score >= getattr(self.config, 'RANK_GOOD', 65):
+        elif total_score >= cfg.rank_good:
             grade = "GOOD"
-        elif total_score >= getattr(self.config, 'RANK_FAIR', 50):
+        elif total_score >= cfg.rank_fair:
             grade = "FAIR"
-        elif total_score >= getattr(self.config, 'RANK_POOR', 35):
+        elif total_score >= cfg.rank_poor:
             grade = "POOR"
         else:
             grade = "AVOID"
@@ -375,6 +378,8 @@ class WheelRanker:
     
     def rank_wheel_candidates(self, watchlist_data: Dict[str, Any]) -> Dict[str, Any]:
         """Rank all stocks for wheel strategy opportunities."""
+        cfg = self.settings
+        min_score = cfg.min_ranking_score
         watchlist_stocks = watchlist_data.get("watchlist_stocks", {})
         
         put_candidates = []
@@ -389,7 +394,6 @@ class WheelRanker:
             
             # Calculate put selling score
             put_score_data = self.calculate_put_score(symbol, tech_data)
-            min_score = getattr(self.config, 'MIN_RANKING_SCORE', 35)
             
             if put_score_data['score'] >= min_score:
                 put_candidates.append(put_score_data)
@@ -405,8 +409,8 @@ class WheelRanker:
         call_candidates.sort(key=lambda x: x['score'], reverse=True)
         
         # Limit results
-        max_puts = getattr(self.config, 'MAX_PUT_RANKINGS', 5)
-        max_calls = getattr(self.config, 'MAX_CALL_RANKINGS', 5)
+        max_puts = cfg.max_put_rankings
+        max_calls = cfg.max_call_rankings
         
         return {
             "put_candidates": put_candidates[:max_puts],
@@ -422,6 +426,7 @@ class WheelRanker:
     
     def display_rankings(self, rankings: Dict[str, Any]):
         """Display ranked wheel candidates in formatted tables."""
+        cfg = self.settings
         summary = rankings.get('summary', {})
         
         self.logger.info("🏆 WHEEL STRATEGY RANKINGS")
@@ -445,7 +450,7 @@ class WheelRanker:
                 )
             
             # Show breakdown for top candidate
-            if getattr(self.config, 'SHOW_RANKING_BREAKDOWN', True) and put_candidates:
+            if cfg.show_ranking_breakdown and put_candidates:
                 top_put = put_candidates[0]
                 self.logger.info(f"\n🔍 TOP PUT BREAKDOWN ({top_put['symbol']} - {top_put['score']:.1f}/100):")
                 for component, details in top_put['breakdown'].items():
@@ -468,7 +473,7 @@ class WheelRanker:
                 )
             
             # Show breakdown for top candidate
-            if getattr(self.config, 'SHOW_RANKING_BREAKDOWN', True) and call_candidates:
+            if cfg.show_ranking_breakdown and call_candidates:
                 top_call = call_candidates[0]
                 self.logger.info(f"\n🔍 TOP CALL BREAKDOWN ({top_call['symbol']} - {top_call['score']:.1f}/100):")
                 for component, details in top_call['breakdown'].items():
@@ -45,7 +45,7 @@ def test_market_data_changes(samples: int = 3, interval: int = 5) -> bool:
     for i in range(samples):
         print(f"  📈 Collecting sample {i + 1}/{samples}...")
         
-        result = run_once(client, include_technicals=False)
+        result = run_once(client, include_technicals=False, emit_json=False)
         snapshot = result['snapshot']
         
         # Extract key data points that should change with market movement
@@ -2,6 +2,9 @@
 import pytest
 import sys
 from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from unittest.mock import Mock
 
 # Add the project to the Python path  
 project_root = Path(__file__).parent.parent
@@ -9,6 +12,7 @@ sys.path.insert(0, str(project_root))
 
 from utils.config_schwab import SchwabConfig
 from api.sim_client import SimBrokerClient
+from api.client import RealBrokerClient
 from core.models import AccountSnapshot
 
 
@@ -62,6 +66,155 @@ class TestSimBrokerClient:
         assert len(snapshot.stocks) > 0
         assert len(snapshot.options) > 0
 
+    def test_run_once_without_json_output(self, sim_client, tmp_path):
+        """Headless runs return the computed totals without writing the snapshot file."""
+        from core.orchestrator import run_once
+
+        result = run_once(sim_client, tmp_path, check_assignments=False, emit_json=False)
+
+        assert result['data'] is None
+        assert result['file_path'] is None
+        assert not (tmp_path / "account_snapshot.json").exists()
+        assert result['total_account_value'] > 0
+
+
+class TestRealBrokerClient:
+    """Test real broker client request flow against a mocked schwabdev client."""
+    
+    ACCOUNT = {'securitiesAccount': {'currentBalances': {'cashBalance': 100}, 'positions': []}}
+    UNAUTHORIZED = {'errors': [{'status': 401, 'title': 'Unauthorized'}]}
+    
+    @pytest.fixture
+    def broker(self):
+        broker = RealBrokerClient()
+        broker.client = Mock()
+        broker.client.account_linked.return_value = Mock(json=Mock(return_value=[{'hashValue': 'abc123'}]))
+        broker.client.account_details.return_value = Mock(json=Mock(return_value=self.ACCOUNT))
+        broker._handle_token_refresh = Mock()
+        return broker
+    
+    def test_account_hash_looked_up_once(self, broker):
+        """Repeated snapshots should reuse the discovered account hash."""
+        broker.get_account_snapshot()
+        broker.get_account_snapshot()
+        
+        assert broker.client.account_linked.call_count == 1
+        assert broker.client.account_details.call_count == 2
+        broker.client.account_details.assert_called_with('abc123', fields="positions")
+    
+    def test_unauthorized_details_rediscovers_account(self, broker):
+        """A 401 on account details should refresh tokens and look the hash up again."""
+        broker.get_account_snapshot()
+        broker.client.account_details.side_effect = [
+            Mock(json=Mock(return_value=self.UNAUTHORIZED)),
+            Mock(json=Mock(return_value=self.ACCOUNT)),
+        ]
+        
+        snapshot = broker.get_account_snapshot()
+        
+        assert snapshot.cash == 100
+        assert broker._handle_token_refresh.call_count == 1
+        assert broker.client.account_linked.call_count == 2
+    
+    def test_balances_parsed_as_exact_decimals(self, broker):
+        """Raw response text should be decoded straight to Decimal without a float hop."""
+        body = '{"securitiesAccount": {"currentBalances": {"cashBalance": 1234.10, "buyingPower": 0.1}}}'
+        broker.client.account_details.return_value = Mock(text=body, content=body.encode())
+        
+        snapshot = broker.get_account_snapshot()
+        
+        assert snapshot.cash == Decimal('1234.10')
+        assert str(snapshot.cash) == '1234.10'  # JSON literal kept, not round-tripped through float
+        assert snapshot.buying_power == Decimal('0.1')
+    
+    def test_option_fields_parsed_from_contract_symbol(self, broker):
+        """Missing strike, put/call and expiry should come from the OCC contract symbol."""
+        position = {
+            'instrument': {'assetType': 'OPTION', 'symbol': 'ACHR  251003P00009500',
+                           'underlyingSymbol': 'ACHR', 'putCall': ''},
+            'shortQuantity': 2, 'averagePrice': 0.5, 'marketValue': -100,
+        }
+        broker.client.account_details.return_value = Mock(json=Mock(return_value={
+            'securitiesAccount': {'currentBalances': {}, 'positions': [position]}
+        }))
+        
+        option = broker.get_account_snapshot().options[0]
+        
+        assert option.strike == Decimal('9.5')
+        assert option.put_call == 'P'
+        assert option.expiry == datetime(2025, 10, 3)
+        assert option.qty == -2
+        assert option.market_price == Decimal('0.5')
+    
+    def test_derived_market_price_rounded(self, broker):
+        """Per-share prices that do not divide evenly are rounded to four decimals."""
+        position = {
+            'instrument': {'assetType': 'OPTION', 'symbol': 'ACHR  251003P00009500'},
+            'longQuantity': 3, 'averagePrice': 0.5, 'marketValue': 1000,
+        }
+        broker.client.account_details.return_value = Mock(json=Mock(return_value={
+            'securitiesAccount': {'currentBalances': {}, 'positions': [position]}
+        }))
+        
+        option = broker.get_account_snapshot().options[0]
+        
+        assert str(option.market_price) == '3.3333'
+    
+    @pytest.mark.parametrize("expiration_date", ["2025-10-03", "2025-10-03T00:00:00.000+00:00"])
+    def test_option_expiry_from_api_date(self, broker, expiration_date):
+        """API expiration dates should parse in both date-only and ISO timestamp form."""
+        position = {
+            'instrument': {'assetType': 'OPTION', 'symbol': 'ACHR  251003P00009500', 'strikePrice': 9.5,
+                           'putCall': 'PUT', 'expirationDate': expiration_date},
+            'longQuantity': 1, 'averagePrice': 0.5, 'marketValue': 50,
+        }
+        broker.client.account_details.return_value = Mock(json=Mock(return_value={
+            'securitiesAccount': {'currentBalances': {}, 'positions': [position]}
+        }))
+        
+        option = broker.get_account_snapshot().options[0]
+        
+        assert option.expiry.date() == datetime(2025, 10, 3).date()
+    
+    def test_background_token_refresh(self):
+        """A stale access token is refreshed right away, then until the refresher is stopped."""
+        import threading
+        import api.client as client_module
+        
+        refreshed = threading.Event()
+        raw_client = Mock(update_tokens_auto=False)
+        raw_client.tokens.access_token_issued = datetime.now(timezone.utc) - timedelta(minutes=40)
+        raw_client.tokens.update_tokens.side_effect = lambda **kwargs: refreshed.set()
+        
+        with client_module._SCHWAB_CLIENTS_LOCK:
+            client_module._start_token_refresh(('key', 'tokens.json'), raw_client)
+        try:
+            assert refreshed.wait(2)
+        finally:
+            client_module.stop_token_refresh('key', 'tokens.json')
+        raw_client.tokens.update_tokens.assert_called_with(force_access_token=True)
+    
+    def test_token_refresh_scheduled_from_issue_time(self):
+        """The refresh is due a minute before expiry, counted from when the token was issued."""
+        import api.client as client_module
+        
+        raw_client = Mock()
+        raw_client.tokens.access_token_issued = datetime.now(timezone.utc) - timedelta(minutes=20)
+        assert client_module._seconds_until_token_refresh(raw_client) == pytest.approx(9 * 60, abs=5)
+        
+        # schwabdev's own checker is on unless explicitly disabled
+        assert client_module._has_builtin_token_updater(raw_client)
+        assert not client_module._has_builtin_token_updater(Mock(update_tokens_auto=False))
+    
+    def test_bulk_snapshots_one_per_account(self, broker):
+        """Bulk fetch should return a snapshot keyed by each requested hash."""
+        snapshots = broker.get_account_snapshots_bulk(['h1', 'h2', 'h3'])
+        
+        assert list(snapshots) == ['h1', 'h2', 'h3']
+        assert all(snapshot.cash == 100 for snapshot in snapshots.values())
+        assert broker.client.account_details.call_count == 3
+        assert broker.client.account_linked.call_count == 0
+
 
 
 # Legacy main function for backward compatibility
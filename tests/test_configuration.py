@@ -40,6 +40,20 @@ class TestConfigurationSystem:
             assert symbol.isupper()  # Should be uppercase
             assert symbol.isalpha()  # Should only contain letters
     
+    def test_ranking_settings_view(self):
+        """The frozen ranking view mirrors the module constants."""
+        from dataclasses import FrozenInstanceError
+        ranking = settings.RANKING_SETTINGS
+        
+        assert dict(ranking.put_ranking_weights) == settings.PUT_RANKING_WEIGHTS
+        assert ranking.put_rsi_excellent == settings.PUT_RSI_EXCELLENT
+        assert ranking.rank_good == settings.RANK_GOOD
+        assert ranking.min_ranking_score == settings.MIN_RANKING_SCORE
+        with pytest.raises(FrozenInstanceError):
+            ranking.rank_good = 0
+        with pytest.raises(TypeError):
+            ranking.put_ranking_weights['rsi_score'] = 0
+    
     def test_alert_thresholds(self):
         """Test alert threshold configurations."""
         # RSI thresholds
@@ -129,6 +143,19 @@ class TestDataStorage:
             loaded_data = json.load(f)
         assert loaded_data == test_data
     
+    def test_json_values_written_with_str(self, temp_dir):
+        """Decimal and datetime values are written the same way json.dumps(default=str) would."""
+        from datetime import datetime
+        from decimal import Decimal
+        
+        test_data = {'price': Decimal('12.50'), 'at': datetime(2025, 10, 2, 12, 0), 1: 'int key'}
+        file_path = Path(temp_dir) / 'values.json'
+        safe_write_json(file_path, test_data)
+        
+        with open(file_path, 'r') as f:
+            loaded_data = json.load(f)
+        assert loaded_data == json.loads(json.dumps(test_data, default=str))
+    
     def test_data_directory_creation(self, temp_dir):
         """Test that data directories are created when needed."""
         nested_path = os.path.join(temp_dir, 'data', 'stock_watchlist', 'test.json')
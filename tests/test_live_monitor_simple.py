@@ -148,6 +148,132 @@ class TestDataFlowIntegration:
             for field in expected_fields:
                 if field not in data:
                     pytest.skip(f"Stock data missing {field} field - may need adjustment")
+    
+    def test_analyze_watchlist_technicals_counts_outcomes(self, monkeypatch):
+        """One batch lookup is made and the summary counts each outcome."""
+        import live_monitor
+        
+        calls = []
+        
+        def fake_batch(symbols, client):
+            calls.append((list(symbols), client))
+            return {
+                "MSFT": {"rsi": 40, "signals": ["OVERSOLD", "HIGH VOLUME"]},
+                "BAD": {"error": "boom"},
+                "AAPL": {"rsi": 60, "signals": ["HIGH VOLUME"]},
+                "NONE": None,
+            }
+        
+        monkeypatch.setattr(live_monitor, "get_technicals_for_symbols", fake_batch)
+        client = object()
+        results = live_monitor.analyze_watchlist_technicals(client, ["MSFT", "BAD", "AAPL", "NONE"])
+        
+        assert calls == [(["MSFT", "BAD", "AAPL", "NONE"], client)]
+        summary = results["summary"]
+        assert summary["total_watchlist_analyzed"] == 4
+        assert summary["successful_analyses"] == 2
+        assert summary["failed_analyses"] == 2
+        assert summary["watchlist_signals"] == {"OVERSOLD": 1, "HIGH_VOLUME": 2}
+        assert results["watchlist_stocks"]["BAD"] == {"error": "boom"}
+        assert results["watchlist_stocks"]["NONE"] == {"error": "Failed to get technical data"}
+    
+    def test_wheel_signals_from_watchlist(self):
+        """Put/call/avoid classification keeps watchlist order and original values."""
+        import live_monitor
+        from config import settings
+        
+        monitor = object.__new__(live_monitor.LiveTradingMonitor)
+        monitor.config = settings
+        monitor._watchlist_columns_cache = None
+        watchlist_result = {"watchlist_stocks": {
+            "PUT": {"rsi": 40, "price_change_pct": 1.0, "market_price": 10.0},
+            "ERR": {"error": "boom"},
+            "CALL": {"rsi": 75, "price_change_pct": 12.0, "market_price": 20.0},
+            "LOW": {"rsi": 20, "market_price": 30.0},
+        }}
+        
+        signals = monitor._extract_wheel_signals(watchlist_result)
+        
+        assert [c["symbol"] for c in signals["good_put_candidates"]] == ["PUT"]
+        assert signals["good_put_candidates"][0]["rsi"] == 40
+        assert [c["symbol"] for c in signals["good_call_candidates"]] == ["CALL"]
+        assert [c["symbol"] for c in signals["avoid_stocks"]] == ["CALL", "LOW"]
+        assert monitor._has_significant_alerts(watchlist_result)
+    
+    def test_config_module_reused_until_file_changes(self, tmp_path):
+        """Config files are executed once per modification time."""
+        import live_monitor
+        
+        config_file = tmp_path / "settings.py"
+        config_file.write_text("WATCHLIST_STOCKS = ['AAPL']\n")
+        
+        first = live_monitor._load_config_module(config_file)
+        assert live_monitor._load_config_module(config_file) is first
+        assert live_monitor.load_watchlist_from_config(str(config_file)) == ['AAPL']
+        
+        config_file.write_text("WATCHLIST_STOCKS = ['MSFT']\n")
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+        assert live_monitor._load_config_module(config_file) is not first
+        assert live_monitor.load_watchlist_from_config(str(config_file)) == ['MSFT']
+        assert live_monitor._load_config_module(tmp_path / "missing.py") is None
+    
+    def test_interval_storage_uses_elapsed_time(self, monkeypatch):
+        """Timed storage fires once per interval since the last successful save."""
+        import live_monitor
+        
+        monitor = object.__new__(live_monitor.LiveTradingMonitor)
+        monitor._last_store_ts = None
+        assert monitor._should_store_by_interval(60)
+        
+        monkeypatch.setattr(live_monitor.time, "monotonic", lambda: 1000.0)
+        monitor._last_store_ts = 1000.0 - 59 * 60
+        assert not monitor._should_store_by_interval(60)
+        monitor._last_store_ts = 1000.0 - 60 * 60
+        assert monitor._should_store_by_interval(60)
+    
+    def test_cycle_sleep_subtracts_work_time(self, monkeypatch):
+        """The monitor sleeps only for what is left of the interval."""
+        import live_monitor
+        
+        sleeps = []
+        now = [100.0]
+        monkeypatch.setattr(live_monitor.time, "monotonic", lambda: now[0])
+        monkeypatch.setattr(live_monitor.time, "sleep", sleeps.append)
+        
+        monitor = object.__new__(live_monitor.LiveTradingMonitor)
+        monitor.interval = 20
+        monitor.logger = Mock()
+        monitor._deadline = 100.0
+        
+        now[0] = 104.0  # 4s of work
+        monitor._sleep_until_next_cycle()
+        assert sleeps == [16.0]
+        
+        now[0] = 145.0  # Overran the next deadline (140) by 5s
+        monitor._sleep_until_next_cycle()
+        assert sleeps == [16.0]
+        assert monitor._deadline == 145.0
+
+    def test_monitoring_cycle_runs_on_sim_client(self, tmp_path, monkeypatch):
+        """A full cycle against the simulated broker completes and returns its results."""
+        import live_monitor
+        from api.sim_client import SimBrokerClient
+        from core import orchestrator
+
+        config_path = Path(__file__).parent.parent / "config" / "settings.py"
+        # Keep the assignment DB, put selection and account files out of the repo
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(orchestrator, "_ASSIGNMENT_DB", None)
+        (tmp_path / "account").mkdir()
+
+        monitor = live_monitor.LiveTradingMonitor(
+            SimBrokerClient(), tmp_path / "account", config_path=str(config_path), force_run=True
+        )
+        result = monitor.run_monitoring_cycle()
+
+        assert result is not None
+        assert result["account"]["snapshot"] is not None
+        assert result["watchlist"]["summary"]["total_watchlist_analyzed"] == len(monitor.watchlist_symbols)
 
 
 class TestSystemHealthChecks:
@@ -1,5 +1,6 @@
 """Tests for models.py - data classes and business logic."""
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
 from decimal import Decimal
 from core.models import StockPosition, OptionPosition, MutualFundPosition, AccountSnapshot
@@ -30,6 +31,22 @@ class TestStockPosition:
         expected_pnl = Decimal("2525.00")  # 100 * (175.25 - 150.00)
         assert position.pnl == expected_pnl
     
+    def test_position_is_immutable(self):
+        """Positions are frozen; replace() builds a new one with recomputed values."""
+        position = StockPosition(
+            symbol="AAPL",
+            qty=100,
+            avg_cost=Decimal("150.00"),
+            market_price=Decimal("175.25")
+        )
+        with pytest.raises(FrozenInstanceError):
+            position.market_price = Decimal("180.00")
+        
+        moved = replace(position, market_price=Decimal("180.00"))
+        assert moved.market_value == Decimal("18000.00")
+        assert moved.pnl == Decimal("3000.00")
+        assert position.market_value == Decimal("17525.00")
+    
     def test_pnl_calculation_negative(self):
         """Test P&L calculation for losing position."""
         position = StockPosition(
@@ -171,4 +188,20 @@ class TestAccountSnapshot:
         assert isinstance(snapshot_dict, dict)
         assert snapshot_dict['cash'] == Decimal("1000.00")
         assert snapshot_dict['buying_power'] == Decimal("5000.00")
-        assert snapshot_dict['stocks'] == []
\ No newline at end of file
+        assert snapshot_dict['stocks'] == []
+    
+    def test_to_dict_positions_exclude_derived_values(self):
+        """Serialized positions carry their constructor fields only."""
+        stock = StockPosition(symbol="AAPL", qty=100, avg_cost=Decimal("150.00"), market_price=Decimal("175.25"))
+        snapshot = AccountSnapshot(
+            generated_at=datetime(2025, 1, 1, 12, 0, 0),
+            cash=Decimal("1000.00"),
+            buying_power=Decimal("5000.00"),
+            stocks=[stock],
+            options=[],
+            mutual_funds=[],
+        )
+        
+        assert snapshot.to_dict()['stocks'] == [
+            {'symbol': "AAPL", 'qty': 100, 'avg_cost': Decimal("150.00"), 'market_price': Decimal("175.25")}
+        ]
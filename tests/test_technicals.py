@@ -0,0 +1,464 @@
+"""Tests for analysis/technicals.py - indicator calculations."""
+import pytest
+import numpy as np
+
+from analysis.technicals import TechnicalAnalyzer
+
+
+def _reference_wilder_rsi(prices, period=14):
+    """Straightforward Wilder RSI used as the expected value."""
+    deltas = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [max(d, 0.0) for d in deltas]
+    losses = [max(-d, 0.0) for d in deltas]
+    avg_gain = sum(gains[:period]) / period
+    avg_loss = sum(losses[:period]) / period
+    for gain, loss in zip(gains[period:], losses[period:]):
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    if avg_loss == 0:
+        return 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+@pytest.fixture
+def analyzer():
+    return TechnicalAnalyzer(client=None)
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(42)
+    return list(100 + np.cumsum(rng.normal(0, 1.5, 60)))
+
+
+class TestRSI:
+    """Test Wilder-smoothed RSI."""
+
+    def test_matches_reference(self, analyzer, closes):
+        """RSI matches a plain-Python Wilder implementation."""
+        assert analyzer._calculate_rsi(closes) == pytest.approx(_reference_wilder_rsi(closes))
+
+    def test_accepts_ndarray(self, analyzer, closes):
+        """List and ndarray inputs give the same result."""
+        assert analyzer._calculate_rsi(np.asarray(closes)) == pytest.approx(analyzer._calculate_rsi(closes))
+
+    def test_insufficient_data_is_neutral(self, analyzer):
+        """Fewer than period + 1 prices returns a neutral RSI."""
+        assert analyzer._calculate_rsi([100.0] * 10) == 50
+
+    def test_only_gains_is_100(self, analyzer):
+        """A strictly rising series has RSI 100."""
+        assert analyzer._calculate_rsi([float(i) for i in range(1, 30)]) == 100
+
+
+class TestStockTechnicals:
+    """Test the per-position stock technicals pipeline with a fake client."""
+
+    @pytest.fixture
+    def candles(self, closes):
+        return [
+            {"close": c, "high": c + 1.0, "low": c - 1.0, "volume": 1_000_000 + i * 1000}
+            for i, c in enumerate(closes)
+        ]
+
+    @pytest.fixture
+    def position(self):
+        from decimal import Decimal
+        from core.models import StockPosition
+        return StockPosition(symbol="AAPL", qty=100, avg_cost=Decimal("100.00"), market_price=Decimal("105.00"))
+
+    def _client(self, candles):
+        from unittest.mock import Mock
+        client = Mock()
+        client.price_history.return_value = Mock(status_code=200, json=Mock(return_value={"candles": candles}))
+        return client
+
+    def test_indicators_match_plain_python(self, candles, position):
+        """Moving averages and levels match straightforward list math."""
+        result = TechnicalAnalyzer(self._client(candles))._calculate_stock_technicals(position)
+        indicators = result["technical_indicators"]
+        closes = [c["close"] for c in candles]
+
+        assert indicators["sma_5"] == round(sum(closes[-5:]) / 5, 2)
+        assert indicators["sma_20"] == round(sum(closes[-20:]) / 20, 2)
+        assert indicators["support_level"] == round(min(c["low"] for c in candles[-20:]), 2)
+        assert indicators["resistance_level"] == round(max(c["high"] for c in candles[-20:]), 2)
+        assert indicators["rsi"] == round(_reference_wilder_rsi(closes), 2)
+        assert result["position_data"]["pnl_pct"] == 5.0
+        assert result["signals"]
+
+    def test_price_history_cache_keeps_current_bar_live(self, candles, position, tmp_path):
+        """Completed bars come from the disk cache; the newest bars are refetched every time."""
+        from datetime import datetime, timedelta
+        from unittest.mock import Mock
+        from analysis import technicals
+
+        day_ms = 86_400_000
+        history = [dict(c, datetime=i * day_ms) for i, c in enumerate(candles)]
+        now = datetime(2025, 10, 3, 10, 0)
+
+        def price_history(symbol, startDate, **kwargs):
+            bars = history if startDate < now - timedelta(days=technicals._CANDLE_TAIL_DAYS) else history[-3:]
+            return Mock(status_code=200, json=Mock(return_value={"candles": [dict(c) for c in bars]}))
+
+        client = Mock()
+        client.price_history.side_effect = price_history
+        first = TechnicalAnalyzer(client, cache_dir=tmp_path)._calculate_stock_technicals(position, now)
+        cached = technicals.loads_json((tmp_path / "AAPL_20251003.json").read_bytes())
+        assert [c["datetime"] for c in cached] == [c["datetime"] for c in history[:-1]]
+
+        # The forming bar moves; the second analysis picks it up from the tail request
+        history[-1] = dict(history[-1], close=history[-1]["close"] + 10.0)
+        second = TechnicalAnalyzer(client, cache_dir=tmp_path)._calculate_stock_technicals(position, now)
+
+        assert client.price_history.call_count == 2
+        assert client.price_history.call_args.kwargs["startDate"] == now - timedelta(days=technicals._CANDLE_TAIL_DAYS)
+        assert second["technical_indicators"]["sma_5"] == round(first["technical_indicators"]["sma_5"] + 2.0, 2)
+
+    def test_price_history_cache_purge_is_per_symbol(self, candles, position, tmp_path):
+        """Refreshing one symbol's cache leaves similarly named symbols alone."""
+        from dataclasses import replace
+        from datetime import datetime
+
+        history = [dict(c, datetime=i) for i, c in enumerate(candles)]
+        (tmp_path / "BRK-B_20251002.json").write_text("[]")
+        TechnicalAnalyzer(self._client(history), cache_dir=tmp_path)._calculate_stock_technicals(
+            replace(position, symbol="BRK"), datetime(2025, 10, 3)
+        )
+
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["BRK-B_20251002.json", "BRK_20251003.json"]
+
+    def test_insufficient_history(self, candles, position):
+        """Fewer than 20 candles reports an error instead of indicators."""
+        result = TechnicalAnalyzer(self._client(candles[:10]))._calculate_stock_technicals(position)
+        assert "error" in result
+
+    def test_batch_matches_single_position(self, candles, position):
+        """Batched snapshot analysis matches per-position results and keeps order."""
+        from dataclasses import replace
+        from core.models import AccountSnapshot
+        from unittest.mock import Mock
+
+        histories = {"AAPL": candles, "MSFT": candles[5:], "NEW": candles[:10]}
+        client = Mock()
+        client.price_history.side_effect = lambda symbol, **kwargs: Mock(
+            status_code=200, json=Mock(return_value={"candles": histories[symbol]})
+        )
+        stocks = [replace(position, symbol=symbol) for symbol in histories]
+        snapshot = AccountSnapshot(generated_at=None, cash=0, buying_power=0,
+                                   stocks=stocks, options=[], mutual_funds=[])
+
+        analyzer = TechnicalAnalyzer(client)
+        result = analyzer.get_stock_technicals(snapshot)
+
+        assert list(result) == ["AAPL", "MSFT", "NEW"]
+        for stock in stocks[:2]:
+            assert result[stock.symbol] == analyzer._calculate_stock_technicals(stock)
+        assert "error" in result["NEW"]
+
+
+class TestStockSignals:
+    """Test vectorized stock signal rules."""
+
+    def test_strong_uptrend(self, analyzer):
+        """Stacked moving averages give the trend and alignment signals."""
+        signals = analyzer._generate_stock_signals(
+            110.0, 50.0, 108.0, 105.0, 100.0, 107.0, 104.0, 99.0, 115.0, 90.0, 80.0, 130.0, 1.0
+        )
+        assert signals == [
+            "STRONG UPTREND (Price > MA5 > MA10 > MA20)",
+            "EMA BULLISH ALIGNMENT (EMA10 > EMA20 > EMA50)",
+            "ABOVE SHORT-TERM EMAs",
+            "ABOVE LONG-TERM EMA (50)",
+        ]
+
+    def test_batch_rows_are_independent(self, analyzer):
+        """Each position gets its own signals, and no hits yields NEUTRAL."""
+        flat = dict.fromkeys(
+            ["sma_5", "sma_10", "sma_20", "ema_10", "ema_20", "ema_50"], np.array([100.0, 100.0])
+        )
+        indicators = {
+            **flat,
+            "rsi": np.array([50.0, 20.0]),
+            "bollinger_upper": np.array([105.0, 105.0]),
+            "bollinger_lower": np.array([95.0, 95.0]),
+            "support_level": np.array([50.0, 50.0]),
+            "resistance_level": np.array([150.0, 150.0]),
+            "volume_ratio": np.array([1.0, 1.7]),
+        }
+        signals = analyzer._generate_stock_signals_batch(np.array([100.0, 100.0]), indicators)
+        assert signals == [("NEUTRAL",), ["OVERSOLD (RSI < 30)", "ELEVATED VOLUME"]]
+
+
+class TestEMA:
+    """Test the closed-form EMA against the original Python recurrence."""
+
+    @staticmethod
+    def _reference_ema(prices, period):
+        alpha = 2 / (period + 1)
+        ema = sum(prices[:period]) / period
+        for price in prices[period:]:
+            ema = price * alpha + ema * (1 - alpha)
+        return ema
+
+    @pytest.mark.parametrize("period", [10, 20, 50])
+    def test_matches_reference(self, analyzer, closes, period):
+        """EMA matches the SMA-seeded recurrence."""
+        assert analyzer._calculate_ema(closes, period) == pytest.approx(self._reference_ema(closes, period))
+
+    def test_batch_matches_single_periods(self, analyzer, closes):
+        """One multi-period call matches separate single-period calls."""
+        emas = analyzer._calculate_emas(closes[:30], (10, 20, 50))
+        expected = [analyzer._calculate_ema(closes[:30], period) for period in (10, 20, 50)]
+        assert emas == pytest.approx(expected)
+        assert emas[2] == pytest.approx(np.mean(closes[:30]))
+
+    def test_short_series_falls_back_to_mean(self, analyzer):
+        """Fewer prices than the period returns their mean."""
+        assert analyzer._calculate_ema([1.0, 2.0, 3.0], 10) == pytest.approx(2.0)
+
+    def test_empty_series(self, analyzer):
+        """An empty series returns 0."""
+        assert analyzer._calculate_ema([], 10) == 0
+
+
+class TestBollingerBands:
+    """Test NumPy Bollinger Bands."""
+
+    def test_matches_two_pass_population_std(self, analyzer, closes):
+        """Bands match mean +/- 2 population standard deviations."""
+        window = np.asarray(closes[-20:])
+        upper, lower = analyzer._calculate_bollinger_bands(closes)
+        assert upper == pytest.approx(window.mean() + 2 * window.std())
+        assert lower == pytest.approx(window.mean() - 2 * window.std())
+
+    def test_short_series_returns_mean(self, analyzer):
+        """Fewer prices than the period collapses both bands to the mean."""
+        assert analyzer._calculate_bollinger_bands([1.0, 2.0, 3.0]) == pytest.approx((2.0, 2.0))
+
+
+class TestOptionsTechnicals:
+    """Test options technicals built from option chain lookups."""
+
+    @pytest.fixture
+    def positions(self):
+        from datetime import datetime
+        from decimal import Decimal
+        from core.models import OptionPosition
+        return [
+            OptionPosition(
+                symbol="AAPL", contract_symbol=f"AAPL  251017P00{strike}000", qty=-1,
+                avg_cost=Decimal("2.00"), market_price=Decimal("1.00"), strike=Decimal(strike),
+                expiry=datetime(2025, 10, 17), put_call="PUT",
+            )
+            for strike in ("150", "155")
+        ]
+
+    @pytest.fixture
+    def client(self):
+        from unittest.mock import Mock
+        chain = {
+            "callExpDateMap": {},
+            "putExpDateMap": {
+                "2025-10-17:5": {
+                    "150.0": [{"delta": -0.25, "theta": -0.04, "volatility": 0.35, "bid": 0.95, "ask": 1.05}],
+                    "155.0": [{"delta": -0.45, "theta": -0.06, "volatility": 0.38, "bid": 2.10, "ask": 2.20}],
+                }
+            },
+        }
+        client = Mock()
+        client.option_chains.return_value = Mock(status_code=200, json=Mock(return_value=chain))
+        return client
+
+    @staticmethod
+    def _snapshot(positions):
+        from core.models import AccountSnapshot
+        from decimal import Decimal
+        return AccountSnapshot(
+            generated_at=positions[0].expiry, cash=Decimal("0"), buying_power=Decimal("0"),
+            stocks=[], options=positions, mutual_funds=[],
+        )
+
+    def test_greeks_are_matched_per_strike(self, client, positions):
+        """Each contract picks up the Greeks for its own strike."""
+        result = TechnicalAnalyzer(client).get_options_technicals_streaming(self._snapshot(positions))
+
+        assert list(result) == [p.contract_symbol for p in positions]
+        assert result[positions[0].contract_symbol]["greeks"]["delta"] == -0.25
+        assert result[positions[1].contract_symbol]["greeks"]["delta"] == -0.45
+        assert result[positions[0].contract_symbol]["market_data"]["bid"] == 0.95
+
+    def test_chain_fetched_once_per_underlying_and_expiry(self, client, positions):
+        """Strikes on the same underlying and expiration share one chain request."""
+        TechnicalAnalyzer(client).get_options_technicals_streaming(self._snapshot(positions))
+        client.option_chains.assert_called_once_with("AAPL", fromDate="2025-10-17", toDate="2025-10-17")
+
+    def test_parse_options_data_finds_contract(self, client, positions):
+        """The chain fallback resolves the position's expiry and strike directly."""
+        chain = client.option_chains.return_value.json()
+        result = TechnicalAnalyzer(client)._parse_options_data(chain, positions[1])
+        assert result["greeks"]["delta"] == -0.45
+        assert result["option_metrics"]["bid"] == 2.10
+
+    def test_fallback_fetches_each_underlying_once(self, client, positions):
+        """Contracts without streaming data share one fallback chain per underlying."""
+        from dataclasses import replace
+        # Too short to stream
+        positions = [replace(p, contract_symbol=p.contract_symbol.replace(" ", "")) for p in positions]
+        result = TechnicalAnalyzer(client).get_options_technicals_streaming(self._snapshot(positions))
+
+        client.option_chains.assert_called_once_with(symbol="AAPL")
+        assert result[positions[0].contract_symbol]["greeks"]["delta"] == -0.25
+        assert result[positions[1].contract_symbol]["greeks"]["delta"] == -0.45
+
+    def test_format_contract_for_streaming(self, positions):
+        """Positions format to the 21-character streaming symbol for either put_call style."""
+        analyzer = TechnicalAnalyzer(client=None)
+        assert analyzer._format_contract_for_streaming(positions[0]) == "AAPL  251017P00150000"
+        from dataclasses import replace
+        call = replace(positions[0], put_call="C")
+        assert analyzer._format_contract_for_streaming(call) == "AAPL  251017C00150000"
+
+    def test_format_contract_strike_is_exact(self, positions):
+        """Strikes that are inexact as floats (e.g. 2.01 * 1000) are not truncated."""
+        from dataclasses import replace
+        from decimal import Decimal
+        position = replace(positions[0], strike=Decimal("2.01"))
+        formatted = TechnicalAnalyzer(client=None)._format_contract_for_streaming(position)
+        assert formatted == "AAPL  251017P00002010"
+
+    @pytest.mark.parametrize("qty,avg_cost,market_price,expected", [
+        (-1, "2.00", "1.00", 50.0),   # Short keeps half the premium
+        (-1, "2.00", "3.00", -50.0),  # Short buy-back costs more than received
+        (1, "2.00", "3.00", 50.0),    # Long gains
+        (1, "0", "3.00", 0),          # No cost basis
+    ])
+    def test_options_pnl_pct(self, positions, qty, avg_cost, market_price, expected):
+        """Short and long P&L percentages share one signed formula."""
+        from dataclasses import replace
+        from decimal import Decimal
+        position = replace(positions[0], qty=qty, avg_cost=Decimal(avg_cost), market_price=Decimal(market_price))
+        assert TechnicalAnalyzer(client=None)._calculate_options_pnl_pct(position) == expected
+
+    def test_options_pnl_pct_batch_matches_scalar(self):
+        """The vectorized P&L matches the per-position calculation."""
+        from analysis.technicals import _options_pnl_pct_batch
+        result = _options_pnl_pct_batch(
+            np.array([2.0, 2.0, 2.0, 0.0, -2.0]), np.array([1.0, 3.0, 3.0, 3.0, 1.0]), np.array([-1, -1, 1, 1, -1])
+        )
+        assert result.tolist() == pytest.approx([50.0, -50.0, 50.0, 0.0, 50.0])
+
+    def test_greeks_signal_rules(self, positions):
+        """Rule groups behave as if/elif chains and keep output order."""
+        position = positions[0]  # Short put, 50% of premium kept
+        signals = TechnicalAnalyzer(client=None)._generate_options_signals_with_greeks(
+            position, delta=-0.5, theta=-0.12, implied_volatility=0.55, days_to_expiry=5, time_value=0.2
+        )
+        assert signals == [
+            "EXTREME TIME DECAY - EXPIRING SOON (θ > 0.10)",
+            "ATM PUT - MAXIMUM GAMMA RISK",
+            "HIGH IV - ELEVATED PREMIUM (IV > 40%)",
+            "GOOD SHORT PROFIT - MONITOR DELTA RISK (>25%)",
+            "IV CRUSH OPPORTUNITY - SHORT PREMIUM",
+            "THETA ACCELERATION ZONE - MANAGE ACTIVELY",
+            "PIN RISK - NEAR EXPIRY WITH DELTA EXPOSURE",
+        ]
+
+
+class TestFindChainContract:
+    """Test direct-key contract lookup in chain expiration maps."""
+
+    def test_non_canonical_strike_keys(self):
+        """Strike keys formatted with extra decimals are still matched."""
+        from analysis.technicals import _find_chain_contract
+        option_map = {"2025-10-17:5": {"95.00": [{"delta": 0.5}]}}
+        assert _find_chain_contract(option_map, "2025-10-17", 95) == {"delta": 0.5}
+
+    def test_missing_expiry(self):
+        """An expiration not in the chain returns None."""
+        from analysis.technicals import _find_chain_contract
+        assert _find_chain_contract({"2025-10-17:5": {}}, "2025-10-24", 95) is None
+
+
+class TestExpiryToIso:
+    """Test YYMMDD contract expiry conversion."""
+
+    def test_converts_to_chain_date(self):
+        """YYMMDD contract expiries convert to chain expiration dates."""
+        from analysis.technicals import _expiry_to_iso
+        assert _expiry_to_iso("251017") == "2025-10-17"
+
+    def test_invalid_date_raises(self):
+        """Out-of-range months are rejected like strptime would."""
+        from analysis.technicals import _expiry_to_iso
+        with pytest.raises(ValueError):
+            _expiry_to_iso("251317")
+
+
+class TestIsCall:
+    """Test put/call classification."""
+
+    @pytest.mark.parametrize("put_call,expected", [
+        ("CALL", True), ("Call", True), ("C", True), ("c", True),
+        ("PUT", False), ("Put", False), ("P", False),
+    ])
+    def test_classification(self, put_call, expected):
+        """Both API ('CALL'/'PUT') and simulator ('C'/'P') spellings are recognized."""
+        from analysis.technicals import _is_call
+        assert _is_call(put_call) is expected
+
+
+class TestSignalSummaries:
+    """Test signal count summaries."""
+
+    def test_counts_signals_and_skips_errors(self):
+        """Signals are counted across positions; entries without a list are ignored."""
+        from analysis.technicals import _summarize_stock_signals
+        technicals = {
+            "AAPL": {"signals": ("NEUTRAL",)},
+            "MSFT": {"signals": ["NEUTRAL", "HIGH VOLUME (2x+ avg)"]},
+            "BAD": {"error": "Insufficient price history for technical analysis"},
+        }
+        assert _summarize_stock_signals(technicals) == {"NEUTRAL": 2, "HIGH VOLUME (2x+ avg)": 1}
+
+
+class TestTechnicalsForSymbols:
+    """Test batched per-symbol technicals."""
+
+    def test_batch_keeps_order_and_isolates_failures(self, monkeypatch):
+        """Results follow input order and one failing symbol does not abort the batch."""
+        import analysis.technicals as technicals
+        original = technicals._get_stock_technicals_for_symbol
+
+        def flaky(symbol, analyzer, client):
+            if symbol == "BAD":
+                raise RuntimeError("boom")
+            return original(symbol, analyzer, client)
+
+        monkeypatch.setattr(technicals, "_get_stock_technicals_for_symbol", flaky)
+        results = technicals.get_technicals_for_symbols(["MSFT", "BAD", "AAPL  251017P00150000"])
+
+        assert list(results) == ["MSFT", "BAD", "AAPL  251017P00150000"]
+        assert results["MSFT"]["type"] == "stock"
+        assert results["BAD"] == {"error": "boom"}
+        assert results["AAPL  251017P00150000"]["type"] == "option"
+
+    def test_symbols_run_on_calling_thread(self, monkeypatch):
+        """Stock and option records are built inline, without a worker pool."""
+        import threading
+        import analysis.technicals as technicals
+        original_stock = technicals._get_stock_technicals_for_symbol
+        original_option = technicals._get_option_technicals_for_symbol
+        threads = set()
+
+        def record(original):
+            def wrapper(symbol, analyzer, client):
+                threads.add(threading.get_ident())
+                return original(symbol, analyzer, client)
+            return wrapper
+
+        monkeypatch.setattr(technicals, "_get_stock_technicals_for_symbol", record(original_stock))
+        monkeypatch.setattr(technicals, "_get_option_technicals_for_symbol", record(original_option))
+        technicals.get_technicals_for_symbols(["MSFT", "AAPL  251017P00150000", "AAPL"])
+
+        assert threads == {threading.get_ident()}
@@ -1,14 +1,76 @@
 """Small utilities for IO operations in v2 sandbox."""
 import json
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson  # Optional: faster JSON parsing and serialization
+except ImportError:
+    orjson = None
 
-def safe_write_json(path: Path, obj: Any, indent: int = 2) -> None:
+if orjson is not None:
+    # Match json.dumps(default=str): datetimes and dataclasses go through str()
+    # rather than orjson's native encoders, and non-string keys are allowed.
+    _ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps_json(obj: Any, indent: int | None = 2) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed.
+
+    Values JSON cannot represent (Decimal, datetime, ...) are written with
+    ``str()``. orjson only supports two-space indentation, so any other
+    indent falls back to the standard library encoder.
+    """
+    if orjson is not None and indent in (None, 2):
+        option = _ORJSON_OPTIONS | orjson.OPT_INDENT_2 if indent else _ORJSON_OPTIONS
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=indent, default=str).encode("utf-8")
+
+
+def safe_write_json(path: Path, obj: Any, indent: int | None = 2) -> None:
     """Atomically write JSON to path."""
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(obj, f, indent=indent, default=str)
+    with open(tmp, "wb") as f:
+        f.write(dumps_json(obj, indent=indent))
         f.flush()
     tmp.replace(path)
+
+
+def loads_json(data) -> Any:
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response) -> Any:
+    """Decode an HTTP response body, using orjson when it is installed.
+
+    Falls back to ``response.json()`` when orjson is missing or the response
+    does not expose its raw body as bytes.
+    """
+    if orjson is not None:
+        content = getattr(response, "content", None)
+        if isinstance(content, (bytes, bytearray, memoryview, str)):
+            return orjson.loads(content)
+    return response.json()
+
+
+def response_json_decimal(response) -> Any:
+    """Decode an HTTP response body with JSON floats parsed as exact Decimals.
+
+    Always uses the stdlib parser, since orjson has no Decimal hook and would
+    hand back binary floats. Falls back to ``response.json()`` when the
+    response does not expose its body as text.
+    """
+    text = getattr(response, "text", None)
+    if isinstance(text, str):
+        return json.loads(text, parse_float=Decimal)
+    return response.json()